@@ -0,0 +1,173 @@
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Iterable
+
+logger = logging.getLogger(__name__)
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LRUCache:
+    """
+    Small least-recently-used cache, which stores
+    at most ``maxsize`` entries and additionally counts
+    its hits and misses.
+    A ``maxsize`` of 0 turns off the cache completely.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        assert maxsize >= 0, "The cache size can not be negative"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        # Queries can be planned from multiple threads (e.g. in the server)
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the entry stored under the given key
+        (and mark it as recently used) or the default,
+        if there is no such entry.
+        """
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        """
+        Store the value under the given key,
+        evicting the least recently used entries if needed.
+        """
+        if self.maxsize == 0:
+            return
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                evicted_key, _ = self._entries.popitem(last=False)
+                logger.debug(f"Evicting {evicted_key} from the cache")
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the current hit and miss counters and the size of the cache"""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ResultCache:
+    """
+    Least-recently-used cache for query results, which is bounded
+    by the (approximate) memory size of all stored results in bytes.
+    Every entry remembers the tables it was computed from,
+    so that it can be invalidated when one of these tables changes.
+    A ``maxsize`` of 0 turns off the cache completely.
+    Results may be added from other threads (once they are computed),
+    so the entries are only changed with a lock held.
+    """
+
+    def __init__(self, maxsize: int = 0):
+        assert maxsize >= 0, "The cache size can not be negative"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the entry stored under the given key
+        (and mark it as recently used) or the default,
+        if there is no such entry.
+        """
+        with self._lock:
+            try:
+                value, _, _ = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any, nbytes: int, tables: Iterable[Hashable]):
+        """
+        Store the value (which needs nbytes of memory) under the given key,
+        evicting the least recently used entries if needed.
+        The value depends on the given tables.
+        Values larger than the full cache are not stored.
+        """
+        if nbytes > self.maxsize:
+            logger.debug(f"Not caching {key}, as it is too large ({nbytes} bytes)")
+            return
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, nbytes, frozenset(tables))
+            self._size += nbytes
+
+            while self._size > self.maxsize:
+                evicted_key = next(iter(self._entries))
+                logger.debug(f"Evicting {evicted_key} from the cache")
+                self._remove(evicted_key)
+
+    def invalidate(self, table: Hashable = None):
+        """
+        Remove all entries, which depend on the given table
+        (or all entries, if no table is given).
+        """
+        with self._lock:
+            for key, (_, _, tables) in list(self._entries.items()):
+                if table is None or table in tables:
+                    self._remove(key)
+
+    def clear(self):
+        """Remove all entries and reset the counters"""
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Return the current hit and miss counters and the size of the cache
+        (both in bytes)
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, self._size)
+
+    def _remove(self, key: Hashable):
+        # Only called with the lock held
+        try:
+            _, nbytes, _ = self._entries.pop(key)
+        except KeyError:
+            return
+
+        self._size -= nbytes
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
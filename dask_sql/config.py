@@ -0,0 +1,30 @@
+"""
+Default values of the dask-sql options.
+All options are stored in the ``sql`` namespace of the dask configuration,
+so they can be changed globally with :func:`dask.config.set`,
+in the dask configuration files or per query
+(via the ``config_options`` parameter of :func:`dask_sql.Context.sql`).
+"""
+import dask
+
+defaults = {
+    "sql": {
+        "optimizer": {
+            # Reorder joins based on the table statistics and a
+            # dask-specific cost model (the size of the shuffled data)
+            "reorder_joins": False,
+        },
+        "join": {
+            # Broadcast the small side of a join to every partition of the other
+            # side instead of shuffling both sides: None decides automatically
+            # (from the table statistics and the number of partitions),
+            # True always broadcasts the smaller side (if possible), False never does.
+            # Can also be requested per join with a /*+ BROADCAST(table) */ hint.
+            "broadcast": None,
+            # The largest (estimated) number of rows, which is broadcast automatically
+            "broadcast_threshold": 100000,
+        },
+    },
+}
+
+dask.config.update_defaults(defaults)
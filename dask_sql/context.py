@@ -1,34 +1,47 @@
 import asyncio
 import inspect
 import logging
+import threading
+import time
 import warnings
 from collections import namedtuple
 from typing import Any, Callable, Dict, List, Tuple, Union
 
+import dask
 import dask.dataframe as dd
 import pandas as pd
 from dask.base import optimize
 from dask.distributed import Client
 
-from dask_sql import input_utils
-from dask_sql.datacontainer import DataContainer, FunctionDescription, SchemaContainer
+from dask_sql import hooks, input_utils
+from dask_sql import java as java_classes
+from dask_sql.cache import LRUCache, ResultCache
+from dask_sql.datacontainer import (
+    DataContainer,
+    FunctionDescription,
+    SchemaContainer,
+    Statistics,
+)
 from dask_sql.input_utils import InputType, InputUtil
 from dask_sql.integrations.ipython import ipython_integration
-from dask_sql.java import (
-    DaskAggregateFunction,
-    DaskScalarFunction,
-    DaskSchema,
-    DaskTable,
-    RelationalAlgebraGenerator,
-    RelationalAlgebraGeneratorBuilder,
-    SqlParseException,
-    ValidationException,
-    get_java_class,
-)
+from dask_sql.java import get_java_class, java, org
 from dask_sql.mappings import python_to_sql_type
 from dask_sql.physical.rel import RelConverter, custom, logical
+from dask_sql.physical.rel.custom.explain_analyze import analyze_rel
+from dask_sql.physical.rel.plan import (
+    RelInfo,
+    get_plan_info,
+    get_plan_rels,
+    is_deterministic,
+)
+from dask_sql.physical.rel.pushdown import get_filters, get_required_columns
 from dask_sql.physical.rex import RexConverter, core
-from dask_sql.utils import ParsingException
+from dask_sql.prepared_statement import PreparedStatement
+from dask_sql.utils import (
+    ParsingException,
+    deterministic_temporary_columns,
+    split_named_parameters,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -66,9 +79,16 @@ class Context:
 
     DEFAULT_SCHEMA_NAME = "root"
 
-    def __init__(self):
+    def __init__(self, plan_cache_size: int = 100, result_cache_size: int = 0):
         """
         Create a new context.
+
+        Args:
+            plan_cache_size (:obj:`int`): How many parsed and optimized queries
+                to keep for re-use. Set to 0 to turn off the plan cache.
+            result_cache_size (:obj:`int`): How many bytes of (persisted) query results
+                to keep for re-use. A query is only answered from the cache, if its optimized plan
+                and the tables it uses did not change. Defaults to 0, which turns off the result cache.
         """
         # Name of the root schema
         self.schema_name = self.DEFAULT_SCHEMA_NAME
@@ -76,6 +96,39 @@ class Context:
         self.schema = {self.schema_name: SchemaContainer(self.schema_name)}
         # A started SQL server (useful for jupyter notebooks)
         self.sql_server = None
+        # Already parsed and optimized queries
+        self.plan_cache = LRUCache(maxsize=plan_cache_size)
+        # Already computed query results
+        self.result_cache = ResultCache(maxsize=result_cache_size)
+        # Last version number handed out to a schema
+        self._schema_version = 0
+        # The long-lived relational algebra generator and its java schemas.
+        # Created on first usage and updated incrementally afterwards.
+        self._generator = None
+        self._java_schemas = {}
+        # The generator keeps state during parsing, so only
+        # a single query can be parsed at the same time.
+        # The schemas (and their versions) are changed under
+        # the same lock, so that no query is planned
+        # against a half-updated catalog.
+        self._generator_lock = threading.RLock()
+        # Needed columns and filters of every table scan
+        # in the query currently converted
+        self._required_columns = {}
+        self._filters = {}
+        # Already converted expressions (see RexConverter.memoize)
+        self._rex_cache = None
+        # Already converted sub-plans of the query currently converted
+        self._rel_cache = None
+        # Class names, row types etc. of all rels in the query currently converted,
+        # exported from java in a single call (see get_plan_info)
+        self._plan_info = {}
+        # The java rels of the query currently converted by their id and
+        # the ids by the (python) identity of these rels (see BaseRelPlugin.get_rel_id)
+        self._plan_rels = {}
+        self._rel_ids = {}
+        # Result and conversion time of every converted rel (see EXPLAIN ANALYZE)
+        self._rel_profile = None
 
         # Register any default plugins, if nothing was registered before.
         RelConverter.add_plugin_class(logical.LogicalAggregatePlugin, replace=False)
@@ -90,6 +143,9 @@ class Context:
         RelConverter.add_plugin_class(logical.SamplePlugin, replace=False)
         RelConverter.add_plugin_class(custom.AnalyzeTablePlugin, replace=False)
         RelConverter.add_plugin_class(custom.CreateExperimentPlugin, replace=False)
+        RelConverter.add_plugin_class(
+            custom.CreateMaterializedViewPlugin, replace=False
+        )
         RelConverter.add_plugin_class(custom.CreateModelPlugin, replace=False)
         RelConverter.add_plugin_class(custom.CreateSchemaPlugin, replace=False)
         RelConverter.add_plugin_class(custom.CreateTableAsPlugin, replace=False)
@@ -97,8 +153,12 @@ class Context:
         RelConverter.add_plugin_class(custom.DropModelPlugin, replace=False)
         RelConverter.add_plugin_class(custom.DropSchemaPlugin, replace=False)
         RelConverter.add_plugin_class(custom.DropTablePlugin, replace=False)
+        RelConverter.add_plugin_class(custom.ExplainAnalyzePlugin, replace=False)
         RelConverter.add_plugin_class(custom.ExportModelPlugin, replace=False)
         RelConverter.add_plugin_class(custom.PredictModelPlugin, replace=False)
+        RelConverter.add_plugin_class(
+            custom.RefreshMaterializedViewPlugin, replace=False
+        )
         RelConverter.add_plugin_class(custom.ShowColumnsPlugin, replace=False)
         RelConverter.add_plugin_class(custom.ShowModelParamsPlugin, replace=False)
         RelConverter.add_plugin_class(custom.ShowModelsPlugin, replace=False)
@@ -124,7 +184,9 @@ class Context:
         input_table: InputType,
         format: str = None,
         persist: bool = True,
+        lazy: bool = False,
         schema_name: str = None,
+        statistics: Statistics = None,
         **kwargs,
     ):
         """
@@ -185,6 +247,16 @@ class Context:
                 If set to "memory", load the data from a published dataset in the dask cluster.
             persist (:obj:`bool`): Only used when passing a string into the ``input`` parameter.
                 Set to false to turn off loading the file data directly into memory.
+            lazy (:obj:`bool`): Only used when passing a string or a hive connection into the ``input`` parameter.
+                Only read in the columns and their types now (e.g. from the parquet metadata
+                or a sample of a csv file) and read in the data on every query
+                - with only the columns and rows (for parquet) the query needs.
+                A lazy table is never persisted.
+            statistics (:class:`dask_sql.datacontainer.Statistics`): Known statistics of the table
+                (row count, distinct counts and null fractions per column), which help
+                to find a better plan for queries.
+                If not given, the row count of pandas dataframes is used.
+                See also ``ANALYZE TABLE``.
             **kwargs: Additional arguments for specific formats. See :ref:`data_input` for more information.
 
         """
@@ -199,9 +271,15 @@ class Context:
             table_name=table_name,
             format=format,
             persist=persist,
+            lazy=lazy,
             **kwargs,
         )
-        self.schema[schema_name].tables[table_name.lower()] = dc
+
+        if statistics is None and isinstance(input_table, pd.DataFrame):
+            statistics = Statistics(row_count=len(input_table))
+        dc.statistics = statistics
+
+        self._set_table(schema_name, table_name.lower(), dc)
 
     def register_dask_table(self, df: dd.DataFrame, name: str, *args, **kwargs):
         """
@@ -223,7 +301,15 @@ class Context:
 
         """
         schema_name = schema_name or self.schema_name
-        del self.schema[schema_name].tables[table_name]
+        with self._generator_lock:
+            del self.schema[schema_name].tables[table_name]
+            del self.schema[schema_name].table_versions[table_name]
+            self.schema[schema_name].materialized_views.pop(table_name, None)
+            self._increase_schema_version(schema_name)
+            self.result_cache.invalidate((schema_name, table_name))
+
+            if self._generator is not None:
+                self._java_schemas[schema_name].removeTable(table_name)
 
     def drop_schema(self, schema_name: str):
         """
@@ -237,10 +323,18 @@ class Context:
         if schema_name == self.DEFAULT_SCHEMA_NAME:
             raise RuntimeError(f"Default Schema `{schema_name}` cannot be deleted")
 
-        del self.schema[schema_name]
+        with self._generator_lock:
+            for table_name in self.schema[schema_name].tables:
+                self.result_cache.invalidate((schema_name, table_name))
+            del self.schema[schema_name]
+
+            if self.schema_name == schema_name:
+                self.schema_name = self.DEFAULT_SCHEMA_NAME
 
-        if self.schema_name == schema_name:
-            self.schema_name = self.DEFAULT_SCHEMA_NAME
+            # Calcite does not allow to remove a schema again,
+            # so the generator needs to be re-created on the next query
+            self._generator = None
+            self._java_schemas = {}
 
     def register_function(
         self,
@@ -381,6 +475,7 @@ class Context:
         sql: str,
         return_futures: bool = True,
         dataframes: Dict[str, Union[dd.DataFrame, pd.DataFrame]] = None,
+        config_options: Dict[str, Any] = None,
     ) -> Union[dd.DataFrame, pd.DataFrame]:
         """
         Query the registered tables with the given SQL.
@@ -406,41 +501,78 @@ class Context:
                 Defaults to returning the dask dataframe.
             dataframes (:obj:`Dict[str, dask.dataframe.DataFrame]`): additional Dask or pandas dataframes
                 to register before executing this query
+            config_options (:obj:`Dict[str,Any]`): Specific configuration options to pass during
+                query execution, e.g. ``{"sql.optimizer.reorder_joins": True}``.
+                See ``dask_sql/config.py`` for all options.
 
         Returns:
             :obj:`dask.dataframe.DataFrame`: the created data frame of this query.
 
         """
-        if dataframes is not None:
-            for df_name, df in dataframes.items():
-                self.create_table(df_name, df)
+        start = time.perf_counter()
 
-        rel, select_names, _ = self._get_ral(sql)
+        with dask.config.set(config_options or {}):
+            if dataframes is not None:
+                for df_name, df in dataframes.items():
+                    self.create_table(df_name, df)
 
-        dc = RelConverter.convert(rel, context=self)
+            rel, select_names, rel_string = self._get_ral(sql)
 
-        if dc is None:
-            return
-
-        if select_names:
-            # Rename any columns named EXPR$* to a more human readable name
-            cc = dc.column_container
-            cc = cc.rename(
-                {
-                    df_col: select_name
-                    for df_col, select_name in zip(cc.columns, select_names)
-                }
-            )
-            dc = DataContainer(dc.df, cc)
+            if self.result_cache.maxsize > 0:
+                df = self._compute_cached_table_from_rel(
+                    rel, select_names, rel_string, return_futures
+                )
+            else:
+                df = self._compute_table_from_rel(rel, select_names, return_futures)
 
-        df = dc.assign()
-        if not return_futures:
-            df = df.compute()
+        if hooks.registered_hooks:
+            hooks.call_hooks("sql", None, sql, time.perf_counter() - start, df)
 
         return df
 
+    def prepare(self, sql: str) -> PreparedStatement:
+        """
+        Parse, validate and optimize the given query only once,
+        so that it can be executed many times with different parameters.
+        This is useful when the same query is issued over and over again
+        with only some literals changing.
+        The query can either contain positional (``?``) or named (``:name``)
+        parameters in all places, where a literal is allowed.
+
+        Example:
+            In this example, a query is prepared once
+            and executed for two different values.
+
+            .. code-block:: python
+
+                statement = c.prepare("SELECT * FROM my_table WHERE id = :id")
+
+                result = statement.execute(id=123)
+                other_result = statement.execute(id=456)
+
+        Args:
+            sql (:obj:`str`): The query string to prepare
+
+        Returns:
+            :obj:`dask_sql.prepared_statement.PreparedStatement`: the prepared query,
+            which can be executed with ``execute()``.
+
+        """
+        sql, parameter_names = split_named_parameters(sql)
+
+        if None in parameter_names and any(parameter_names):
+            raise ValueError(
+                "Positional (?) and named (:name) parameters can not be mixed"
+            )
+
+        return PreparedStatement(self, sql, parameter_names)
+
     def explain(
-        self, sql: str, dataframes: Dict[str, Union[dd.DataFrame, pd.DataFrame]] = None
+        self,
+        sql: str,
+        dataframes: Dict[str, Union[dd.DataFrame, pd.DataFrame]] = None,
+        config_options: Dict[str, Any] = None,
+        analyze: bool = False,
     ) -> str:
         """
         Return the stringified relational algebra that this query will produce
@@ -451,21 +583,34 @@ class Context:
         If the query is of DDL type (e.g. CREATE TABLE or DESCRIBE SCHEMA),
         no relational algebra plan is created and therefore nothing returned.
 
+        With ``analyze``, the query is executed and every step of the
+        relational algebra is annotated with the number of rows, partitions
+        and bytes it produced and the time spent in it
+        (same as ``EXPLAIN ANALYZE <query>``).
+
         Args:
             sql (:obj:`str`): The query string to use
             dataframes (:obj:`Dict[str, dask.dataframe.DataFrame]`): additional Dask or pandas dataframes
                 to register before executing this query
+            config_options (:obj:`Dict[str,Any]`): Specific configuration options to pass during
+                planning, e.g. ``{"sql.optimizer.reorder_joins": True}``.
+            analyze (:obj:`bool`): Execute the query and show the
+                measured rows, partitions, bytes and timings of every step.
 
         Returns:
             :obj:`str`: a description of the created relational algebra.
 
         """
-        if dataframes is not None:
-            for df_name, df in dataframes.items():
-                self.create_table(df_name, df)
+        with dask.config.set(config_options or {}):
+            if dataframes is not None:
+                for df_name, df in dataframes.items():
+                    self.create_table(df_name, df)
 
-        _, _, rel_string = self._get_ral(sql)
-        return rel_string
+            rel, select_names, rel_string = self._get_ral(sql)
+            if analyze and rel_string:
+                return analyze_rel(rel, select_names, self).to_string(index=False)
+
+            return rel_string
 
     def visualize(self, sql: str, filename="mydask.png") -> None:  # pragma: no cover
         """Visualize the computation of the given SQL into the png"""
@@ -481,7 +626,14 @@ class Context:
         Args:
             schema_name (:obj:`str`): The name of the schema to create
         """
-        self.schema[schema_name] = SchemaContainer(schema_name)
+        with self._generator_lock:
+            self.schema[schema_name] = SchemaContainer(schema_name)
+            self._increase_schema_version(schema_name)
+
+            if self._generator is not None:
+                java_schema = java_classes.DaskSchema(schema_name)
+                self._java_schemas[schema_name] = java_schema
+                self._generator.addSchema(java_schema)
 
     def register_experiment(
         self,
@@ -639,49 +791,96 @@ class Context:
         schema_list = []
 
         for schema_name, schema in self.schema.items():
-            java_schema = DaskSchema(schema_name)
+            java_schema = java_classes.DaskSchema(schema_name)
 
             if not schema.tables:
                 logger.warning("No tables are registered.")
 
             for name, dc in schema.tables.items():
-                table = DaskTable(name)
-                df = dc.df
-                logger.debug(
-                    f"Adding table '{name}' to schema with columns: {list(df.columns)}"
-                )
-                for column in df.columns:
-                    data_type = df[column].dtype
-                    sql_data_type = python_to_sql_type(data_type)
-
-                    table.addColumn(column, sql_data_type)
-
-                java_schema.addTable(table)
+                java_schema.addTable(self._prepare_table(name, dc))
 
             if not schema.functions:
                 logger.debug("No custom functions defined.")
 
             for function_description in schema.function_lists:
-                name = function_description.name
-                sql_return_type = python_to_sql_type(function_description.return_type)
-                if function_description.aggregation:
-                    logger.debug(f"Adding function '{name}' to schema as aggregation.")
-                    dask_function = DaskAggregateFunction(name, sql_return_type)
-                else:
-                    logger.debug(
-                        f"Adding function '{name}' to schema as scalar function."
-                    )
-                    dask_function = DaskScalarFunction(name, sql_return_type)
+                java_schema.addFunction(self._prepare_function(function_description))
 
-                dask_function = self._add_parameters_from_description(
-                    function_description, dask_function
+            schema_list.append(java_schema)
+
+        return schema_list
+
+    @staticmethod
+    def _prepare_table(name: str, dc: DataContainer):
+        """Create a java table with the columns and types of the given container"""
+        table = java_classes.DaskTable(name)
+        # Lazily registered tables are not read in just for their types
+        df = dc.meta
+        logger.debug(
+            f"Adding table '{name}' to schema with columns: {list(df.columns)}"
+        )
+        for column in df.columns:
+            data_type = df[column].dtype
+            sql_data_type = python_to_sql_type(data_type)
+
+            table.addColumn(column, sql_data_type)
+
+        statistics = dc.statistics
+        if statistics is not None:
+            logger.debug(f"Adding statistics to table '{name}': {statistics}")
+            if statistics.row_count is not None:
+                table.setRowCount(float(statistics.row_count))
+
+            for column in df.columns:
+                distinct_count = statistics.distinct_counts.get(column)
+                null_fraction = statistics.null_fractions.get(column)
+                if distinct_count is None and null_fraction is None:
+                    continue
+
+                table.setColumnStatistics(
+                    column,
+                    None
+                    if distinct_count is None
+                    else java.lang.Double(distinct_count),
+                    None if null_fraction is None else java.lang.Double(null_fraction),
                 )
 
-                java_schema.addFunction(dask_function)
+        return table
 
-            schema_list.append(java_schema)
+    @staticmethod
+    def _prepare_function(function_description: FunctionDescription):
+        """Create a java scalar or aggregation function out of its description"""
+        name = function_description.name
+        sql_return_type = python_to_sql_type(function_description.return_type)
+        if function_description.aggregation:
+            logger.debug(f"Adding function '{name}' to schema as aggregation.")
+            dask_function = java_classes.DaskAggregateFunction(name, sql_return_type)
+        else:
+            logger.debug(f"Adding function '{name}' to schema as scalar function.")
+            dask_function = java_classes.DaskScalarFunction(name, sql_return_type)
 
-        return schema_list
+        return Context._add_parameters_from_description(
+            function_description, dask_function
+        )
+
+    def _get_generator(self):
+        """
+        Return the relational algebra generator.
+        It is created (together with all java schemas) on first usage
+        and kept up to date incrementally by the functions changing the schemas,
+        so that the costs per query do not grow with the number of tables.
+        """
+        if self._generator is None:
+            generator_builder = java_classes.RelationalAlgebraGeneratorBuilder(
+                self.schema_name
+            )
+            self._java_schemas = {}
+            for java_schema in self._prepare_schemas():
+                self._java_schemas[str(java_schema.getName())] = java_schema
+                generator_builder.addSchema(java_schema)
+            self._generator = generator_builder.build()
+
+        self._generator.setDefaultSchema(self.schema_name)
+        return self._generator
 
     @staticmethod
     def _add_parameters_from_description(function_description, dask_function):
@@ -693,45 +892,103 @@ class Context:
 
         return dask_function
 
-    def _get_ral(self, sql):
-        """Helper function to turn the sql query into a relational algebra and resulting column names"""
-        # get the schema of what we currently have registered
-        schemas = self._prepare_schemas()
+    def _set_table(self, schema_name: str, table_name: str, dc: DataContainer):
+        """Store (or replace) the table and tell calcite about it"""
+        with self._generator_lock:
+            self.schema[schema_name].tables[table_name] = dc
+            self._increase_schema_version(schema_name)
+            self.schema[schema_name].table_versions[table_name] = self._schema_version
+            self.result_cache.invalidate((schema_name, table_name))
 
-        # Now create a relational algebra from that
-        generator_builder = RelationalAlgebraGeneratorBuilder(self.schema_name)
-        for schema in schemas:
-            generator_builder.addSchema(schema)
-        generator = generator_builder.build()
-        default_dialect = generator.getDialect()
+            if self._generator is not None:
+                java_table = self._prepare_table(table_name, dc)
+                self._java_schemas[schema_name].addTable(java_table)
 
-        logger.debug(f"Using dialect: {get_java_class(default_dialect)}")
+    def _increase_schema_version(self, schema_name: str):
+        """
+        Mark the schema as changed by handing out a new version number.
+        As the version is part of the plan cache key, this invalidates
+        all cached plans created before the change.
+        The version numbers are unique over all schemas, so that a
+        dropped and re-created schema does not re-use old plans.
+        """
+        self._schema_version += 1
+        self.schema[schema_name].version = self._schema_version
 
-        try:
-            sqlNode = generator.getSqlNode(sql)
-            sqlNodeClass = get_java_class(sqlNode)
+    def _get_plan_cache_key(self, sql: str) -> Tuple:
+        """
+        The cache key of a query consists of the (normalized)
+        SQL string, the current default schema,
+        the versions of all known schemas and the optimizer options.
+        """
+        schema_versions = tuple(
+            (schema_name, schema.version) for schema_name, schema in self.schema.items()
+        )
+        optimizer_options = (dask.config.get("sql.optimizer.reorder_joins"),)
+        return sql.strip(), self.schema_name, schema_versions, optimizer_options
 
-            select_names = None
-            rel = sqlNode
-            rel_string = ""
-
-            if not sqlNodeClass.startswith("com.dask.sql.parser."):
-                validatedSqlNode = generator.getValidatedNode(sqlNode)
-                nonOptimizedRelNode = generator.getRelationalAlgebra(validatedSqlNode)
-                # Optimization might remove some alias projects. Make sure to keep them here.
-                select_names = [
-                    str(name)
-                    for name in nonOptimizedRelNode.getRowType().getFieldNames()
-                ]
-                rel = generator.getOptimizedRelationalAlgebra(nonOptimizedRelNode)
-                rel_string = str(generator.getRelationalAlgebraString(rel))
-        except (ValidationException, SqlParseException) as e:
-            logger.debug(f"Original exception raised by Java:\n {e}")
-            # We do not want to re-raise an exception here
-            # as this would print the full java stack trace
-            # if debug is not set.
-            # Instead, we raise a nice exception
-            raise ParsingException(sql, str(e.message())) from None
+    def _get_ral(self, sql):
+        """
+        Helper function to turn the sql query into a relational algebra and resulting column names.
+        Re-uses an already created relational algebra from the plan cache if possible.
+        """
+        cache_key = self._get_plan_cache_key(sql)
+
+        ral = self.plan_cache.get(cache_key)
+        if ral is not None:
+            logger.debug("Re-using the relational algebra from the plan cache")
+            return ral
+
+        with self._generator_lock:
+            # The schemas might have changed while waiting for the lock,
+            # so the plan is stored under the key of the schemas it was created from
+            cache_key = self._get_plan_cache_key(sql)
+            ral = self._create_ral(sql)
+            self.plan_cache.put(cache_key, ral)
+        return ral
+
+    def _create_ral(self, sql):
+        """Parse, validate and optimize the sql query with Apache Calcite"""
+        # The generator is shared between all queries
+        with self._generator_lock:
+            generator = self._get_generator()
+            default_dialect = generator.getDialect()
+
+            logger.debug(f"Using dialect: {get_java_class(default_dialect)}")
+
+            try:
+                sqlNode = generator.getSqlNode(sql)
+                sqlNodeClass = get_java_class(sqlNode)
+
+                select_names = None
+                rel = sqlNode
+                rel_string = ""
+
+                if not sqlNodeClass.startswith("com.dask.sql.parser."):
+                    validatedSqlNode = generator.getValidatedNode(sqlNode)
+                    nonOptimizedRelNode = generator.getRelationalAlgebra(
+                        validatedSqlNode
+                    )
+                    # Optimization might remove some alias projects. Make sure to keep them here.
+                    select_names = [
+                        str(name)
+                        for name in nonOptimizedRelNode.getRowType().getFieldNames()
+                    ]
+                    rel = generator.getOptimizedRelationalAlgebra(
+                        nonOptimizedRelNode,
+                        bool(dask.config.get("sql.optimizer.reorder_joins")),
+                    )
+                    rel_string = str(generator.getRelationalAlgebraString(rel))
+            except (
+                java_classes.ValidationException,
+                java_classes.SqlParseException,
+            ) as e:
+                logger.debug(f"Original exception raised by Java:\n {e}")
+                # We do not want to re-raise an exception here
+                # as this would print the full java stack trace
+                # if debug is not set.
+                # Instead, we raise a nice exception
+                raise ParsingException(sql, str(e.message())) from None
 
         # Internal, temporary results of calcite are sometimes
         # named EXPR$N (with N a number), which is not very helpful
@@ -759,9 +1016,157 @@ class Context:
         logger.debug(f"Extracted relational algebra:\n {rel_string}")
         return rel, select_names, rel_string
 
+    def _compute_table_from_rel(
+        self, rel, select_names, return_futures=True, plan_info=None
+    ):
+        """
+        Turn the (optimized) relational algebra into a dask dataframe.
+        The plan info of the rel is exported again, if it is not given.
+        """
+        # Conversions can be nested (e.g. in CREATE TABLE AS),
+        # so we need to restore the previous state afterwards
+        previous_state = (
+            self._required_columns,
+            self._filters,
+            self._rel_cache,
+            self._plan_info,
+            self._plan_rels,
+            self._rel_ids,
+        )
+        self._required_columns = get_required_columns(rel)
+        self._filters = get_filters(rel)
+        self._rel_cache = {}
+        self._plan_info = plan_info if plan_info is not None else get_plan_info(rel)
+        self._plan_rels = get_plan_rels(rel, self._plan_info)
+        self._rel_ids = {
+            id(plan_rel): rel_id for rel_id, plan_rel in self._plan_rels.items()
+        }
+        # The exported root (whose id is already known) instead of the given rel
+        root_rel = next(iter(self._plan_rels.values()), rel)
+        try:
+            with deterministic_temporary_columns():
+                dc = RelConverter.convert(root_rel, context=self)
+        finally:
+            (
+                self._required_columns,
+                self._filters,
+                self._rel_cache,
+                self._plan_info,
+                self._plan_rels,
+                self._rel_ids,
+            ) = previous_state
+
+        if dc is None:
+            return
+
+        if select_names:
+            # Rename any columns named EXPR$* to a more human readable name
+            cc = dc.column_container
+            cc = cc.rename(
+                {
+                    df_col: select_name
+                    for df_col, select_name in zip(cc.columns, select_names)
+                }
+            )
+            dc = DataContainer(dc.df, cc)
+
+        df = dc.assign()
+        if not return_futures:
+            df = df.compute()
+
+        return df
+
+    def _compute_cached_table_from_rel(
+        self, rel, select_names, rel_string, return_futures=True
+    ):
+        """
+        Same as :func:`_compute_table_from_rel`, but re-use the (persisted) result
+        of the same plan on the same tables, if it was already computed.
+
+        A new result is only stored, once it is computed anyway:
+        if the result is requested directly or if it can be persisted
+        in the background on a distributed cluster. Otherwise the query
+        stays lazy and is not cached.
+        """
+        plan_info = get_plan_info(rel)
+        tables = self._get_result_cache_tables(rel, plan_info)
+        if tables is None:
+            return self._compute_table_from_rel(
+                rel, select_names, return_futures, plan_info
+            )
+
+        cache_key = (rel_string, tuple(select_names or []), self._get_versions(tables))
+
+        df = self.result_cache.get(cache_key)
+        if df is not None:
+            logger.debug("Re-using the cached result of the query")
+            return df if return_futures else df.compute()
+
+        df = self._compute_table_from_rel(rel, select_names, plan_info=plan_info)
+        if not return_futures:
+            df = df.persist()
+            nbytes = int(df.memory_usage(deep=True, index=True).sum().compute())
+            self.result_cache.put(cache_key, df, nbytes, tables)
+            return df.compute()
+
+        try:
+            client = Client.current()
+        except ValueError:
+            # Without a cluster, persisting would compute the result right now
+            return df
+
+        df = client.persist(df)
+        nbytes_future = client.compute(df.memory_usage(deep=True, index=True).sum())
+
+        def add_to_cache(future):
+            # The tables might have changed in the meantime
+            if (
+                future.status == "finished"
+                and self._get_versions(tables) == cache_key[2]
+            ):
+                self.result_cache.put(cache_key, df, int(future.result()), tables)
+
+        nbytes_future.add_done_callback(add_to_cache)
+        return df
+
+    def _get_versions(self, tables: List[Tuple[str, str]]) -> Tuple:
+        """The current version of all given tables (schema and table names)"""
+        return tuple(
+            (
+                schema_name,
+                table_name,
+                self.schema[schema_name].table_versions.get(table_name),
+            )
+            for schema_name, table_name in tables
+        )
+
+    def _get_result_cache_tables(
+        self, rel, plan_info: Dict[int, RelInfo] = None
+    ) -> Union[List[Tuple[str, str]], None]:
+        """
+        Return the (sorted) schema and table names used in the relational algebra
+        or None, if the result of the query can not be cached
+        (because it is not a query or it contains non-deterministic functions).
+        The plan info of the rel is exported again, if it is not given.
+        """
+        if not isinstance(rel, org.apache.calcite.rel.RelNode):
+            return None
+
+        if plan_info is None:
+            plan_info = get_plan_info(rel)
+        if not is_deterministic(int(rel.getId()), plan_info):
+            return None
+
+        tables = set()
+        for table in org.apache.calcite.plan.RelOptUtil.findAllTables(rel):
+            schema_name, table_name = [str(n) for n in table.getQualifiedName()]
+            tables.add((schema_name, table_name.lower()))
+
+        return sorted(tables)
+
     def _to_sql_string(self, s: "org.apache.calcite.sql.SqlNode", default_dialect=None):
         if default_dialect is None:
-            default_dialect = RelationalAlgebraGenerator.getDialect()
+            default_dialect = java_classes.RelationalAlgebraGenerator.getDialect()
 
         try:
             return str(s.toSqlString(default_dialect))
@@ -799,27 +1204,42 @@ class Context:
     ):
         """Helper function to do the function or aggregation registration"""
         schema_name = schema_name or self.schema_name
-        schema = self.schema[schema_name]
-
-        lower_name = name.lower()
-        if lower_name in schema.functions:
-            if replace:
-                schema.function_lists = list(
-                    filter(
-                        lambda f: f.name.lower() != lower_name, schema.function_lists,
+        with self._generator_lock:
+            schema = self.schema[schema_name]
+
+            lower_name = name.lower()
+            if lower_name in schema.functions:
+                if replace:
+                    schema.function_lists = list(
+                        filter(
+                            lambda f: f.name.lower() != lower_name,
+                            schema.function_lists,
+                        )
                     )
-                )
-                del schema.functions[lower_name]
+                    del schema.functions[lower_name]
 
-            elif schema.functions[lower_name] != f:
-                raise ValueError(
-                    "Registering different functions with the same name is not allowed"
-                )
+                elif schema.functions[lower_name] != f:
+                    raise ValueError(
+                        "Registering different functions with the same name is not allowed"
+                    )
 
-        schema.function_lists.append(
-            FunctionDescription(name.upper(), parameters, return_type, aggregation)
-        )
-        schema.function_lists.append(
-            FunctionDescription(name.lower(), parameters, return_type, aggregation)
-        )
-        schema.functions[lower_name] = f
+            function_descriptions = [
+                FunctionDescription(name.upper(), parameters, return_type, aggregation),
+                FunctionDescription(name.lower(), parameters, return_type, aggregation),
+            ]
+            schema.function_lists.extend(function_descriptions)
+            schema.functions[lower_name] = f
+            self._increase_schema_version(schema_name)
+            # We do not know which results depend on the function
+            self.result_cache.invalidate()
+
+            if self._generator is not None:
+                java_schema = self._java_schemas[schema_name]
+                if replace:
+                    java_schema.removeFunction(name.upper())
+                    java_schema.removeFunction(name.lower())
+
+                for function_description in function_descriptions:
+                    java_schema.addFunction(
+                        self._prepare_function(function_description)
+                    )
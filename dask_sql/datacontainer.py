@@ -10,6 +10,12 @@ FunctionDescription = namedtuple(
     "FunctionDescription", ["name", "parameters", "return_type", "aggregation"]
 )
 
+# The (backend) column, by which the rows of a dataframe are range-partitioned,
+# and the boundaries of the partitions (with the same meaning as dask's divisions):
+# all non-NULL values of the column in partition i are between divisions[i]
+# and divisions[i + 1] (exclusive, except for the last partition).
+Partitioning = namedtuple("Partitioning", ["column", "divisions"])
+
 
 class ColumnContainer:
     # Forward declaration
@@ -146,6 +152,42 @@ class ColumnContainer:
         )
 
 
+class Statistics:
+    """
+    Statistics of a table, which are handed over to Apache Calcite
+    to help choosing a good plan (e.g. the order of joins).
+    All numbers are estimates and ``None`` stands for "unknown".
+    The per-column statistics are stored by (frontend) column name.
+    """
+
+    def __init__(
+        self,
+        row_count: float = None,
+        distinct_counts: Dict[str, float] = None,
+        null_fractions: Dict[str, float] = None,
+    ):
+        self.row_count = row_count
+        self.distinct_counts = distinct_counts or {}
+        self.null_fractions = null_fractions or {}
+
+    def update(self, other: "Statistics") -> "Statistics":
+        """Return new statistics, with all known values of other overriding the ones in here"""
+        return Statistics(
+            row_count=other.row_count
+            if other.row_count is not None
+            else self.row_count,
+            distinct_counts={**self.distinct_counts, **other.distinct_counts},
+            null_fractions={**self.null_fractions, **other.null_fractions},
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"Statistics(row_count={self.row_count}, "
+            f"distinct_counts={self.distinct_counts}, "
+            f"null_fractions={self.null_fractions})"
+        )
+
+
 class DataContainer:
     """
     In SQL, every column operation or reference is done via
@@ -161,9 +203,64 @@ class DataContainer:
     and "backend" (what dask has).
     """
 
-    def __init__(self, df: dd.DataFrame, column_container: ColumnContainer):
+    def __init__(
+        self,
+        df: dd.DataFrame,
+        column_container: ColumnContainer,
+        statistics: Statistics = None,
+        source: "dask_sql.input_utils.TableSource" = None,
+        partitioning: Partitioning = None,
+    ):
         self.df = df
         self.column_container = column_container
+        # Only set for registered tables, if statistics are known
+        self.statistics = statistics
+        # Only set for registered tables, which can be read in again
+        # with only a subset of their columns
+        self.source = source
+        # Only set if the data is known to be range-partitioned by a column,
+        # e.g. after sorting or if the table was registered with it as index
+        self.partitioning = partitioning
+
+    @property
+    def df(self) -> dd.DataFrame:
+        if self._df is None:
+            # The table was registered lazily and is now needed completely
+            self._df = self.source.read()
+
+        return self._df
+
+    @df.setter
+    def df(self, df: dd.DataFrame):
+        self._df = df
+
+    @property
+    def meta(self) -> pd.DataFrame:
+        """
+        The (empty) pandas dataframe with the columns and types of the data,
+        which - in contrast to ``df`` - does not need to read in
+        lazily registered tables.
+        """
+        if self._df is None:
+            return self.source.meta
+
+        return self._df._meta
+
+    def get_divisions(self, column: str) -> Union[Tuple, None]:
+        """
+        Return the divisions of the data by the given (backend) column
+        or None, if it is not known to be partitioned by this column.
+        """
+        if self.partitioning is None or self.partitioning.column != column:
+            return None
+
+        divisions = tuple(self.partitioning.divisions)
+        # Some operations (e.g. a LIMIT) keep the partitioning information,
+        # but collect the rows into a different number of partitions
+        if self._df is None or len(divisions) != self._df.npartitions + 1:
+            return None
+
+        return divisions
 
     def assign(self) -> dd.DataFrame:
         """
@@ -184,7 +281,13 @@ class DataContainer:
 class SchemaContainer:
     def __init__(self, name: str):
         self.__name__ = name
+        # Increased on every change of the tables or functions
+        self.version = 0
         self.tables: Dict[str, DataContainer] = {}
+        # The schema version of the last change of every table
+        self.table_versions: Dict[str, int] = {}
+        # Queries (and refresh state) of the materialized views
+        self.materialized_views: Dict[str, "MaterializedView"] = {}
         self.experiments: Dict[str, pd.DataFrame] = {}
         self.models: Dict[str, Tuple[Any, List[str]]] = {}
         self.functions: Dict[str, Callable] = {}
@@ -0,0 +1,83 @@
+import logging
+from collections import namedtuple
+from contextlib import contextmanager
+from typing import Any, Callable, List
+
+import dask
+from dask.highlevelgraph import HighLevelGraph
+
+from dask_sql.datacontainer import DataContainer
+
+logger = logging.getLogger(__name__)
+
+# Passed to every hook after each conversion or query:
+# where it comes from ("rel", "rex" or "sql"), the name of the plugin
+# (None for queries), the digest of the converted RelNode or RexNode
+# (the query string for queries), the duration in seconds
+# (including the conversion of all inputs) and - if the result
+# is a dask collection - its number of partitions and graph layers.
+HookEvent = namedtuple(
+    "HookEvent",
+    ["kind", "plugin_name", "digest", "duration", "npartitions", "graph_layers"],
+)
+
+# All currently installed hooks. The converters only measure anything
+# if this list is not empty.
+registered_hooks: List[Callable[[HookEvent], Any]] = []
+
+
+def add_hook(hook: Callable[[HookEvent], Any]):
+    """
+    Install a function, which is called with a :class:`HookEvent`
+    after every conversion of a RelNode or RexNode and after every
+    call to :func:`dask_sql.Context.sql`.
+    Hooks are global (for all contexts) and called in the order
+    they were added. Exceptions raised in a hook are not caught.
+    """
+    registered_hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[HookEvent], Any]):
+    """Uninstall a previously added hook"""
+    registered_hooks.remove(hook)
+
+
+@contextmanager
+def use_hook(hook: Callable[[HookEvent], Any]):
+    """
+    Install the given hook only within this context.
+
+    Example:
+        In this example, the duration of every REL conversion is printed.
+
+        .. code-block:: python
+
+            def print_duration(event):
+                if event.kind == "rel":
+                    print(event.plugin_name, event.duration)
+
+            with use_hook(print_duration):
+                c.sql("SELECT * FROM df")
+    """
+    add_hook(hook)
+    try:
+        yield
+    finally:
+        remove_hook(hook)
+
+
+def call_hooks(kind: str, plugin_name: str, digest: str, duration: float, result: Any):
+    """Call all installed hooks with the description of the result"""
+    if isinstance(result, DataContainer):
+        result = result.df
+
+    npartitions = None
+    graph_layers = None
+    if dask.is_dask_collection(result):
+        npartitions = getattr(result, "npartitions", None)
+        graph = result.__dask_graph__()
+        graph_layers = len(graph.layers) if isinstance(graph, HighLevelGraph) else 1
+
+    event = HookEvent(kind, plugin_name, digest, duration, npartitions, graph_layers)
+    for registered_hook in list(registered_hooks):
+        registered_hook(event)
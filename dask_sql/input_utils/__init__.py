@@ -4,6 +4,7 @@ from .hive import HiveInputPlugin
 from .intake import IntakeCatalogInputPlugin
 from .location import LocationInputPlugin
 from .pandaslike import PandasLikeInputPlugin
+from .source import TableSource
 from .sqlalchemy import SqlalchemyHiveInputPlugin
 
 __all__ = [
@@ -15,4 +16,5 @@ __all__ = [
     LocationInputPlugin,
     PandasLikeInputPlugin,
     SqlalchemyHiveInputPlugin,
+    TableSource,
 ]
@@ -8,4 +8,9 @@ class BaseInputPlugin:
         raise NotImplementedError
 
     def to_dc(self, input_item: Any, table_name: str, format: str = None, **kwargs):
+        """
+        Return the dask dataframe of the input
+        or a :class:`TableSource`, if the data can be read in again
+        with only a subset of the columns.
+        """
         raise NotImplementedError
@@ -4,8 +4,9 @@ from typing import Union
 import dask.dataframe as dd
 import pandas as pd
 
-from dask_sql.datacontainer import ColumnContainer, DataContainer
+from dask_sql.datacontainer import ColumnContainer, DataContainer, Partitioning
 from dask_sql.input_utils.base import BaseInputPlugin
+from dask_sql.input_utils.source import TableSource
 from dask_sql.utils import Pluggable
 
 logger = logging.Logger(__name__)
@@ -41,26 +42,77 @@ class InputUtil(Pluggable):
         table_name: str,
         format: str = None,
         persist: bool = True,
+        lazy: bool = False,
         **kwargs,
     ) -> DataContainer:
         """
         Turn possible input descriptions or formats (e.g. dask dataframes, pandas dataframes,
         locations as string, hive tables) into the loaded data containers,
         maybe persist them to cluster memory before.
+        If lazy is set, only the columns and types are read in now
+        (if the input supports it) and the data is read in
+        on every query.
         """
         filled_get_dask_dataframe = lambda *args: cls._get_dask_dataframe(
             *args, table_name=table_name, format=format, **kwargs,
         )
 
+        source = None
         if isinstance(input_item, list):
-            table = dd.concat([filled_get_dask_dataframe(item) for item in input_item])
+            table = dd.concat(
+                [
+                    cls._read_source(filled_get_dask_dataframe(item))
+                    for item in input_item
+                ]
+            )
         else:
             table = filled_get_dask_dataframe(input_item)
+            if isinstance(table, TableSource):
+                source = table
+                if lazy and source.meta is None:
+                    # Only the meta data is really read in here,
+                    # e.g. the parquet metadata or a sample of a CSV file
+                    source.meta = source.read()._meta
+
+                if source.meta is not None and (lazy or not persist):
+                    # We know everything about the table without reading it,
+                    # so we only read it when it is really needed
+                    return DataContainer(
+                        None, ColumnContainer(source.meta.columns), source=source
+                    )
+
+                table = cls._read_source(source)
 
         if persist:
             table = table.persist()
+            # The data is already in memory, there is no need to read it again
+            source = None
+
+        return DataContainer(
+            table.copy(),
+            ColumnContainer(table.columns),
+            source=source,
+            partitioning=cls._get_partitioning(table),
+        )
+
+    @staticmethod
+    def _get_partitioning(table: dd.DataFrame) -> Union[Partitioning, None]:
+        """
+        If the table is indexed by one of its columns
+        (e.g. after ``df.set_index("id", drop=False)``) and the divisions of
+        the index are known, the table is partitioned by this column.
+        """
+        if table.known_divisions and table.index.name in table.columns:
+            return Partitioning(table.index.name, table.divisions)
+
+        return None
+
+    @staticmethod
+    def _read_source(table: Union[dd.DataFrame, TableSource]) -> dd.DataFrame:
+        if isinstance(table, TableSource):
+            return table.read()
 
-        return DataContainer(table.copy(), ColumnContainer(table.columns))
+        return table
 
     @classmethod
     def _get_dask_dataframe(
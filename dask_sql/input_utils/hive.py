@@ -1,10 +1,14 @@
 import ast
 import logging
 import os
+from datetime import datetime
 from functools import partial
-from typing import Any, Union
+from typing import Any, Dict, List, Tuple, Union
+from urllib.parse import unquote
 
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
 
 try:
     from pyhive import hive
@@ -17,6 +21,7 @@ except ImportError:  # pragma: no cover
     sqlalchemy = None
 
 from dask_sql.input_utils.base import BaseInputPlugin
+from dask_sql.input_utils.source import TableSource
 from dask_sql.mappings import cast_column_type, sql_to_python_type
 
 logger = logging.Logger(__name__)
@@ -127,52 +132,204 @@ class HiveInputPlugin(BaseInputPlugin):
 
             return df
 
+        is_parquet = (
+            format == "ParquetInputFormat" or format == "MapredParquetInputFormat"
+        )
+
         if partition_information:
+            # Only the list of partitions is fetched now. The (costly)
+            # description and data of each partition are only read in
+            # for the partitions a query really needs.
             partition_list = self._parse_hive_partition_description(
                 input_item, schema, table_name
             )
-            logger.debug(f"Reading in partitions from {partition_list}")
+            logger.debug(f"Found partitions {partition_list}")
 
-            tables = []
-            for partition in partition_list:
-                parsed = self._parse_hive_table_description(
-                    input_item, schema, table_name, partition=partition
-                )
-                (
-                    partition_column_information,
-                    partition_table_information,
-                    _,
-                    _,
-                ) = parsed
-
-                location = partition_table_information["Location"]
-                table = wrapped_read_function(
-                    location, partition_column_information, **kwargs
+            def read_partitions(columns=None, filters=None, **kwargs):
+                partition_filters, data_filters = self._split_filters(
+                    filters, partition_information
                 )
+                selected_partitions = [
+                    partition
+                    for partition in partition_list
+                    if self._partition_matches(partition, partition_filters)
+                ]
+                logger.debug(f"Reading in partitions from {selected_partitions}")
+
+                if data_filters and is_parquet:
+                    kwargs["filters"] = data_filters
+
+                tables = []
+                for partition in selected_partitions:
+                    parsed = self._parse_hive_table_description(
+                        input_item, schema, table_name, partition=partition
+                    )
+                    (
+                        partition_column_information,
+                        partition_table_information,
+                        _,
+                        _,
+                    ) = parsed
+
+                    if columns is not None and is_parquet:
+                        # At least a single column is needed to get the number of rows
+                        first_column = next(iter(partition_column_information))
+                        partition_column_information = {
+                            col: col_type
+                            for col, col_type in partition_column_information.items()
+                            if col in columns or col == first_column
+                        }
+
+                    location = partition_table_information["Location"]
+                    table = wrapped_read_function(
+                        location, partition_column_information, **kwargs
+                    )
+
+                    # Now add the additional partition columns
+                    partition_values = ast.literal_eval(
+                        partition_table_information["Partition Value"]
+                    )
+
+                    logger.debug(
+                        f"Applying additional partition information as columns: {partition_information}"
+                    )
+
+                    partition_id = 0
+                    for partition_key, partition_type in partition_information.items():
+                        table[partition_key] = partition_values[partition_id]
+                        table = cast_column_type(table, partition_key, partition_type)
+
+                        partition_id += 1
+
+                    tables.append(table)
+
+                if not tables:
+                    return dd.from_pandas(meta, npartitions=1)
+
+                return dd.concat(tables)
+
+            meta = pd.DataFrame(
+                {
+                    col: pd.Series([], dtype=col_type)
+                    for col, col_type in column_information.items()
+                }
+            )
+            for partition_key, partition_type in partition_information.items():
+                meta[partition_key] = pd.Series([], dtype=object)
+                meta = cast_column_type(meta, partition_key, partition_type)
+
+            return TableSource(
+                read_partitions, supports_filters=True, meta=meta, **kwargs
+            )
+
+        location = table_information["Location"]
 
-                # Now add the additional partition columns
-                partition_values = ast.literal_eval(
-                    partition_table_information["Partition Value"]
+        if is_parquet and "columns" not in kwargs:
+            # Parquet tables can be read in again later
+            # with only the columns and row groups a query really needs
+            def read_columns(columns=None, **kwargs):
+                read_column_information = column_information
+                if columns is not None:
+                    read_column_information = {
+                        col: col_type
+                        for col, col_type in column_information.items()
+                        if col in columns
+                    }
+                return wrapped_read_function(
+                    location, read_column_information, **kwargs
                 )
 
-                logger.debug(
-                    f"Applying additional partition information as columns: {partition_information}"
+            return TableSource(read_columns, supports_filters=True, **kwargs)
+
+        df = wrapped_read_function(location, column_information, **kwargs)
+        return df
+
+    @staticmethod
+    def _split_filters(
+        filters: List, partition_information: Dict[str, str]
+    ) -> Tuple[List[Tuple[str, str, Any]], List]:
+        """
+        Split the given filters into the ones on partition columns
+        and the ones on the data
+        """
+        if not filters:
+            return [], filters
+
+        if isinstance(filters[0], list):
+            # Filters combined with OR are not used for partition pruning
+            return [], filters
+
+        partition_filters = [f for f in filters if f[0] in partition_information]
+        data_filters = [f for f in filters if f[0] not in partition_information]
+        return partition_filters, data_filters
+
+    @staticmethod
+    def _partition_matches(
+        partition: str, partition_filters: List[Tuple[str, str, Any]]
+    ) -> bool:
+        """
+        Check if the partition (given in the form of SHOW PARTITIONS,
+        e.g. "dt=2021-01-01/hour=4") can contain rows matching the given filters.
+        """
+        partition_values = dict(
+            part.split("=", 1) for part in partition.split("/") if "=" in part
+        )
+
+        for column, operator, value in partition_filters:
+            try:
+                partition_value = HiveInputPlugin._to_filter_type(
+                    unquote(partition_values[column]), value
                 )
+            except (KeyError, ValueError):  # pragma: no cover
+                # We do not know, so we better read in the partition
+                continue
 
-                partition_id = 0
-                for partition_key, partition_type in partition_information.items():
-                    table[partition_key] = partition_values[partition_id]
-                    table = cast_column_type(table, partition_key, partition_type)
+            if partition_value is None:
+                # NULL never fulfills any of the conditions
+                return False
+
+            if operator == "in":
+                matches = any(partition_value == v for v in value)
+            elif operator in ("==", "="):
+                matches = partition_value == value
+            elif operator == "!=":
+                matches = partition_value != value
+            elif operator == "<":
+                matches = partition_value < value
+            elif operator == "<=":
+                matches = partition_value <= value
+            elif operator == ">":
+                matches = partition_value > value
+            elif operator == ">=":
+                matches = partition_value >= value
+            else:  # pragma: no cover
+                matches = True
 
-                    partition_id += 1
+            if not matches:
+                return False
 
-                tables.append(table)
+        return True
 
-            return dd.concat(tables)
+    @staticmethod
+    def _to_filter_type(partition_value: str, value: Any) -> Any:
+        """Convert the partition value (a string) into the type of the filter value"""
+        if partition_value == "__HIVE_DEFAULT_PARTITION__":
+            return None
 
-        location = table_information["Location"]
-        df = wrapped_read_function(location, column_information, **kwargs)
-        return df
+        if isinstance(value, (list, tuple)):
+            value = value[0]
+
+        if isinstance(value, (bool, np.bool_)):
+            return partition_value.lower() == "true"
+        if isinstance(value, (int, float, np.number)):
+            return float(partition_value)
+        if isinstance(value, datetime):
+            timestamp = pd.Timestamp(partition_value)
+            if value.tzinfo is not None and timestamp.tzinfo is None:
+                timestamp = timestamp.tz_localize(value.tzinfo)
+            return timestamp
+
+        return partition_value
 
     def _parse_hive_table_description(
         self,
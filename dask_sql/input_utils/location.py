@@ -5,6 +5,7 @@ import dask.dataframe as dd
 from distributed.client import default_client
 
 from dask_sql.input_utils.base import BaseInputPlugin
+from dask_sql.input_utils.source import TableSource
 
 
 class LocationInputPlugin(BaseInputPlugin):
@@ -31,4 +32,12 @@ class LocationInputPlugin(BaseInputPlugin):
         except AttributeError:
             raise AttributeError(f"Can not read files of format {format}")
 
-        return read_function(input_item, **kwargs)
+        # Parquet and orc can be read in again later with only the
+        # columns (and for parquet also row groups) a query really needs
+        return TableSource(
+            read_function,
+            input_item,
+            supports_columns=(format in ("parquet", "orc")),
+            supports_filters=(format == "parquet"),
+            **kwargs,
+        )
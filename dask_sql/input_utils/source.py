@@ -0,0 +1,70 @@
+from typing import Any, Callable, List, Tuple
+
+import dask.dataframe as dd
+import pandas as pd
+
+
+class TableSource:
+    """
+    Remembers how a table was read in (e.g. from a parquet file),
+    so that it can be read again later, e.g. with only the columns
+    a query really needs.
+
+    Input plugins can return an instance of this class
+    instead of the dask dataframe.
+    Set ``supports_columns``, if the read function understands the
+    ``columns`` argument and ``supports_filters``, if it understands the
+    ``filters`` argument of :func:`dask.dataframe.read_parquet`.
+    If the columns and types of the table are already known
+    without reading it, they can be given as (empty) ``meta`` dataframe.
+    The table is then only read in once a query needs it.
+    """
+
+    def __init__(
+        self,
+        read_function: Callable[..., dd.DataFrame],
+        *args,
+        supports_columns: bool = True,
+        supports_filters: bool = False,
+        meta: pd.DataFrame = None,
+        **kwargs,
+    ):
+        self.read_function = read_function
+        self.supports_columns = supports_columns
+        self.supports_filters = supports_filters
+        self.meta = meta
+        self.args = args
+        self.kwargs = kwargs
+
+    def read(
+        self, columns: List[str] = None, filters: List[Tuple[str, str, Any]] = None
+    ) -> dd.DataFrame:
+        """
+        Read in the table.
+        If columns are given, only read in those.
+        If filters are given, they are combined (with AND)
+        with any filters already given when creating the source.
+        """
+        kwargs = self.kwargs.copy()
+        if columns is not None:
+            assert self.supports_columns, "The source does not understand columns"
+            kwargs["columns"] = columns
+
+        if filters:
+            assert self.supports_filters, "The source does not understand filters"
+            kwargs["filters"] = self._combine_filters(kwargs.get("filters"), filters)
+
+        return self.read_function(*self.args, **kwargs)
+
+    @staticmethod
+    def _combine_filters(
+        original_filters: List, filters: List[Tuple[str, str, Any]]
+    ) -> List:
+        if not original_filters:
+            return filters
+
+        # A list of lists means the inner lists are combined with OR
+        if isinstance(original_filters[0], list):
+            return [list(conjunction) + filters for conjunction in original_filters]
+
+        return list(original_filters) + filters
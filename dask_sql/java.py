@@ -4,14 +4,18 @@ This file summarizes all java accessm dask_sql needs.
 The jpype package is used to access Java classes from python.
 It needs to know the java class path, which is set
 to the jar file in the package resources.
+
+The java virtual machine is only started on the first access
+to a java package or class, so that importing dask_sql
+(e.g. only for some helper functions) stays cheap.
 """
 import logging
 import os
 import platform
+import threading
 import warnings
 
 import jpype
-import pkg_resources
 
 logger = logging.getLogger(__name__)
 
@@ -42,60 +46,124 @@ def _set_or_check_java_home():
         )
 
 
-try:  # pragma: no cover
-    # If using dask-sql together with hdfs input
-    # (e.g. via dask), we have two concurring components
-    # accessing the Java VM: the hdfs FS implementation
-    # and dask-sql. hdfs needs to have the hadoop libraries
-    # in the classpath and has a nice helper function for that
-    # Unfortunately, this classpath will not be picked up if
-    # set after the JVM is already running. So we need to make
-    # sure we call it in all circumstances before starting the
-    # JVM.
-    from pyarrow.hdfs import _maybe_set_hadoop_classpath
-
-    _maybe_set_hadoop_classpath()
-except:  # pragma: no cover
-    pass
-
-# Define how to run the java virtual machine.
-jpype.addClassPath(pkg_resources.resource_filename("dask_sql", "jar/DaskSQL.jar"))
-
-_set_or_check_java_home()
-jvmpath = jpype.getDefaultJVMPath()
-
-# There seems to be a bug on Windows server for java >= 11 installed via conda
-# It uses a wrong java class path, which can be easily recognizes
-# by the \\bin\\bin part. We fix this here.
-jvmpath = jvmpath.replace("\\bin\\bin\\server\\jvm.dll", "\\bin\\server\\jvm.dll")
-
-logger.debug(f"Starting JVM from path {jvmpath}...")
-jpype.startJVM(
-    "-ea",
-    "--illegal-access=deny",
-    ignoreUnrecognized=True,
-    convertStrings=False,
-    jvmpath=jvmpath,
-)
-logger.debug("...having started JVM")
-
-
-# Some Java classes we need
-com = jpype.JPackage("com")
-org = jpype.JPackage("org")
-java = jpype.JPackage("java")
-
-DaskTable = com.dask.sql.schema.DaskTable
-DaskAggregateFunction = com.dask.sql.schema.DaskAggregateFunction
-DaskScalarFunction = com.dask.sql.schema.DaskScalarFunction
-DaskSchema = com.dask.sql.schema.DaskSchema
-RelationalAlgebraGenerator = com.dask.sql.application.RelationalAlgebraGenerator
-RelationalAlgebraGeneratorBuilder = (
-    com.dask.sql.application.RelationalAlgebraGeneratorBuilder
-)
-SqlTypeName = org.apache.calcite.sql.type.SqlTypeName
-ValidationException = org.apache.calcite.tools.ValidationException
-SqlParseException = org.apache.calcite.sql.parser.SqlParseException
+def _start_jvm():
+    """Start the java virtual machine - if not already done"""
+    global _jvm_started
+
+    with _jvm_lock:
+        if _jvm_started:
+            return
+
+        try:  # pragma: no cover
+            # If using dask-sql together with hdfs input
+            # (e.g. via dask), we have two concurring components
+            # accessing the Java VM: the hdfs FS implementation
+            # and dask-sql. hdfs needs to have the hadoop libraries
+            # in the classpath and has a nice helper function for that
+            # Unfortunately, this classpath will not be picked up if
+            # set after the JVM is already running. So we need to make
+            # sure we call it in all circumstances before starting the
+            # JVM.
+            from pyarrow.hdfs import _maybe_set_hadoop_classpath
+
+            _maybe_set_hadoop_classpath()
+        except:  # pragma: no cover
+            pass
+
+        # Only needed here and slow to import
+        import pkg_resources
+
+        # Define how to run the java virtual machine.
+        jpype.addClassPath(
+            pkg_resources.resource_filename("dask_sql", "jar/DaskSQL.jar")
+        )
+
+        _set_or_check_java_home()
+        jvmpath = jpype.getDefaultJVMPath()
+
+        # There seems to be a bug on Windows server for java >= 11 installed via conda
+        # It uses a wrong java class path, which can be easily recognizes
+        # by the \\bin\\bin part. We fix this here.
+        jvmpath = jvmpath.replace(
+            "\\bin\\bin\\server\\jvm.dll", "\\bin\\server\\jvm.dll"
+        )
+
+        logger.debug(f"Starting JVM from path {jvmpath}...")
+        jpype.startJVM(
+            "-ea",
+            "--illegal-access=deny",
+            ignoreUnrecognized=True,
+            convertStrings=False,
+            jvmpath=jvmpath,
+        )
+        logger.debug("...having started JVM")
+
+        _jvm_started = True
+
+
+_jvm_started = False
+_jvm_lock = threading.Lock()
+
+
+class _LazyJavaPackage:
+    """
+    Stand-in for a java package (e.g. ``org``), which
+    starts the java virtual machine on the first access
+    to one of its members.
+    """
+
+    def __init__(self, name: str):
+        self._name = name
+        self._package = None
+
+    def __getattr__(self, attribute: str):
+        # Do not start the JVM for python internals (e.g. copy or pickle)
+        if attribute.startswith("__"):
+            raise AttributeError(attribute)
+
+        if self._package is None:
+            _start_jvm()
+            self._package = jpype.JPackage(self._name)
+
+        return getattr(self._package, attribute)
+
+    def __repr__(self):
+        return f"<lazy java package {self._name}>"
+
+
+# Some Java packages and classes we need
+com = _LazyJavaPackage("com")
+org = _LazyJavaPackage("org")
+java = _LazyJavaPackage("java")
+
+_JAVA_CLASSES = {
+    "DaskTable": "com.dask.sql.schema.DaskTable",
+    "DaskAggregateFunction": "com.dask.sql.schema.DaskAggregateFunction",
+    "DaskScalarFunction": "com.dask.sql.schema.DaskScalarFunction",
+    "DaskSchema": "com.dask.sql.schema.DaskSchema",
+    "RelationalAlgebraGenerator": "com.dask.sql.application.RelationalAlgebraGenerator",
+    "RelationalAlgebraGeneratorBuilder": "com.dask.sql.application.RelationalAlgebraGeneratorBuilder",
+    "SqlTypeName": "org.apache.calcite.sql.type.SqlTypeName",
+    "ValidationException": "org.apache.calcite.tools.ValidationException",
+    "SqlParseException": "org.apache.calcite.sql.parser.SqlParseException",
+}
+
+
+def __getattr__(name: str):
+    """
+    Resolve the java classes listed above on their first usage.
+    Importing them by name (from dask_sql.java import ...)
+    therefore starts the JVM, accessing them via the module does not.
+    """
+    try:
+        class_name = _JAVA_CLASSES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    _start_jvm()
+    java_class = jpype.JClass(class_name)
+    globals()[name] = java_class
+    return java_class
 
 
 def get_java_class(instance):
@@ -1,5 +1,5 @@
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
 import dask.array as da
@@ -7,43 +7,43 @@ import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 
+from dask_sql import java as java_classes
 from dask_sql._compat import FLOAT_NAN_IMPLEMENTED
-from dask_sql.java import SqlTypeName
+from dask_sql.java import java, org
 
 logger = logging.getLogger(__name__)
 
 
 # Default mapping between python types and SQL types
+# (by name, as the java enum is only loaded on first usage)
 _PYTHON_TO_SQL = {
-    np.float64: SqlTypeName.DOUBLE,
-    np.float32: SqlTypeName.FLOAT,
-    np.int64: SqlTypeName.BIGINT,
-    pd.Int64Dtype(): SqlTypeName.BIGINT,
-    np.int32: SqlTypeName.INTEGER,
-    pd.Int32Dtype(): SqlTypeName.INTEGER,
-    np.int16: SqlTypeName.SMALLINT,
-    pd.Int16Dtype(): SqlTypeName.SMALLINT,
-    np.int8: SqlTypeName.TINYINT,
-    pd.Int8Dtype(): SqlTypeName.TINYINT,
-    np.uint64: SqlTypeName.BIGINT,
-    pd.UInt64Dtype(): SqlTypeName.BIGINT,
-    np.uint32: SqlTypeName.INTEGER,
-    pd.UInt32Dtype(): SqlTypeName.INTEGER,
-    np.uint16: SqlTypeName.SMALLINT,
-    pd.UInt16Dtype(): SqlTypeName.SMALLINT,
-    np.uint8: SqlTypeName.TINYINT,
-    pd.UInt8Dtype(): SqlTypeName.TINYINT,
-    np.bool8: SqlTypeName.BOOLEAN,
-    pd.BooleanDtype(): SqlTypeName.BOOLEAN,
-    np.object_: SqlTypeName.VARCHAR,
-    pd.StringDtype(): SqlTypeName.VARCHAR,
-    np.datetime64: SqlTypeName.TIMESTAMP,
+    np.float64: "DOUBLE",
+    np.float32: "FLOAT",
+    np.int64: "BIGINT",
+    pd.Int64Dtype(): "BIGINT",
+    np.int32: "INTEGER",
+    pd.Int32Dtype(): "INTEGER",
+    np.int16: "SMALLINT",
+    pd.Int16Dtype(): "SMALLINT",
+    np.int8: "TINYINT",
+    pd.Int8Dtype(): "TINYINT",
+    np.uint64: "BIGINT",
+    pd.UInt64Dtype(): "BIGINT",
+    np.uint32: "INTEGER",
+    pd.UInt32Dtype(): "INTEGER",
+    np.uint16: "SMALLINT",
+    pd.UInt16Dtype(): "SMALLINT",
+    np.uint8: "TINYINT",
+    pd.UInt8Dtype(): "TINYINT",
+    np.bool8: "BOOLEAN",
+    pd.BooleanDtype(): "BOOLEAN",
+    np.object_: "VARCHAR",
+    pd.StringDtype(): "VARCHAR",
+    np.datetime64: "TIMESTAMP",
 }
 
 if FLOAT_NAN_IMPLEMENTED:  # pragma: no cover
-    _PYTHON_TO_SQL.update(
-        {pd.Float32Dtype(): SqlTypeName.FLOAT, pd.Float64Dtype(): SqlTypeName.FLOAT}
-    )
+    _PYTHON_TO_SQL.update({pd.Float32Dtype(): "FLOAT", pd.Float64Dtype(): "FLOAT"})
 
 # Default mapping between SQL types and python types
 # for values
@@ -90,15 +90,60 @@ def python_to_sql_type(python_type):
         python_type = python_type.type
 
     if pd.api.types.is_datetime64tz_dtype(python_type):
-        return SqlTypeName.TIMESTAMP_WITH_LOCAL_TIME_ZONE
+        return java_classes.SqlTypeName.TIMESTAMP_WITH_LOCAL_TIME_ZONE
 
     try:
-        return _PYTHON_TO_SQL[python_type]
+        sql_type_name = _PYTHON_TO_SQL[python_type]
     except KeyError:  # pragma: no cover
         raise NotImplementedError(
             f"The python type {python_type} is not implemented (yet)"
         )
 
+    return getattr(java_classes.SqlTypeName, sql_type_name)
+
+
+def python_to_sql_value(python_value: Any) -> Any:
+    """
+    Mapping between python values and the java objects
+    calcite uses for literals, e.g. when binding parameters.
+    """
+    if python_value is None:
+        return None
+
+    if isinstance(python_value, np.datetime64):
+        python_value = pd.Timestamp(python_value)
+    elif isinstance(python_value, np.generic):
+        python_value = python_value.item()
+
+    if isinstance(python_value, bool):
+        return java.lang.Boolean(python_value)
+    elif isinstance(python_value, int):
+        return java.lang.Long(python_value)
+    elif isinstance(python_value, float):
+        return java.lang.Double(python_value)
+    elif isinstance(python_value, str):
+        return java.lang.String(python_value)
+    elif isinstance(python_value, datetime):
+        if python_value.tzinfo is not None:
+            python_value = python_value.astimezone(timezone.utc)
+
+        return org.apache.calcite.util.TimestampString(
+            python_value.year,
+            python_value.month,
+            python_value.day,
+            python_value.hour,
+            python_value.minute,
+            python_value.second,
+        ).withNanos(python_value.microsecond * 1000)
+    elif isinstance(python_value, date):
+        return org.apache.calcite.util.DateString(
+            python_value.year, python_value.month, python_value.day
+        )
+
+    raise NotImplementedError(
+        f"The python type {type(python_value)} is not implemented (yet)"
+    )
+
 
 def sql_to_python_value(sql_type: str, literal_value: Any) -> Any:
     """Mapping between SQL and python values (of correct type)."""
@@ -273,7 +318,8 @@ def cast_column_type(
     casted_column = cast_column_to_type(df[column_name], expected_type)
 
     if casted_column is not None:
-        df[column_name] = casted_column
+        # Do not change the given dataframe, which might be used elsewhere
+        df = df.assign(**{column_name: casted_column})
 
     return df
 
@@ -1,10 +1,12 @@
 import logging
-from typing import List
+from typing import List, Union
 
 import dask.dataframe as dd
 
 from dask_sql.datacontainer import ColumnContainer, DataContainer
+from dask_sql.java import org
 from dask_sql.mappings import cast_column_type, sql_to_python_type
+from dask_sql.physical.rel.plan import RelInfo, RowType, to_row_type
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +28,56 @@ class BaseRelPlugin:
         """Base method to implement"""
         raise NotImplementedError
 
+    @staticmethod
+    def get_rel_id(
+        rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> int:
+        """
+        Return the id of the rel - without asking java,
+        if the rel was exported with the plan currently converted (see get_plan_rels).
+        The exported rels are kept alive during the conversion,
+        so their python identity is unique.
+        """
+        if context is not None:
+            rel_id = context._rel_ids.get(id(rel))
+            if rel_id is not None:
+                return rel_id
+
+        return int(rel.getId())
+
+    @staticmethod
+    def get_rel_info(
+        rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> Union[RelInfo, None]:
+        """Return the information exported from java for this rel (if present)"""
+        if context is None or not context._plan_info:
+            return None
+
+        # Custom statements (e.g. CREATE TABLE) are not part of the plan info
+        if not isinstance(rel, org.apache.calcite.rel.RelNode):
+            return None
+
+        return context._plan_info.get(BaseRelPlugin.get_rel_id(rel, context))
+
+    @staticmethod
+    def get_row_type(
+        rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> Union[RowType, "org.apache.calcite.rel.type.RelDataType"]:
+        """
+        Return the row type of the rel - from the already exported
+        information of the plan if possible (see get_plan_info)
+        or otherwise directly from java.
+        """
+        rel_info = BaseRelPlugin.get_rel_info(rel, context)
+        if rel_info is not None:
+            return rel_info.row_type
+
+        return rel.getRowType()
+
     @staticmethod
     def fix_column_to_row_type(
-        cc: ColumnContainer, row_type: "org.apache.calcite.rel.type.RelDataType"
+        cc: ColumnContainer,
+        row_type: Union[RowType, "org.apache.calcite.rel.type.RelDataType"],
     ) -> ColumnContainer:
         """
         Make sure that the given column container
@@ -36,7 +85,7 @@ class BaseRelPlugin:
         We assume that the column order is already correct
         and will just "blindly" rename the columns.
         """
-        field_names = [str(x) for x in row_type.getFieldNames()]
+        field_names = to_row_type(row_type).field_names
 
         cc = cc.rename(columns=dict(zip(cc.columns, field_names)))
 
@@ -45,14 +94,15 @@ class BaseRelPlugin:
 
     @staticmethod
     def check_columns_from_row_type(
-        df: dd.DataFrame, row_type: "org.apache.calcite.rel.type.RelDataType"
+        df: dd.DataFrame,
+        row_type: Union[RowType, "org.apache.calcite.rel.type.RelDataType"],
     ):
         """
         Similar to `self.fix_column_to_row_type`, but this time
         check for the correct column names instead of
         applying them.
         """
-        field_names = [str(x) for x in row_type.getFieldNames()]
+        field_names = to_row_type(row_type).field_names
 
         assert list(df.columns) == field_names
 
@@ -71,7 +121,12 @@ class BaseRelPlugin:
         input tables as expected and returns them already
         converted into a dask dataframe.
         """
-        input_rels = rel.getInputs()
+        rel_info = BaseRelPlugin.get_rel_info(rel, context)
+        if rel_info is not None:
+            # The inputs were already exported together with the plan
+            input_rels = [context._plan_rels[input_id] for input_id in rel_info.inputs]
+        else:
+            input_rels = rel.getInputs()
 
         assert len(input_rels) == n
 
@@ -82,7 +137,8 @@ class BaseRelPlugin:
 
     @staticmethod
     def fix_dtype_to_row_type(
-        dc: DataContainer, row_type: "org.apache.calcite.rel.type.RelDataType"
+        dc: DataContainer,
+        row_type: Union[RowType, "org.apache.calcite.rel.type.RelDataType"],
     ):
         """
         Fix the dtype of the given data container (or: the df within it)
@@ -97,15 +153,26 @@ class BaseRelPlugin:
         df = dc.df
         cc = dc.column_container
 
-        field_types = {
-            int(field.getIndex()): str(field.getType())
-            for field in row_type.getFieldList()
-        }
+        field_types = to_row_type(row_type).field_types
+        partitioning = dc.partitioning
 
-        for index, field_type in field_types.items():
+        for index, field_type in enumerate(field_types):
             expected_type = sql_to_python_type(field_type)
             field_name = cc.get_backend_by_frontend_index(index)
+            if field_name not in df.columns:
+                # Columns which were not read in (because they are not needed)
+                continue
 
+            current_type = df[field_name].dtype
             df = cast_column_type(df, field_name, expected_type)
 
-        return DataContainer(df, dc.column_container)
+            # The divisions refer to the values before the cast,
+            # e.g. "01" and "1" become the same integer
+            if (
+                partitioning is not None
+                and partitioning.column == field_name
+                and df[field_name].dtype != current_type
+            ):
+                partitioning = None
+
+        return DataContainer(df, dc.column_container, partitioning=partitioning)
@@ -1,9 +1,13 @@
 import logging
+import time
+from typing import Hashable, Union
 
 import dask.dataframe as dd
 
+from dask_sql import hooks
 from dask_sql.java import get_java_class
 from dask_sql.physical.rel.base import BaseRelPlugin
+from dask_sql.physical.rel.plan import is_deterministic
 from dask_sql.utils import LoggableDataFrame, Pluggable
 
 logger = logging.getLogger(__name__)
@@ -40,19 +44,111 @@ class RelConverter(Pluggable):
         into a python expression (a dask dataframe)
         using the stored plugins and the dictionary of
         registered dask tables from the context.
+
+        Identical sub-plans of a query (e.g. in self-joins) are
+        only converted once, so that they also end up as the same
+        tasks in the dask graph.
         """
-        class_name = get_java_class(rel)
+        profile = context is not None and context._rel_profile is not None
+        if not profile and not hooks.registered_hooks:
+            return cls._convert(rel, context)
+
+        start = time.perf_counter()
+        dc = cls._convert(rel, context)
+        duration = time.perf_counter() - start
+
+        # Remember the result and the conversion time of every rel
+        # (see EXPLAIN ANALYZE)
+        if profile:
+            context._rel_profile[BaseRelPlugin.get_rel_id(rel, context)] = (
+                dc,
+                duration,
+            )
+
+        if hooks.registered_hooks:
+            plugin_name = cls._get_plugin_instance(rel, context).__class__.__name__
+            hooks.call_hooks("rel", plugin_name, str(rel), duration, dc)
+
+        return dc
+
+    @classmethod
+    def _convert(
+        cls, rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> dd.DataFrame:
+        cache_key = cls._get_cache_key(rel, context)
+        if cache_key is not None and cache_key in context._rel_cache:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Re-using already converted REL {rel}")
+            return context._rel_cache[cache_key]
+
+        plugin_instance = cls._get_plugin_instance(rel, context)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Processing REL {rel} using {plugin_instance.__class__.__name__}..."
+            )
+        df = plugin_instance.convert(rel, context=context)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processed REL {rel} into {LoggableDataFrame(df)}")
+
+        if cache_key is not None:
+            context._rel_cache[cache_key] = df
+
+        return df
+
+    @classmethod
+    def _get_plugin_instance(
+        cls, rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> BaseRelPlugin:
+        """Return the plugin converting the given rel"""
+        rel_info = BaseRelPlugin.get_rel_info(rel, context)
+        class_name = rel_info.class_name if rel_info else get_java_class(rel)
 
         try:
-            plugin_instance = cls.get_plugin(class_name)
+            return cls.get_plugin(class_name)
         except KeyError:  # pragma: no cover
             raise NotImplementedError(
                 f"No conversion for class {class_name} available (yet)."
             )
 
-        logger.debug(
-            f"Processing REL {rel} using {plugin_instance.__class__.__name__}..."
+    @classmethod
+    def _get_cache_key(
+        cls, rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> Union[Hashable, None]:
+        """Return the key to cache the conversion of the rel - or None if not possible"""
+        if context is None or context._rel_cache is None:
+            return None
+
+        rel_info = BaseRelPlugin.get_rel_info(rel, context)
+        if rel_info is None:
+            return None
+
+        # Identical, but non-deterministic sub-plans need to be computed independently
+        rel_id = BaseRelPlugin.get_rel_id(rel, context)
+        if not is_deterministic(rel_id, context._plan_info):
+            return None
+
+        # The table scans of identical sub-plans might still
+        # read different columns and rows (see get_required_columns and get_filters)
+        pushdowns = []
+        rel_ids = [rel_id]
+        while rel_ids:
+            input_id = rel_ids.pop()
+            input_info = context._plan_info[input_id]
+            if (
+                input_info.class_name
+                == "org.apache.calcite.rel.logical.LogicalTableScan"
+            ):
+                required_columns = context._required_columns.get(input_id)
+                if required_columns is not None:
+                    required_columns = tuple(sorted(required_columns))
+                filters = frozenset(context._filters.get(input_id, ()))
+                pushdowns.append((required_columns, filters))
+            rel_ids.extend(input_info.inputs)
+
+        # The sub-plan key (unlike the digest) does not refer to the inputs by their id
+        return (
+            rel_info.subplan_key,
+            tuple(rel_info.row_type.field_types),
+            tuple(pushdowns),
         )
-        df = plugin_instance.convert(rel, context=context)
-        logger.debug(f"Processed REL {rel} into {LoggableDataFrame(df)}")
-        return df
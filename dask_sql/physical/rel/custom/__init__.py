@@ -9,7 +9,12 @@ from .describe_model import ShowModelParamsPlugin
 from .drop_model import DropModelPlugin
 from .drop_schema import DropSchemaPlugin
 from .drop_table import DropTablePlugin
+from .explain_analyze import ExplainAnalyzePlugin
 from .export_model import ExportModelPlugin
+from .materialized_view import (
+    CreateMaterializedViewPlugin,
+    RefreshMaterializedViewPlugin,
+)
 from .predict import PredictModelPlugin
 from .schemas import ShowSchemasPlugin
 from .show_models import ShowModelsPlugin
@@ -19,6 +24,7 @@ from .tables import ShowTablesPlugin
 __all__ = [
     AnalyzeTablePlugin,
     CreateExperimentPlugin,
+    CreateMaterializedViewPlugin,
     CreateModelPlugin,
     CreateSchemaPlugin,
     CreateTableAsPlugin,
@@ -26,8 +32,10 @@ __all__ = [
     DropModelPlugin,
     DropSchemaPlugin,
     DropTablePlugin,
+    ExplainAnalyzePlugin,
     ExportModelPlugin,
     PredictModelPlugin,
+    RefreshMaterializedViewPlugin,
     ShowColumnsPlugin,
     ShowModelParamsPlugin,
     ShowModelsPlugin,
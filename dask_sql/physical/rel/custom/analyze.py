@@ -1,7 +1,10 @@
+from typing import List
+
+import dask
 import dask.dataframe as dd
 import pandas as pd
 
-from dask_sql.datacontainer import ColumnContainer, DataContainer
+from dask_sql.datacontainer import ColumnContainer, DataContainer, Statistics
 from dask_sql.mappings import python_to_sql_type
 from dask_sql.physical.rel.base import BaseRelPlugin
 
@@ -16,10 +19,12 @@ class AnalyzeTablePlugin(BaseRelPlugin):
 
     The result is also a table, although it is created on the fly.
 
-    Please note: even though the syntax is very similar to e.g.
+    Similar to e.g.
     [the spark version](https://spark.apache.org/docs/3.0.0/sql-ref-syntax-aux-analyze-table.html),
-    this call does not help with query optimization (as the spark call would do),
-    as this is currently not implemented in dask-sql.
+    the call additionally computes the row count of the table as well as
+    the (approximate) number of distinct values and the fraction of null values
+    of the analyzed columns and stores them with the table.
+    They are later used to find a better plan for queries using the table.
     """
 
     class_name = "com.dask.sql.parser.SqlAnalyzeTable"
@@ -36,7 +41,7 @@ class AnalyzeTablePlugin(BaseRelPlugin):
 
         # Define some useful shortcuts
         mapping = dc.column_container.get_backend_by_frontend_name
-        df = dc.df
+        df = self._read_columns(dc, [mapping(col) for col in columns])
 
         # Calculate statistics
         statistics = dd.from_pandas(
@@ -58,6 +63,67 @@ class AnalyzeTablePlugin(BaseRelPlugin):
             pd.Series({col: col for col in columns}, name="col_name",)
         )
 
+        self._update_table_statistics(context, schema_name, name, dc, df, columns)
+
         cc = ColumnContainer(statistics.columns)
         dc = DataContainer(statistics, cc)
         return dc
+
+    @staticmethod
+    def _read_columns(dc: DataContainer, columns: List[str]) -> dd.DataFrame:
+        """
+        Return only the given (backend) columns of the table.
+        Lazily registered tables are read in with only these columns.
+        """
+        if dc.source is not None and dc.source.supports_columns:
+            return dc.source.read(columns=columns)
+
+        return dc.df[columns]
+
+    @staticmethod
+    def _update_table_statistics(
+        context: "dask_sql.Context",
+        schema_name: str,
+        name: str,
+        dc: DataContainer,
+        df: dd.DataFrame,
+        columns: List[str],
+    ):
+        """
+        Compute the statistics used for optimization from the given
+        (analyzed) columns of the table and store them with the table
+        """
+        mapping = dc.column_container.get_backend_by_frontend_name
+
+        row_count, distinct_counts, null_counts = dask.compute(
+            df.shape[0],
+            {col: df[mapping(col)].nunique_approx() for col in columns},
+            {col: df[mapping(col)].isna().sum() for col in columns},
+        )
+
+        table_statistics = Statistics(
+            row_count=row_count,
+            distinct_counts={
+                col: min(float(count), row_count)
+                for col, count in distinct_counts.items()
+            },
+            null_fractions={
+                col: float(count) / row_count if row_count else 0.0
+                for col, count in null_counts.items()
+            },
+        )
+        if dc.statistics is not None:
+            table_statistics = dc.statistics.update(table_statistics)
+
+        context._set_table(
+            schema_name,
+            name,
+            DataContainer(
+                # Do not read in lazily registered tables
+                dc._df,
+                dc.column_container,
+                statistics=table_statistics,
+                source=dc.source,
+                partitioning=dc.partitioning,
+            ),
+        )
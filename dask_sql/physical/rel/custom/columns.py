@@ -25,7 +25,7 @@ class ShowColumnsPlugin(BaseRelPlugin):
         dc = context.schema[schema_name].tables[name]
 
         cols = dc.column_container.columns
-        dtypes = list(map(lambda x: str(python_to_sql_type(x)).lower(), dc.df.dtypes))
+        dtypes = list(map(lambda x: str(python_to_sql_type(x)).lower(), dc.meta.dtypes))
         df = pd.DataFrame(
             {
                 "Column": cols,
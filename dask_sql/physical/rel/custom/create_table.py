@@ -56,6 +56,7 @@ class CreateTablePlugin(BaseRelPlugin):
         if format:  # pragma: no cover
             format = format.lower()
         persist = kwargs.pop("persist", False)
+        lazy = kwargs.pop("lazy", False)
 
         try:
             location = kwargs.pop("location")
@@ -67,6 +68,7 @@ class CreateTablePlugin(BaseRelPlugin):
             location,
             format=format,
             persist=persist,
+            lazy=lazy,
             schema_name=schema_name,
             **kwargs,
         )
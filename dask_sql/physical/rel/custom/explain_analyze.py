@@ -0,0 +1,227 @@
+import logging
+import time
+from typing import Dict, Hashable, List, Tuple
+
+import dask
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.base import collections_to_dsk, get_scheduler
+from dask.core import istask
+from dask.delayed import Delayed
+
+from dask_sql.datacontainer import ColumnContainer, DataContainer
+from dask_sql.physical.rel.base import BaseRelPlugin
+from dask_sql.physical.rel.plan import get_plan_info
+
+logger = logging.getLogger(__name__)
+
+
+class _TimedCall:
+    """
+    Wrapper around the function of a task, which measures
+    the wall and CPU time of every call.
+    As the measurements are stored in the given (local) dictionary,
+    this only works for schedulers running in the same process.
+    """
+
+    def __init__(self, func, key: Hashable, timings: Dict[Hashable, Tuple]):
+        self.func = func
+        self.key = key
+        self.timings = timings
+
+    def __call__(self, *args):
+        start_wall = time.perf_counter()
+        start_cpu = time.thread_time()
+        try:
+            return self.func(*args)
+        finally:
+            self.timings[self.key] = (
+                time.perf_counter() - start_wall,
+                time.thread_time() - start_cpu,
+            )
+
+
+def _partition_stats(partition: pd.DataFrame) -> Tuple[int, int]:
+    """Number of rows and (deep) memory usage of a single partition"""
+    return len(partition), int(partition.memory_usage(deep=True, index=True).sum())
+
+
+def _compute_with_timings(
+    delayed_objects: List[Delayed], key_owners: Dict[Hashable, int]
+) -> Tuple[List, Dict[Hashable, Tuple]]:
+    """
+    Compute the given delayed objects (without graph optimizations,
+    so that every task can still be assigned to its rel)
+    and return the results together with the wall and CPU time
+    of every task listed in key_owners.
+    With a distributed client, the timings are taken from its task stream
+    (which does not record the CPU time).
+    """
+    graph = collections_to_dsk(delayed_objects, optimize_graph=False)
+    keys = [delayed_object.key for delayed_object in delayed_objects]
+
+    scheduler = get_scheduler(cls=dd.DataFrame)
+    client = getattr(scheduler, "__self__", None)
+
+    try:
+        from dask.distributed import Client, get_task_stream
+    except ImportError:  # pragma: no cover
+        Client = None
+
+    if Client is not None and isinstance(client, Client):
+        with get_task_stream(client) as task_stream:
+            results = client.get(graph, keys, sync=True)
+
+        owned_keys = {str(key): key for key in key_owners}
+        timings = {}
+        for record in task_stream.data:
+            key = owned_keys.get(str(record["key"]))
+            if key is None:
+                continue
+            wall_time = sum(
+                startstop["stop"] - startstop["start"]
+                for startstop in record["startstops"]
+                if startstop["action"] == "compute"
+            )
+            timings[key] = (wall_time, np.nan)
+
+        return results, timings
+
+    timings = {}
+    dsk = {
+        key: (_TimedCall(task[0], key, timings),) + task[1:]
+        if key in key_owners and istask(task)
+        else task
+        for key, task in dict(graph).items()
+    }
+    results = scheduler(dsk, keys)
+
+    return results, timings
+
+
+def analyze_rel(
+    rel: "org.apache.calcite.rel.RelNode",
+    select_names: List[str],
+    context: "dask_sql.Context",
+) -> pd.DataFrame:
+    """
+    Execute the given relational algebra and return for every rel
+    its number of output rows, partitions and bytes,
+    the wall and CPU time spent in computing its tasks
+    and the time spent in converting it into dask API calls.
+    Every rel is shown with the same indentation as in the output of EXPLAIN.
+    """
+    previous_profile = context._rel_profile
+    context._rel_profile = {}
+    try:
+        context._compute_table_from_rel(rel, select_names)
+        rel_profile = context._rel_profile
+    finally:
+        context._rel_profile = previous_profile
+
+    # The graph layers of a rel are the ones, which are not
+    # already part of the result of any of its inputs
+    # (the inputs are always converted - and stored - before)
+    layer_owners = {}
+    for rel_id, (dc, _) in rel_profile.items():
+        for layer_name in dc.df.dask.layers:
+            layer_owners.setdefault(layer_name, rel_id)
+
+    partition_stats = [
+        dask.delayed(_partition_stats)(partition)
+        for dc, _ in rel_profile.values()
+        for partition in dc.df.to_delayed(optimize_graph=False)
+    ]
+
+    key_owners = {}
+    for dc, _ in rel_profile.values():
+        for layer_name, layer in dc.df.dask.layers.items():
+            for key in layer:
+                key_owners[key] = layer_owners[layer_name]
+
+    results, timings = _compute_with_timings(partition_stats, key_owners)
+
+    stats = {
+        rel_id: {"rows": 0, "bytes": 0, "wall_time": 0.0, "cpu_time": 0.0}
+        for rel_id in rel_profile
+    }
+    results = iter(results)
+    for rel_id, (dc, _) in rel_profile.items():
+        for _ in range(dc.df.npartitions):
+            rows, nbytes = next(results)
+            stats[rel_id]["rows"] += rows
+            stats[rel_id]["bytes"] += nbytes
+
+    for key, (wall_time, cpu_time) in timings.items():
+        rel_stats = stats[key_owners[key]]
+        rel_stats["wall_time"] += wall_time
+        rel_stats["cpu_time"] += cpu_time
+
+    plan_info = get_plan_info(rel)
+
+    rows = []
+    rel_ids = [(int(rel.getId()), 0)]
+    while rel_ids:
+        rel_id, depth = rel_ids.pop()
+        rel_info = plan_info[rel_id]
+        rel_ids.extend((input_id, depth + 1) for input_id in reversed(rel_info.inputs))
+
+        operator = "  " * depth + rel_info.explain
+        dc, conversion_time = rel_profile[rel_id]
+        # The conversion of a rel includes the conversion of its inputs
+        conversion_time -= sum(rel_profile[input_id][1] for input_id in rel_info.inputs)
+
+        rows.append(
+            (
+                operator,
+                stats[rel_id]["rows"],
+                dc.df.npartitions,
+                stats[rel_id]["bytes"],
+                stats[rel_id]["wall_time"],
+                stats[rel_id]["cpu_time"],
+                max(conversion_time, 0.0),
+            )
+        )
+
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "Operator",
+            "Rows",
+            "Partitions",
+            "Bytes",
+            "Wall Time",
+            "CPU Time",
+            "Conversion Time",
+        ],
+    )
+
+
+class ExplainAnalyzePlugin(BaseRelPlugin):
+    """
+    Execute the given query and show for every step
+    of its relational algebra, how many rows, partitions
+    and bytes it produced, how much wall and CPU time (in seconds)
+    was spent in the computation of its tasks
+    and how much time it took to create the dask API calls for it.
+    The SQL is:
+
+        EXPLAIN ANALYZE <some select query>
+
+    The result is also a table, although it is created on the fly.
+    """
+
+    class_name = "com.dask.sql.parser.SqlExplainAnalyze"
+
+    def convert(
+        self, sql: "org.apache.calcite.sql.SqlNode", context: "dask_sql.Context"
+    ) -> DataContainer:
+        sql_query = context._to_sql_string(sql.getQuery())
+        rel, select_names, _ = context._get_ral(sql_query)
+
+        df = analyze_rel(rel, select_names, context)
+
+        cc = ColumnContainer(df.columns)
+        dc = DataContainer(dd.from_pandas(df, npartitions=1), cc)
+        return dc
@@ -0,0 +1,385 @@
+import logging
+from contextlib import contextmanager
+from typing import List, Union
+
+import dask.dataframe as dd
+import pandas as pd
+
+from dask_sql.datacontainer import DataContainer
+from dask_sql.java import get_java_class, org
+from dask_sql.physical.rel.base import BaseRelPlugin
+from dask_sql.physical.rel.logical.aggregate import LogicalAggregatePlugin
+from dask_sql.physical.utils.groupby import get_groupby_with_nulls_cols
+from dask_sql.utils import convert_sql_kwargs, new_temporary_column
+
+logger = logging.getLogger(__name__)
+
+# How partial results of an aggregation can be combined
+_MERGE_AGGREGATIONS = {
+    "COUNT": "SUM",
+    "MAX": "MAX",
+    "MIN": "MIN",
+    "SUM": "SUM",
+    "SUM0": "SUM",
+}
+
+# Unlike the pandas sum, the SQL SUM of only NULLs is NULL
+_SUM_WITH_NULLS = dd.Aggregation(
+    "sum_with_nulls", lambda s: s.sum(min_count=1), lambda s0: s0.sum(min_count=1),
+)
+
+
+class MaterializedView:
+    """
+    Book-keeping of a materialized view: the query it was created from
+    and - if it is refreshed incrementally - the table it is computed from,
+    how much of this table is already included in the stored result
+    and how new results are merged into the stored result.
+    """
+
+    def __init__(self, sql: str, default_schema_name: str, incremental: bool = False):
+        self.sql = sql
+        # Unqualified table names in the query refer to this schema
+        self.default_schema_name = default_schema_name
+        self.incremental = incremental
+
+        # Only filled for incremental views
+        self.source_table = None
+        # Merge aggregation for every output column (None for the group columns)
+        # or None, if the new rows are just appended
+        self.merge_aggregations = None
+        # Table version and number of partitions of the source table
+        # already included in the stored result
+        self.processed = None
+
+    def refresh(self, context: "dask_sql.Context", schema_name: str, table_name: str):
+        """
+        Bring the stored result up-to-date by recomputing it or
+        - if possible - by only processing the newly added partitions
+        of the source table.
+        """
+        current_schema_name = context.schema_name
+        context.schema_name = self.default_schema_name
+        try:
+            rel, select_names, _ = context._get_ral(self.sql)
+            if self.incremental and self._refresh_incrementally(
+                rel, select_names, context, schema_name, table_name
+            ):
+                return
+
+            logger.debug(f"Recomputing materialized view {table_name}")
+            df = context._compute_table_from_rel(rel, select_names)
+            context.create_table(table_name, df, persist=True, schema_name=schema_name)
+            self._mark_processed(context)
+        finally:
+            context.schema_name = current_schema_name
+
+    def check_incremental(self, context: "dask_sql.Context"):
+        """
+        Find out the source table and how to merge the results
+        of the query for incremental refreshes.
+        Raises a NotImplementedError if the query does not allow for it.
+        """
+        current_schema_name = context.schema_name
+        context.schema_name = self.default_schema_name
+        try:
+            rel, _, _ = context._get_ral(self.sql)
+        finally:
+            context.schema_name = current_schema_name
+
+        tables = context._get_result_cache_tables(rel)
+        if tables is None or len(tables) != 1:
+            raise NotImplementedError(
+                "Only deterministic queries on a single table can be refreshed incrementally"
+            )
+
+        (self.source_table,) = tables
+        self.merge_aggregations = _get_merge_aggregations(rel)
+
+    def _refresh_incrementally(
+        self,
+        rel: "org.apache.calcite.rel.RelNode",
+        select_names: List[str],
+        context: "dask_sql.Context",
+        schema_name: str,
+        table_name: str,
+    ) -> bool:
+        """
+        Merge the results of the newly added partitions of the source table
+        into the stored result. Returns False, if this is not possible
+        and the view needs to be recomputed.
+        """
+        if self.processed is None:
+            return False
+
+        source_schema_name, source_table_name = self.source_table
+        source_schema = context.schema[source_schema_name]
+        processed_version, processed_partitions = self.processed
+
+        if source_schema.table_versions[source_table_name] == processed_version:
+            logger.debug(f"Materialized view {table_name} is already up-to-date")
+            return True
+
+        dc = source_schema.tables[source_table_name]
+        if dc.df.npartitions <= processed_partitions:
+            # The table was replaced, not appended to
+            return False
+
+        logger.debug(
+            f"Adding partitions {processed_partitions} to {dc.df.npartitions - 1} "
+            f"of {source_table_name} to materialized view {table_name}"
+        )
+        new_dc = DataContainer(
+            dc.df.partitions[processed_partitions:], dc.column_container
+        )
+        # The converters look up the table by its name, so we temporarily
+        # replace it with only its new partitions
+        with _replace_table(context, source_schema_name, source_table_name, new_dc):
+            new_df = context._compute_table_from_rel(rel, select_names)
+
+        old_df = context.schema[schema_name].tables[table_name].assign()
+        df = self._merge(old_df, new_df)
+
+        context.create_table(table_name, df, persist=True, schema_name=schema_name)
+        self._mark_processed(context)
+        return True
+
+    def _merge(self, old_df: dd.DataFrame, new_df: dd.DataFrame) -> dd.DataFrame:
+        """Combine the stored and the new (partial) results"""
+        df = dd.concat([old_df, new_df])
+        if self.merge_aggregations is None:
+            return df
+
+        # Re-aggregate the partial results with the same NULL handling
+        # as the view query, using positional column names
+        # as the result names can be anything
+        columns = list(df.columns)
+        df.columns = [f"c{i}" for i in range(len(columns))]
+
+        additional_column_name = new_temporary_column(df)
+        df = df.assign(**{additional_column_name: 1})
+
+        group_columns = []
+        aggregations = {}
+        for col, aggregation in zip(df.columns, self.merge_aggregations):
+            if aggregation is None:
+                # The values of the group columns are the same for a single group
+                group_columns.append(df[col])
+                aggregations[col] = "first"
+            else:
+                aggregations[col] = _get_dask_aggregation(aggregation, df[col].dtype)
+
+        group_columns_and_nulls = get_groupby_with_nulls_cols(
+            df, group_columns, additional_column_name
+        )
+        df = df.groupby(by=group_columns_and_nulls).agg(aggregations)
+        df = df.reset_index(drop=True)
+
+        df.columns = columns
+        return df
+
+    def _mark_processed(self, context: "dask_sql.Context"):
+        """Remember the current state of the source table"""
+        if not self.incremental:
+            return
+
+        source_schema_name, source_table_name = self.source_table
+        source_schema = context.schema[source_schema_name]
+        self.processed = (
+            source_schema.table_versions[source_table_name],
+            source_schema.tables[source_table_name].df.npartitions,
+        )
+
+
+def _get_dask_aggregation(aggregation: str, dtype) -> Union[str, dd.Aggregation]:
+    """Return the dask aggregation to combine partial results with the given SQL aggregation"""
+    if aggregation == "SUM":
+        return _SUM_WITH_NULLS
+
+    specification = LogicalAggregatePlugin.AGGREGATION_MAPPING[aggregation.lower()]
+    if pd.api.types.is_numeric_dtype(dtype):
+        return specification.numerical_aggregation
+    return specification.non_numerical_aggregation
+
+
+@contextmanager
+def _replace_table(
+    context: "dask_sql.Context", schema_name: str, table_name: str, dc: DataContainer
+):
+    """
+    Replace the data of the table (not its columns) for the duration of the block.
+    In the meantime, the table gets a new version and the schema is marked
+    as changed, so that no cached plan or result of the original table
+    is used for the replacement - and vice versa.
+    """
+    schema = context.schema[schema_name]
+    with context._generator_lock:
+        original_dc = schema.tables[table_name]
+        original_version = schema.table_versions[table_name]
+
+        schema.tables[table_name] = dc
+        context._increase_schema_version(schema_name)
+        schema.table_versions[table_name] = context._schema_version
+    try:
+        yield
+    finally:
+        with context._generator_lock:
+            schema.tables[table_name] = original_dc
+            context._increase_schema_version(schema_name)
+            # Results computed from the replacement are stored with
+            # its version and are therefore never re-used
+            schema.table_versions[table_name] = original_version
+
+
+def _get_merge_aggregations(
+    rel: "org.apache.calcite.rel.RelNode",
+) -> Union[List[Union[str, None]], None]:
+    """
+    Return for every output column of an aggregation, how the
+    partial results need to be aggregated again (None for the group columns)
+    - or None, if the query is only a projection and filter.
+    Raises a NotImplementedError for all other queries.
+    """
+    output_indices = None
+    class_name = get_java_class(rel)
+
+    # A projection on top of the aggregation, which only reorders or renames
+    if class_name == "org.apache.calcite.rel.logical.LogicalProject" and all(
+        isinstance(rex, org.apache.calcite.rex.RexInputRef) for rex in rel.getProjects()
+    ):
+        input_rel = rel.getInput(0)
+        if (
+            get_java_class(input_rel)
+            == "org.apache.calcite.rel.logical.LogicalAggregate"
+        ):
+            output_indices = [int(rex.getIndex()) for rex in rel.getProjects()]
+            rel = input_rel
+            class_name = get_java_class(rel)
+
+    merge_aggregations = None
+    if class_name == "org.apache.calcite.rel.logical.LogicalAggregate":
+        if len(rel.getGroupSets()) != 1:
+            raise NotImplementedError(
+                "Grouping sets can not be refreshed incrementally"
+            )
+
+        merge_aggregations = [None] * int(rel.getGroupCount())
+        for agg_call in rel.getAggCallList():
+            kind = str(agg_call.getAggregation().getKind())
+            if kind not in _MERGE_AGGREGATIONS or (
+                agg_call.isDistinct() and kind not in ("MIN", "MAX")
+            ):
+                raise NotImplementedError(
+                    f"The aggregation {agg_call} can not be refreshed incrementally"
+                )
+            merge_aggregations.append(_MERGE_AGGREGATIONS[kind])
+
+        if output_indices is not None:
+            merge_aggregations = [merge_aggregations[i] for i in output_indices]
+
+        rel = rel.getInput()
+        class_name = get_java_class(rel)
+
+    while class_name in (
+        "org.apache.calcite.rel.logical.LogicalProject",
+        "org.apache.calcite.rel.logical.LogicalFilter",
+    ):
+        rel = rel.getInput()
+        class_name = get_java_class(rel)
+
+    if class_name != "org.apache.calcite.rel.logical.LogicalTableScan":
+        raise NotImplementedError(
+            "Only aggregations, projections and filters can be refreshed incrementally"
+        )
+
+    return merge_aggregations
+
+
+class CreateMaterializedViewPlugin(BaseRelPlugin):
+    """
+    Create a table from the given SELECT query, register it at the context
+    and remember the query, so that the table can be refreshed later.
+    The SQL call looks like
+
+        CREATE MATERIALIZED VIEW <table-name> AS
+            <some select query>
+
+    or
+
+        CREATE MATERIALIZED VIEW <table-name> WITH (
+            incremental = True
+        ) AS
+            <some select query>
+
+    With ``incremental``, the table the query reads from is assumed
+    to be append-only: a refresh will then only process the partitions
+    added to it since the last refresh and merge the result
+    into the stored table. This is only possible for queries
+    on a single table, which only filter and project
+    and (optionally) aggregate with COUNT, SUM, MIN or MAX.
+
+    Nothing is returned.
+    """
+
+    class_name = "com.dask.sql.parser.SqlCreateMaterializedView"
+
+    def convert(
+        self, sql: "org.apache.calcite.sql.SqlNode", context: "dask_sql.Context"
+    ) -> DataContainer:
+        schema_name, table_name = context.fqn(sql.getTableName())
+
+        if table_name in context.schema[schema_name].tables:
+            if sql.getIfNotExists():
+                return
+            elif not sql.getReplace():
+                raise RuntimeError(
+                    f"A table with the name {table_name} is already present."
+                )
+
+        kwargs = convert_sql_kwargs(sql.getKwargs())
+        incremental = bool(kwargs.pop("incremental", False))
+        if kwargs:
+            raise AttributeError(f"Unknown parameters {sorted(kwargs)}.")
+
+        sql_select_query = context._to_sql_string(sql.getSelect())
+
+        logger.debug(
+            f"Creating new materialized view with name {table_name} and query {sql_select_query}"
+        )
+
+        view = MaterializedView(sql_select_query, context.schema_name, incremental)
+        if incremental:
+            view.check_incremental(context)
+
+        view.refresh(context, schema_name, table_name)
+        context.schema[schema_name].materialized_views[table_name] = view
+
+
+class RefreshMaterializedViewPlugin(BaseRelPlugin):
+    """
+    Bring a materialized view up-to-date with the tables it reads from.
+    The SQL call looks like
+
+        REFRESH MATERIALIZED VIEW <table-name>
+
+    Views created with ``incremental = True`` only process
+    the partitions added to their source table since the last refresh
+    (as long as the source table was not replaced by a smaller one).
+    All other views are recomputed completely.
+
+    Nothing is returned.
+    """
+
+    class_name = "com.dask.sql.parser.SqlRefreshMaterializedView"
+
+    def convert(
+        self, sql: "org.apache.calcite.sql.SqlNode", context: "dask_sql.Context"
+    ) -> DataContainer:
+        schema_name, table_name = context.fqn(sql.getTableName())
+
+        try:
+            view = context.schema[schema_name].materialized_views[table_name]
+        except KeyError:
+            raise RuntimeError(f"{table_name} is not a materialized view.")
+
+        view.refresh(context, schema_name, table_name)
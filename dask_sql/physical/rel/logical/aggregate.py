@@ -155,9 +155,9 @@ class LogicalAggregatePlugin(BaseRelPlugin):
         df_agg.columns = df_agg.columns.get_level_values(-1)
         cc = ColumnContainer(df_agg.columns).limit_to(output_column_order)
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
         dc = DataContainer(df_agg, cc)
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
         return dc
 
     def _do_aggregations(
@@ -51,6 +51,7 @@ class LogicalFilterPlugin(BaseRelPlugin):
         df_condition = RexConverter.convert(condition, dc, context=context)
         df = filter_or_scalar(df, df_condition)
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
         # No column type has changed, so no need to convert again
-        return DataContainer(df, cc)
+        # Filtering keeps the rows in their partitions
+        return DataContainer(df, cc, partitioning=dc.partitioning)
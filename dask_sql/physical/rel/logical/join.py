@@ -1,18 +1,25 @@
 import logging
 import operator
 import warnings
-from functools import reduce
-from typing import List, Tuple
+from functools import partial, reduce
+from typing import List, Tuple, Union
 
+import dask
 import dask.dataframe as dd
+import numpy as np
+import pandas as pd
 from dask.base import tokenize
+from dask.dataframe.shuffle import rearrange_by_column
 from dask.highlevelgraph import HighLevelGraph
 
-from dask_sql.datacontainer import ColumnContainer, DataContainer
+from dask_sql.datacontainer import ColumnContainer, DataContainer, Partitioning
 from dask_sql.java import org
 from dask_sql.physical.rel.base import BaseRelPlugin
 from dask_sql.physical.rel.logical.filter import filter_or_scalar
+from dask_sql.physical.rel.plan import to_row_type
 from dask_sql.physical.rex import RexConverter
+from dask_sql.physical.rex.compile import PartitionFilter, compile_filter
+from dask_sql.utils import make_pickable_without_dask_sql, new_temporary_column
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,22 @@ class LogicalJoinPlugin(BaseRelPlugin):
     whereas the second part is just applied as a filter afterwards.
     This will make joining more time-consuming that is needs to be
     but so far, it is the only solution...
+
+    If one side of an equijoin is small, it is not shuffled together with
+    the other side, but broadcasted (as a single partition) to every partition
+    of the other side instead. Which side is small, is decided from the table statistics
+    and the number of partitions, or can be set with a /*+ BROADCAST(table) */ hint
+    and the "sql.join.broadcast" configuration option.
+
+    If both sides are already partitioned by the join columns with the same
+    divisions (e.g. because they were registered with them as sorted index
+    or were sorted by them before), neither side is shuffled:
+    the partitions are merged pairwise.
+
+    Semi and anti joins (which calcite creates for IN and EXISTS subqueries)
+    only return the rows of the lhs, which have (or do not have) a match.
+    On equality conditions, they are executed as membership test of the
+    lhs keys in the set of distinct rhs keys - so no lhs row is ever repeated.
     """
 
     class_name = "org.apache.calcite.rel.logical.LogicalJoin"
@@ -40,6 +63,19 @@ class LogicalJoinPlugin(BaseRelPlugin):
         "LEFT": "left",
         "RIGHT": "right",
         "FULL": "outer",
+        "SEMI": "leftsemi",
+        "ANTI": "leftanti",
+    }
+
+    # Only the side, which does not need to keep unmatched rows,
+    # can be broadcasted (otherwise they would be repeated for every partition)
+    BROADCAST_SIDES = {
+        "inner": ["lhs", "rhs"],
+        "left": ["rhs"],
+        "right": ["lhs"],
+        "outer": [],
+        "leftsemi": ["rhs"],
+        "leftanti": ["rhs"],
     }
 
     def convert(
@@ -75,11 +111,15 @@ class LogicalJoinPlugin(BaseRelPlugin):
         # The first case is very simple and we do not need any additional filter
         # In the second case we do a merge on all the a = b,
         # and then apply a filter using the other expressions.
+        # If there is no a = b, but range conditions (such as a < b or a BETWEEN b AND c)
+        # we can still do a band join on them and filter afterwards.
         # In all other cases, we need to do a full table cross join and filter afterwards.
         # As this is probably non-sense for large tables, but there is no other
         # known solution so far.
         join_condition = rel.getCondition()
-        lhs_on, rhs_on, filter_condition = self._split_join_condition(join_condition)
+        lhs_on, rhs_on, range_on, filter_condition = self._split_join_condition(
+            join_condition
+        )
 
         logger.debug(f"Joining with type {join_type} on columns {lhs_on}, {rhs_on}.")
 
@@ -88,90 +128,122 @@ class LogicalJoinPlugin(BaseRelPlugin):
         # of lhs and rhs put side-by-side (in this order)
         # We therefore need to normalize the rhs indices relative to the rhs table.
         rhs_on = [index - len(df_lhs_renamed.columns) for index in rhs_on]
+        range_on = [
+            (lhs_index, rhs_index - len(df_lhs_renamed.columns), operator_name)
+            for lhs_index, rhs_index, operator_name in range_on
+        ]
+
+        # The result will contain all (renamed) columns from the lhs and rhs
+        # (in this order), which we rename like the rel specifies.
+        # This is already needed for filtering during the cross or band join below.
+        correct_column_order = list(df_lhs_renamed.columns) + list(
+            df_rhs_renamed.columns
+        )
+        row_type = to_row_type(self.get_row_type(rel, context))
+        cc = ColumnContainer(correct_column_order)
+
+        # Semi and anti joins only return the lhs columns
+        is_semi_join = join_type in ["leftsemi", "leftanti"]
+        if is_semi_join:
+            cc_result = ColumnContainer(list(df_lhs_renamed.columns))
+            cc_result = self.fix_column_to_row_type(cc_result, row_type)
+
+            if lhs_on and not filter_condition:
+                broadcast_side = self._get_broadcast_side(
+                    rel, context, df_lhs_renamed, df_rhs_renamed, join_type
+                )
+                df = self._semi_join_on_columns(
+                    df_lhs_renamed,
+                    df_rhs_renamed,
+                    lhs_on,
+                    rhs_on,
+                    join_type == "leftanti",
+                    broadcast=broadcast_side is not None,
+                )
+                dc = DataContainer(df, cc_result)
+                return self.fix_dtype_to_row_type(dc, row_type)
+        else:
+            cc = self.fix_column_to_row_type(cc, row_type)
+
+        # For outer joins with additional filter conditions, we first only keep
+        # the matching rows (an inner join) and add the unmatched rows afterwards.
+        # To find them, the rows of the outer side(s) are tagged with a unique id.
+        # The same is done for semi and anti joins with additional filter conditions:
+        # only the lhs rows with (or without) any matching row are kept in the end.
+        add_unmatched_rows = join_type in ["left", "right", "outer"] and bool(
+            filter_condition
+        )
+        merge_type = "inner" if add_unmatched_rows or is_semi_join else join_type
+
+        lhs_row_id = rhs_row_id = None
+        if is_semi_join or (add_unmatched_rows and join_type in ["left", "outer"]):
+            df_lhs_renamed, lhs_row_id = self._add_row_ids(df_lhs_renamed)
+        if add_unmatched_rows and join_type in ["right", "outer"]:
+            df_rhs_renamed, rhs_row_id = self._add_row_ids(df_rhs_renamed)
 
         # 4. dask can only merge on the same column names.
         # We therefore create new columns on purpose, which have a distinct name.
         assert len(lhs_on) == len(rhs_on)
+        partitioning = None
         if lhs_on:
             # 5. Now we can finally merge on these columns
             # The resulting dataframe will contain all (renamed) columns from the lhs and rhs
             # plus the added columns
+            partitioning = self._get_common_partitioning(
+                dc_lhs, dc_rhs, lhs_on, rhs_on, df_lhs_renamed
+            )
+            broadcast_side = None
+            if partitioning is None:
+                broadcast_side = self._get_broadcast_side(
+                    rel, context, df_lhs_renamed, df_rhs_renamed, merge_type
+                )
             df = self._join_on_columns(
-                df_lhs_renamed, df_rhs_renamed, lhs_on, rhs_on, join_type,
+                df_lhs_renamed,
+                df_rhs_renamed,
+                lhs_on,
+                rhs_on,
+                merge_type,
+                broadcast_side,
+                co_partitioned=partitioning is not None,
             )
+            is_filtered = False
         else:
             # 5. We are in the complex join case
-            # where we have no column to merge on
-            # This means we have no other chance than to merge
-            # everything with everything...
-
-            # TODO: we should implement a shortcut
-            # for filter conditions that are always false
-
-            def merge_single_partitions(lhs_partition, rhs_partition):
-                # Do a cross join with the two partitions
-                # TODO: it would be nice to apply the filter already here
-                # problem: this would mean we need to ship the rex to the
-                # workers (as this is executed on the workers),
-                # which is definitely not possible (java dependency, JVM start...)
-                lhs_partition = lhs_partition.assign(common=1)
-                rhs_partition = rhs_partition.assign(common=1)
-                # Need to drop "common" here, otherwise metadata mismatches
-                merged_data = lhs_partition.merge(rhs_partition, on=["common"]).drop(
-                    columns=["common"]
-                )
-
-                return merged_data
-
-            # Iterate nested over all partitions from lhs and rhs and merge them
-            name = "cross-join-" + tokenize(df_lhs_renamed, df_rhs_renamed)
-            dsk = {
-                (name, i * df_rhs_renamed.npartitions + j): (
-                    merge_single_partitions,
-                    (df_lhs_renamed._name, i),
-                    (df_rhs_renamed._name, j),
-                )
-                for i in range(df_lhs_renamed.npartitions)
-                for j in range(df_rhs_renamed.npartitions)
-            }
-
-            graph = HighLevelGraph.from_collections(
-                name, dsk, dependencies=[df_lhs_renamed, df_rhs_renamed]
-            )
-
+            # where we have no column to merge on.
+            # To not keep the full product in memory, the filter
+            # is applied directly on every pair of partitions, which are merged.
+            # For this, it is compiled into a pure pandas function,
+            # which can be shipped to the workers
+            # (unlike the RexNodes with their java dependency).
             meta = dd.dispatch.concat(
                 [df_lhs_renamed._meta_nonempty, df_rhs_renamed._meta_nonempty], axis=1
             )
-            # TODO: Do we know the divisions in any way here?
-            divisions = [None] * (len(dsk) + 1)
-            df = dd.DataFrame(graph, name, meta=meta, divisions=divisions)
+            partition_filter = compile_filter(filter_condition, cc, meta, context)
 
-            warnings.warn(
-                "Need to do a cross-join, which is typically very resource heavy",
-                ResourceWarning,
-            )
+            band = self._get_band(df_lhs_renamed, df_rhs_renamed, range_on)
+            if band is not None:
+                # If there are range conditions, both sides are partitioned
+                # by ranges of the join columns, so that only the matching
+                # partitions need to be merged
+                df = self._join_on_ranges(
+                    df_lhs_renamed, df_rhs_renamed, band, partition_filter, meta
+                )
+            else:
+                # Otherwise, we have no other chance than to merge
+                # everything with everything...
+                df = self._cross_join(
+                    df_lhs_renamed, df_rhs_renamed, partition_filter, meta
+                )
+            is_filtered = True
 
-        # 6. So the next step is to make sure
-        # we have the correct column order (and to remove the temporary join columns)
-        correct_column_order = list(df_lhs_renamed.columns) + list(
-            df_rhs_renamed.columns
-        )
-        cc = ColumnContainer(df.columns).limit_to(correct_column_order)
-
-        # and to rename them like the rel specifies
-        row_type = rel.getRowType()
-        field_specifications = [str(f) for f in row_type.getFieldNames()]
-        cc = cc.rename(
-            {
-                from_col: to_col
-                for from_col, to_col in zip(cc.columns, field_specifications)
-            }
-        )
-        cc = self.fix_column_to_row_type(cc, row_type)
-        dc = DataContainer(df, cc)
+        # 6. The column container only references the lhs and rhs columns,
+        # so the temporary join columns are not part of the result.
+        # A pairwise merge keeps the rows of the lhs in their partitions.
+        dc = DataContainer(df, cc, partitioning=partitioning)
 
         # 7. Last but not least we apply any filters by and-chaining together the filters
-        if filter_condition:
+        # (if this was not already done during the cross or band join)
+        if filter_condition and not is_filtered:
             # This line is a bit of code duplication with RexCallPlugin - but I guess it is worth to keep it separate
             filter_condition = reduce(
                 operator.and_,
@@ -182,24 +254,176 @@ class LogicalJoinPlugin(BaseRelPlugin):
             )
             logger.debug(f"Additionally applying filter {filter_condition}")
             df = filter_or_scalar(df, filter_condition)
-            # make sure we recover any lost rows in case of left, right or outer joins
-            if join_type in ["left", "outer"]:
-                df = df.merge(
-                    df_lhs_renamed, on=list(df_lhs_renamed.columns), how="right"
-                )
-            elif join_type in ["right", "outer"]:
-                df = df.merge(
-                    df_rhs_renamed, on=list(df_rhs_renamed.columns), how="right"
-                )
+            dc = DataContainer(df, cc, partitioning=partitioning)
+
+        # 8. and make sure we recover the unmatched rows in case of left, right or outer joins
+        if add_unmatched_rows:
+            df = self._add_unmatched_rows(
+                df, df_lhs_renamed, lhs_row_id, df_rhs_renamed, rhs_row_id
+            )
             dc = DataContainer(df, cc)
-            # Caveat: columns of int may be casted to float if NaN is introduced
-            # for unmatched rows. Since we don't know which column would be casted
-            # without triggering compute(), we have to either leave it alone, or
-            # forcibly cast all int to nullable int.
 
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        # 9. or only keep the lhs rows with (or without) a match for semi and anti joins
+        if is_semi_join:
+            df = self._filter_matched_rows(
+                df, df_lhs_renamed, lhs_row_id, join_type == "leftanti"
+            )
+            dc = DataContainer(df, cc_result)
+
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
         return dc
 
+    @staticmethod
+    def _add_row_ids(df: dd.DataFrame) -> Tuple[dd.DataFrame, str]:
+        """Tag every row with a unique id (which stays the same on recomputation)"""
+        row_id_column = new_temporary_column(df)
+        df = df.assign(**{row_id_column: 1})
+        df = df.assign(**{row_id_column: df[row_id_column].cumsum()})
+        return df, row_id_column
+
+    @staticmethod
+    def _filter_matched_rows(
+        df: dd.DataFrame, df_lhs: dd.DataFrame, lhs_row_id: str, anti: bool
+    ) -> dd.DataFrame:
+        """
+        Return the rows of the lhs, whose ids are (or with anti: are not)
+        part of the joined (and filtered) dataframe - every row at most once.
+        The set of matched ids is broadcasted to every partition of the lhs.
+        """
+        matched_ids = df[lhs_row_id].unique().to_delayed(optimize_graph=False)[0]
+        df_lhs = df_lhs.map_partitions(
+            make_pickable_without_dask_sql(
+                partial(_filter_by_row_ids, row_id_column=lhs_row_id, anti=anti)
+            ),
+            matched_ids,
+            meta=df_lhs._meta,
+        )
+        return df_lhs.drop(columns=[lhs_row_id])
+
+    def _semi_join_on_columns(
+        self,
+        df_lhs_renamed: dd.DataFrame,
+        df_rhs_renamed: dd.DataFrame,
+        lhs_on: List[int],
+        rhs_on: List[int],
+        anti: bool,
+        broadcast: bool = False,
+    ) -> dd.DataFrame:
+        """
+        Keep the rows of the lhs, whose values in the lhs_on columns
+        are (or with anti: are not) in the set of distinct values of the
+        rhs_on columns of the rhs.
+        The key set is either broadcasted to every partition of the lhs
+        (no shuffle of the lhs is needed) or both sides are shuffled
+        and merged with the (distinct) keys.
+        As in SQL, NULLs never match.
+        """
+        keys = df_rhs_renamed.assign(
+            **{
+                f"common_{i}": df_rhs_renamed.iloc[:, index]
+                for i, index in enumerate(rhs_on)
+            }
+        )
+        added_columns = [f"common_{i}" for i in range(len(rhs_on))]
+        keys = keys[added_columns].dropna()
+
+        if broadcast:
+            logger.debug("Broadcasting the keys of the rhs of the semi join")
+            keys = keys.drop_duplicates().repartition(npartitions=1)
+            key_partition = keys.to_delayed(optimize_graph=False)[0]
+            return df_lhs_renamed.map_partitions(
+                make_pickable_without_dask_sql(
+                    partial(_filter_by_keys, on=lhs_on, anti=anti)
+                ),
+                key_partition,
+                meta=df_lhs_renamed._meta,
+            )
+
+        keys = keys.drop_duplicates(split_out=df_rhs_renamed.npartitions)
+        df_lhs_with_tmp = df_lhs_renamed.assign(
+            **{
+                f"common_{i}": df_lhs_renamed.iloc[:, index]
+                for i, index in enumerate(lhs_on)
+            }
+        )
+        lhs_columns = list(df_lhs_renamed.columns)
+
+        if not anti:
+            df = dd.merge(df_lhs_with_tmp, keys, on=added_columns, how="inner")
+            return df[lhs_columns]
+
+        # Rows of the lhs without a match have no value in the marker column
+        marker_column = new_temporary_column(df_lhs_with_tmp)
+        keys = keys.assign(**{marker_column: True})
+        df = dd.merge(df_lhs_with_tmp, keys, on=added_columns, how="left")
+        df = df[df[marker_column].isna()]
+        return df[lhs_columns]
+
+    def _add_unmatched_rows(
+        self,
+        df: dd.DataFrame,
+        df_lhs: dd.DataFrame,
+        lhs_row_id: Union[str, None],
+        df_rhs: dd.DataFrame,
+        rhs_row_id: Union[str, None],
+    ) -> dd.DataFrame:
+        """
+        Add all rows of the lhs (if tagged with lhs_row_id) and of the rhs
+        (if tagged with rhs_row_id), whose ids are not part of the joined
+        (and filtered) dataframe, with NULLs in all columns of the other side.
+        The set of matched ids is broadcasted to every partition of the inputs,
+        so no input needs to be shuffled again.
+        """
+        lhs_columns = [col for col in df_lhs.columns if col != lhs_row_id]
+        rhs_columns = [col for col in df_rhs.columns if col != rhs_row_id]
+
+        parts = [df[lhs_columns + rhs_columns]]
+        for df_side, row_id, other_meta, side_is_lhs in [
+            (df_lhs, lhs_row_id, df_rhs._meta[rhs_columns], True),
+            (df_rhs, rhs_row_id, df_lhs._meta[lhs_columns], False),
+        ]:
+            if row_id is None:
+                continue
+
+            matched_ids = df[row_id].unique().to_delayed(optimize_graph=False)[0]
+            meta = _get_unmatched_rows(
+                df_side._meta_nonempty,
+                df_side._meta[row_id],
+                row_id,
+                other_meta,
+                side_is_lhs,
+            ).iloc[:0]
+            parts.append(
+                df_side.map_partitions(
+                    # (dask would turn the pandas dataframe argument into a dask dataframe)
+                    make_pickable_without_dask_sql(
+                        partial(
+                            _get_unmatched_rows,
+                            row_id_column=row_id,
+                            other_meta=other_meta,
+                            side_is_lhs=side_is_lhs,
+                        )
+                    ),
+                    matched_ids,
+                    meta=meta,
+                    enforce_metadata=False,
+                )
+            )
+
+        # NULLs may change the dtypes of the columns (e.g. int to float)
+        dtypes = dd.dispatch.concat([part._meta for part in parts]).dtypes
+        parts = [
+            part.astype(
+                {
+                    col: dtype
+                    for col, dtype in dtypes.items()
+                    if part.dtypes[col] != dtype
+                }
+            )
+            for part in parts
+        ]
+        return dd.concat(parts)
+
     def _join_on_columns(
         self,
         df_lhs_renamed: dd.DataFrame,
@@ -207,6 +431,8 @@ class LogicalJoinPlugin(BaseRelPlugin):
         lhs_on: List[str],
         rhs_on: List[str],
         join_type: str,
+        broadcast_side: str = None,
+        co_partitioned: bool = False,
     ) -> dd.DataFrame:
         lhs_columns_to_add = {
             f"common_{i}": df_lhs_renamed.iloc[:, index]
@@ -238,23 +464,460 @@ class LogicalJoinPlugin(BaseRelPlugin):
         df_rhs_with_tmp = df_rhs_renamed.assign(**rhs_columns_to_add)
         added_columns = list(lhs_columns_to_add.keys())
 
-        df = dd.merge(df_lhs_with_tmp, df_rhs_with_tmp, on=added_columns, how=join_type)
+        if co_partitioned:
+            df = self._merge_partitions_pairwise(
+                df_lhs_with_tmp, df_rhs_with_tmp, added_columns, join_type
+            )
+        elif broadcast_side is None:
+            df = dd.merge(
+                df_lhs_with_tmp, df_rhs_with_tmp, on=added_columns, how=join_type
+            )
+        elif broadcast_side == "rhs":
+            df = self._broadcast_join(
+                df_lhs_with_tmp, df_rhs_with_tmp, added_columns, join_type, False
+            )
+        else:
+            df = self._broadcast_join(
+                df_rhs_with_tmp, df_lhs_with_tmp, added_columns, join_type, True
+            )
 
         return df
 
+    @staticmethod
+    def _get_common_partitioning(
+        dc_lhs: DataContainer,
+        dc_rhs: DataContainer,
+        lhs_on: List[int],
+        rhs_on: List[int],
+        df_lhs_renamed: dd.DataFrame,
+    ) -> Union[Partitioning, None]:
+        """
+        If both sides are partitioned by a pair of join columns with the same divisions,
+        return the partitioning of the joined dataframe (by the renamed lhs column).
+        As all rows with the same join value are then in the partitions with the same
+        index on both sides, no shuffle is needed.
+        """
+        cc_lhs = dc_lhs.column_container
+        cc_rhs = dc_rhs.column_container
+        for lhs_index, rhs_index in zip(lhs_on, rhs_on):
+            lhs_divisions = dc_lhs.get_divisions(
+                cc_lhs.get_backend_by_frontend_index(lhs_index)
+            )
+            rhs_divisions = dc_rhs.get_divisions(
+                cc_rhs.get_backend_by_frontend_index(rhs_index)
+            )
+            if lhs_divisions is not None and lhs_divisions == rhs_divisions:
+                return Partitioning(df_lhs_renamed.columns[lhs_index], lhs_divisions)
+
+        return None
+
+    def _merge_partitions_pairwise(
+        self, df_lhs: dd.DataFrame, df_rhs: dd.DataFrame, on: List[str], join_type: str,
+    ) -> dd.DataFrame:
+        """Merge the i-th partition of the lhs only with the i-th partition of the rhs"""
+        logger.debug("Both sides of the join are co-partitioned, merging pairwise")
+        meta = _merge_partitions(
+            df_lhs._meta_nonempty, df_rhs._meta_nonempty, on, join_type
+        ).iloc[:0]
+        merge_partitions = make_pickable_without_dask_sql(
+            partial(_merge_partitions, on=on, join_type=join_type)
+        )
+
+        name = "co-partitioned-join-" + tokenize(df_lhs, df_rhs, on, join_type)
+        dsk = {
+            (name, i): (merge_partitions, (df_lhs._name, i), (df_rhs._name, i))
+            for i in range(df_lhs.npartitions)
+        }
+        graph = HighLevelGraph.from_collections(
+            name, dsk, dependencies=[df_lhs, df_rhs]
+        )
+
+        divisions = [None] * (df_lhs.npartitions + 1)
+        return dd.DataFrame(graph, name, meta=meta, divisions=divisions)
+
+    def _broadcast_join(
+        self,
+        df_big: dd.DataFrame,
+        df_small: dd.DataFrame,
+        on: List[str],
+        join_type: str,
+        small_is_lhs: bool,
+    ) -> dd.DataFrame:
+        """
+        Merge every partition of df_big with the full df_small,
+        which is collected into a single partition first.
+        No shuffle of df_big is needed for this.
+        """
+        logger.debug(f"Broadcasting the {'lhs' if small_is_lhs else 'rhs'} of the join")
+        small_partition = df_small.repartition(npartitions=1).to_delayed(
+            optimize_graph=False
+        )[0]
+
+        meta = _merge_with_broadcast(
+            df_big._meta_nonempty, df_small._meta_nonempty, on, join_type, small_is_lhs
+        ).iloc[:0]
+
+        return df_big.map_partitions(
+            make_pickable_without_dask_sql(_merge_with_broadcast),
+            small_partition,
+            on,
+            join_type,
+            small_is_lhs,
+            meta=meta,
+            enforce_metadata=False,
+        )
+
+    def _get_broadcast_side(
+        self,
+        rel: "org.apache.calcite.rel.RelNode",
+        context: "dask_sql.Context",
+        df_lhs: dd.DataFrame,
+        df_rhs: dd.DataFrame,
+        join_type: str,
+    ) -> Union[str, None]:
+        """
+        Decide which side of the join ("lhs" or "rhs") is broadcasted
+        or return None, if both sides should be shuffled.
+        In order of precedence, a side is broadcasted if
+        * it is named in a BROADCAST hint (a hint without options
+          means the smaller side)
+        * the "sql.join.broadcast" option is set to True (the smaller side)
+        * its estimated number of rows is below "sql.join.broadcast_threshold"
+          or it consists of only a single partition (while the other side does not)
+        Setting "sql.join.broadcast" to False disables broadcasting completely.
+        """
+        broadcast = dask.config.get("sql.join.broadcast", None)
+        possible_sides = self.BROADCAST_SIDES[join_type]
+        if broadcast is False or not possible_sides:
+            return None
+
+        inputs = {"lhs": rel.getLeft(), "rhs": rel.getRight()}
+        npartitions = {"lhs": df_lhs.npartitions, "rhs": df_rhs.npartitions}
+        row_counts = {
+            side: self._estimate_row_count(input_rel, context)
+            for side, input_rel in inputs.items()
+        }
+
+        def size(side):
+            # Unknown row counts are considered larger than all known ones
+            row_count = row_counts[side]
+            return (
+                (row_count if row_count is not None else float("inf")),
+                (npartitions[side]),
+            )
+
+        rel_info = self.get_rel_info(rel, context)
+        hints = [
+            hint
+            for hint in (rel_info.hints if rel_info else [])
+            if hint.name == "BROADCAST"
+        ]
+        if hints:
+            hinted_tables = {
+                option.lower() for hint in hints for option in hint.options
+            }
+            hinted_sides = [
+                side
+                for side in possible_sides
+                if not hinted_tables
+                or hinted_tables & self._get_table_names(inputs[side])
+            ]
+            if hinted_sides:
+                return min(hinted_sides, key=size)
+
+            logger.debug(f"Can not broadcast the hinted tables in a {join_type} join")
+            return None
+
+        if broadcast is True:
+            return min(possible_sides, key=size)
+
+        threshold = dask.config.get("sql.join.broadcast_threshold")
+        other_side = {"lhs": "rhs", "rhs": "lhs"}
+        small_sides = [
+            side
+            for side in possible_sides
+            if (row_counts[side] is not None and row_counts[side] <= threshold)
+            or (npartitions[side] == 1 and npartitions[other_side[side]] > 1)
+        ]
+        if small_sides:
+            return min(small_sides, key=size)
+
+        return None
+
+    @staticmethod
+    def _estimate_row_count(
+        rel: "org.apache.calcite.rel.RelNode", context: "dask_sql.Context"
+    ) -> Union[float, None]:
+        """
+        Return the number of rows calcite estimates for the rel
+        - but only if the row counts of all scanned tables are known.
+        Otherwise, calcite would just guess.
+        """
+        for table in org.apache.calcite.plan.RelOptUtil.findAllTables(rel):
+            schema_name, table_name = [str(n) for n in table.getQualifiedName()]
+            try:
+                dc = context.schema[schema_name].tables[table_name.lower()]
+            except KeyError:  # pragma: no cover
+                return None
+            if dc.statistics is None or dc.statistics.row_count is None:
+                return None
+
+        row_count = rel.getCluster().getMetadataQuery().getRowCount(rel)
+        if row_count is None:  # pragma: no cover
+            return None
+        return float(row_count)
+
+    @staticmethod
+    def _get_table_names(rel: "org.apache.calcite.rel.RelNode") -> set:
+        """Names (with and without schema) of all tables scanned in the rel"""
+        table_names = set()
+        for table in org.apache.calcite.plan.RelOptUtil.findAllTables(rel):
+            schema_name, table_name = [str(n).lower() for n in table.getQualifiedName()]
+            table_names.add(table_name)
+            table_names.add(f"{schema_name}.{table_name}")
+        return table_names
+
+    def _cross_join(
+        self,
+        df_lhs_renamed: dd.DataFrame,
+        df_rhs_renamed: dd.DataFrame,
+        partition_filter: PartitionFilter,
+        meta: pd.DataFrame,
+    ) -> dd.DataFrame:
+        """Merge every partition of the lhs with every partition of the rhs"""
+        # TODO: we should implement a shortcut
+        # for filter conditions that are always false
+
+        def merge_single_partitions(lhs_partition, rhs_partition, partition_filter):
+            # Do a cross join with the two partitions
+            lhs_partition = lhs_partition.assign(common=1)
+            rhs_partition = rhs_partition.assign(common=1)
+            # Need to drop "common" here, otherwise metadata mismatches
+            merged_data = lhs_partition.merge(rhs_partition, on=["common"]).drop(
+                columns=["common"]
+            )
+
+            return partition_filter(merged_data)
+
+        # The filter is shipped together with the function
+        # (workers do not need to have dask_sql installed)
+        merge_single_partitions = make_pickable_without_dask_sql(
+            partial(merge_single_partitions, partition_filter=partition_filter)
+        )
+
+        # Iterate nested over all partitions from lhs and rhs and merge them
+        name = "cross-join-" + tokenize(
+            df_lhs_renamed, df_rhs_renamed, partition_filter
+        )
+        dsk = {
+            (name, i * df_rhs_renamed.npartitions + j): (
+                merge_single_partitions,
+                (df_lhs_renamed._name, i),
+                (df_rhs_renamed._name, j),
+            )
+            for i in range(df_lhs_renamed.npartitions)
+            for j in range(df_rhs_renamed.npartitions)
+        }
+
+        graph = HighLevelGraph.from_collections(
+            name, dsk, dependencies=[df_lhs_renamed, df_rhs_renamed]
+        )
+
+        # TODO: Do we know the divisions in any way here?
+        divisions = [None] * (len(dsk) + 1)
+        df = dd.DataFrame(graph, name, meta=meta.iloc[:0], divisions=divisions)
+
+        warnings.warn(
+            "Need to do a cross-join, which is typically very resource heavy",
+            ResourceWarning,
+        )
+        return df
+
+    def _join_on_ranges(
+        self,
+        df_lhs_renamed: dd.DataFrame,
+        df_rhs_renamed: dd.DataFrame,
+        band: Tuple[str, int, List[int], List[int]],
+        partition_filter: PartitionFilter,
+        meta: pd.DataFrame,
+    ) -> dd.DataFrame:
+        """
+        Band join: one column of one side (the "points") is compared to one
+        or more columns of the other side (the lower and upper bounds of the "intervals").
+        The value range of the points is split into buckets (using approximate quantiles),
+        every point is shuffled to its bucket and every interval to all buckets it overlaps.
+        Only the partitions of the same bucket are merged - by sorting the points
+        and searching the bounds of every interval in them.
+        The full filter is applied on the merged rows afterwards, which also takes
+        care of strict bounds and the remaining conditions.
+        Rows with NULL in the compared columns can never match.
+        """
+        points_side, point_index, lower_indices, upper_indices = band
+        if points_side == "lhs":
+            points, intervals = df_lhs_renamed, df_rhs_renamed
+        else:
+            points, intervals = df_rhs_renamed, df_lhs_renamed
+
+        point_column = points.columns[point_index]
+        lower_columns = [intervals.columns[index] for index in lower_indices]
+        upper_columns = [intervals.columns[index] for index in upper_indices]
+        logger.debug(
+            f"Band join of {points_side} column {point_column} "
+            f"between {lower_columns} and {upper_columns}"
+        )
+
+        # Split the points into (roughly) equally large buckets.
+        # The bounds of the buckets are only computed together with the join
+        # (and only once for both sides). If some of them are equal,
+        # the buckets in between just stay empty.
+        point_dtype = _get_numpy_dtype(points[point_column].dtype)
+        nbuckets = max(points.npartitions, intervals.npartitions)
+        bucket_bounds = np.array([], dtype=point_dtype)
+        if nbuckets > 1:
+            quantiles = np.linspace(0, 1, nbuckets + 1)[1:-1]
+            bucket_bounds = (
+                points[point_column]
+                .dropna()
+                .astype(point_dtype)
+                .quantile(quantiles)
+                .to_delayed(optimize_graph=False)[0]
+            )
+
+        # dask only uses the values of a column directly as partition numbers
+        # (instead of hashing them), if it has this name.
+        # It can not clash with the (renamed) columns of lhs and rhs.
+        partition_column = "_partitions"
+        points = points.map_partitions(
+            make_pickable_without_dask_sql(_assign_point_buckets),
+            point_column,
+            bucket_bounds,
+            partition_column,
+            meta=points._meta.assign(**{partition_column: np.int64()}),
+        )
+        intervals = intervals.map_partitions(
+            make_pickable_without_dask_sql(_assign_interval_buckets),
+            lower_columns,
+            upper_columns,
+            bucket_bounds,
+            partition_column,
+            meta=intervals._meta.assign(**{partition_column: np.int64()}),
+        )
+
+        shuffle = dask.config.get("shuffle", None) or "tasks"
+        points = rearrange_by_column(
+            points, partition_column, npartitions=nbuckets, shuffle=shuffle
+        )
+        intervals = rearrange_by_column(
+            intervals, partition_column, npartitions=nbuckets, shuffle=shuffle
+        )
+
+        merge_bucket = make_pickable_without_dask_sql(
+            partial(
+                _merge_bucket,
+                point_column=point_column,
+                lower_columns=lower_columns,
+                upper_columns=upper_columns,
+                partition_column=partition_column,
+                points_are_lhs=points_side == "lhs",
+                partition_filter=partition_filter,
+            )
+        )
+
+        name = "band-join-" + tokenize(points, intervals, partition_filter)
+        dsk = {
+            (name, i): (merge_bucket, (points._name, i), (intervals._name, i))
+            for i in range(nbuckets)
+        }
+        graph = HighLevelGraph.from_collections(
+            name, dsk, dependencies=[points, intervals]
+        )
+        return dd.DataFrame(
+            graph, name, meta=meta.iloc[:0], divisions=[None] * (nbuckets + 1)
+        )
+
+    @staticmethod
+    def _get_band(
+        df_lhs_renamed: dd.DataFrame,
+        df_rhs_renamed: dd.DataFrame,
+        range_on: List[Tuple[int, int, str]],
+    ) -> Union[Tuple[str, int, List[int], List[int]], None]:
+        """
+        Choose the column, which is compared to the most columns
+        of the other side (preferably from below and above).
+        Return its side, its index and the indices of the lower and upper bounds
+        (on the other side) - or None, if no column can be used for a band join
+        (only numerical and datetime columns can be split into ranges).
+        """
+        dfs = {"lhs": df_lhs_renamed, "rhs": df_rhs_renamed}
+        bounds = {}
+        for lhs_index, rhs_index, operator_name in range_on:
+            # lhs_index <operator> rhs_index
+            rhs_is_lower_bound = operator_name in (">", ">=")
+            lhs_bounds = bounds.setdefault(("lhs", lhs_index), ([], []))
+            rhs_bounds = bounds.setdefault(("rhs", rhs_index), ([], []))
+            if rhs_is_lower_bound:
+                lhs_bounds[0].append(rhs_index)
+                rhs_bounds[1].append(lhs_index)
+            else:
+                lhs_bounds[1].append(rhs_index)
+                rhs_bounds[0].append(lhs_index)
+
+        def get_kind(side, index):
+            dtype = dfs[side].dtypes.iloc[index]
+            if pd.api.types.is_datetime64_dtype(dtype):
+                return "datetime"
+            if pd.api.types.is_numeric_dtype(dtype) and not (
+                pd.api.types.is_bool_dtype(dtype)
+            ):
+                return "numeric"
+            return None
+
+        candidates = []
+        for (side, index), (lower, upper) in bounds.items():
+            other_side = "rhs" if side == "lhs" else "lhs"
+            kind = get_kind(side, index)
+            if kind is None or any(
+                get_kind(other_side, bound) != kind for bound in lower + upper
+            ):
+                continue
+            candidates.append(
+                ((bool(lower) and bool(upper), len(lower) + len(upper)), side, index)
+            )
+
+        if not candidates:
+            return None
+
+        # max returns the first of equally good candidates
+        _, side, index = max(candidates, key=lambda candidate: candidate[0])
+        lower, upper = bounds[(side, index)]
+        return side, index, lower, upper
+
     def _split_join_condition(
         self, join_condition: "org.apache.calcite.rex.RexCall"
-    ) -> Tuple[List[str], List[str], List["org.apache.calcite.rex.RexCall"]]:
+    ) -> Tuple[
+        List[int],
+        List[int],
+        List[Tuple[int, int, str]],
+        List["org.apache.calcite.rex.RexCall"],
+    ]:
 
         if isinstance(join_condition, org.apache.calcite.rex.RexLiteral):
-            return [], [], [join_condition]
+            return [], [], [], [join_condition]
         elif not isinstance(join_condition, org.apache.calcite.rex.RexCall):
             raise NotImplementedError("Can not understand join condition.")
 
         # Simplest case: ... ON lhs.a == rhs.b
         try:
             lhs_on, rhs_on = self._extract_lhs_rhs(join_condition)
-            return [lhs_on], [rhs_on], None
+            return [lhs_on], [rhs_on], [], None
+        except AssertionError:
+            pass
+
+        # Range condition: ... ON lhs.a < rhs.b
+        # (the condition itself still needs to be applied as filter)
+        try:
+            range_on = self._extract_range(join_condition)
+            return [], [], [range_on], [join_condition]
         except AssertionError:
             pass
 
@@ -262,9 +925,11 @@ class LogicalJoinPlugin(BaseRelPlugin):
         operands = join_condition.getOperands()
         # More complicated: ... ON X AND Y AND Z.
         # We can map this if one of them is again a "="
+        # or at least a range condition.
         if operator_name == "AND":
             lhs_on = []
             rhs_on = []
+            range_on = []
             filter_condition = []
 
             for operand in operands:
@@ -276,12 +941,19 @@ class LogicalJoinPlugin(BaseRelPlugin):
                 except AssertionError:
                     pass
 
+                try:
+                    range_on.append(self._extract_range(operand))
+                except AssertionError:
+                    pass
+
                 filter_condition.append(operand)
 
             if lhs_on and rhs_on:
-                return lhs_on, rhs_on, filter_condition
+                return lhs_on, rhs_on, range_on, filter_condition
+            if range_on:
+                return [], [], range_on, [join_condition]
 
-        return [], [], [join_condition]
+        return [], [], [], [join_condition]
 
     def _extract_lhs_rhs(self, rex):
         operator_name = str(rex.getOperator().getName())
@@ -311,3 +983,213 @@ class LogicalJoinPlugin(BaseRelPlugin):
         raise AssertionError(
             "Invalid join condition"
         )  # pragma: no cover. Do not how how it could be triggered.
+
+    # How a comparison changes, if its operands are swapped
+    SWAPPED_RANGE_OPERATORS = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}
+
+    def _extract_range(self, rex) -> Tuple[int, int, str]:
+        """
+        Return the indices of the lhs and rhs column and the operator
+        of a comparison lhs.a <operator> rhs.b (swapping the operator if needed)
+        """
+        operator_name = str(rex.getOperator().getName())
+        assert operator_name in self.SWAPPED_RANGE_OPERATORS
+
+        operands = rex.getOperands()
+        assert len(operands) == 2
+
+        operand_lhs = operands[0]
+        operand_rhs = operands[1]
+
+        assert isinstance(operand_lhs, org.apache.calcite.rex.RexInputRef)
+        assert isinstance(operand_rhs, org.apache.calcite.rex.RexInputRef)
+
+        lhs_index = operand_lhs.getIndex()
+        rhs_index = operand_rhs.getIndex()
+        assert lhs_index != rhs_index
+
+        # Same trick as for the equijoin: the rhs columns always come last
+        if lhs_index > rhs_index:
+            lhs_index, rhs_index = rhs_index, lhs_index
+            operator_name = self.SWAPPED_RANGE_OPERATORS[operator_name]
+
+        return lhs_index, rhs_index, operator_name
+
+
+def _merge_with_broadcast(
+    partition: pd.DataFrame,
+    small_partition: pd.DataFrame,
+    on: List[str],
+    join_type: str,
+    small_is_lhs: bool,
+) -> pd.DataFrame:
+    """Merge a single partition with the broadcasted side of the join"""
+    if small_is_lhs:
+        return small_partition.merge(partition, on=on, how=join_type)
+    return partition.merge(small_partition, on=on, how=join_type)
+
+
+def _merge_partitions(
+    lhs_partition: pd.DataFrame,
+    rhs_partition: pd.DataFrame,
+    on: List[str],
+    join_type: str,
+) -> pd.DataFrame:
+    """Merge two partitions, which contain the same range of join values"""
+    return lhs_partition.merge(rhs_partition, on=on, how=join_type)
+
+
+def _get_unmatched_rows(
+    partition: pd.DataFrame,
+    matched_ids: pd.Series,
+    row_id_column: str,
+    other_meta: pd.DataFrame,
+    side_is_lhs: bool,
+) -> pd.DataFrame:
+    """Return the rows without a match, with NULLs in all columns of the other side"""
+    partition = partition[~partition[row_id_column].isin(matched_ids)]
+    partition = partition.drop(columns=[row_id_column])
+    other_partition = other_meta.reindex(partition.index)
+
+    if side_is_lhs:
+        return pd.concat([partition, other_partition], axis=1)
+    return pd.concat([other_partition, partition], axis=1)
+
+
+def _filter_by_row_ids(
+    partition: pd.DataFrame, matched_ids: pd.Series, row_id_column: str, anti: bool
+) -> pd.DataFrame:
+    """Return the rows with (or with anti: without) a match"""
+    is_matched = partition[row_id_column].isin(matched_ids)
+    return partition[~is_matched if anti else is_matched]
+
+
+def _filter_by_keys(
+    partition: pd.DataFrame, keys: pd.DataFrame, on: List[int], anti: bool
+) -> pd.DataFrame:
+    """
+    Return the rows, whose values in the columns with the on indices
+    are (or with anti: are not) one of the rows of keys
+    """
+    if len(on) == 1:
+        is_matched = partition.iloc[:, on[0]].isin(keys.iloc[:, 0])
+    else:
+        values = pd.MultiIndex.from_arrays([partition.iloc[:, index] for index in on])
+        is_matched = values.isin(list(keys.itertuples(index=False, name=None)))
+
+    # NULLs are never part of the keys, so they never match
+    return partition[~is_matched if anti else is_matched]
+
+
+def _get_bucket_bounds(quantiles: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """The sorted and unique (non-NULL) bounds of the buckets"""
+    return np.unique(pd.Series(quantiles).dropna().values)
+
+
+def _assign_point_buckets(
+    partition: pd.DataFrame,
+    point_column: str,
+    bucket_bounds: Union[pd.Series, np.ndarray],
+    partition_column: str,
+) -> pd.DataFrame:
+    """Assign every row to the bucket of its point (dropping NULLs)"""
+    bucket_bounds = _get_bucket_bounds(bucket_bounds)
+    partition = partition.dropna(subset=[point_column])
+    buckets = np.searchsorted(
+        bucket_bounds, _get_values(partition, [point_column], np.maximum), side="right"
+    )
+    return partition.assign(**{partition_column: buckets.astype(np.int64)})
+
+
+def _assign_interval_buckets(
+    partition: pd.DataFrame,
+    lower_columns: List[str],
+    upper_columns: List[str],
+    bucket_bounds: Union[pd.Series, np.ndarray],
+    partition_column: str,
+) -> pd.DataFrame:
+    """Repeat every row for all buckets its interval overlaps (dropping NULLs)"""
+    bucket_bounds = _get_bucket_bounds(bucket_bounds)
+    partition = partition.dropna(subset=lower_columns + upper_columns)
+
+    first_bucket = np.zeros(len(partition), dtype=np.int64)
+    last_bucket = np.full(len(partition), len(bucket_bounds), dtype=np.int64)
+    if lower_columns:
+        lower = _get_values(partition, lower_columns, np.maximum)
+        first_bucket = np.searchsorted(bucket_bounds, lower, side="right")
+    if upper_columns:
+        upper = _get_values(partition, upper_columns, np.minimum)
+        last_bucket = np.searchsorted(bucket_bounds, upper, side="right")
+
+    counts = (last_bucket - first_bucket + 1).clip(min=0)
+    rows = np.repeat(np.arange(len(partition)), counts)
+    buckets = np.repeat(first_bucket, counts) + _ranges(counts)
+
+    return partition.iloc[rows].assign(**{partition_column: buckets.astype(np.int64)})
+
+
+def _merge_bucket(
+    points: pd.DataFrame,
+    intervals: pd.DataFrame,
+    point_column: str,
+    lower_columns: List[str],
+    upper_columns: List[str],
+    partition_column: str,
+    points_are_lhs: bool,
+    partition_filter: PartitionFilter,
+) -> pd.DataFrame:
+    """Merge all points with the intervals they (might) lie in"""
+    points = points.drop(columns=[partition_column])
+    intervals = intervals.drop(columns=[partition_column])
+
+    points = points.sort_values(point_column, kind="mergesort")
+    values = _get_values(points, [point_column], np.maximum)
+
+    # The bounds are used inclusively here, the filter takes care of the rest
+    start = np.zeros(len(intervals), dtype=np.int64)
+    end = np.full(len(intervals), len(points), dtype=np.int64)
+    if lower_columns:
+        lower = _get_values(intervals, lower_columns, np.maximum)
+        start = np.searchsorted(values, lower, side="left")
+    if upper_columns:
+        upper = _get_values(intervals, upper_columns, np.minimum)
+        end = np.searchsorted(values, upper, side="right")
+
+    counts = (end - start).clip(min=0)
+    interval_rows = np.repeat(np.arange(len(intervals)), counts)
+    point_rows = np.repeat(start, counts) + _ranges(counts)
+
+    points = points.iloc[point_rows].reset_index(drop=True)
+    intervals = intervals.iloc[interval_rows].reset_index(drop=True)
+    if points_are_lhs:
+        merged_data = pd.concat([points, intervals], axis=1)
+    else:
+        merged_data = pd.concat([intervals, points], axis=1)
+
+    return partition_filter(merged_data)
+
+
+def _get_values(
+    partition: pd.DataFrame, columns: List[str], reduce_function: np.ufunc
+) -> np.ndarray:
+    """
+    Combine the given columns (without NULLs) element-wise
+    into a single numpy array (e.g. the maximum of all lower bounds)
+    """
+    return reduce_function.reduce(
+        [
+            partition[column].to_numpy(dtype=_get_numpy_dtype(partition[column].dtype))
+            for column in columns
+        ]
+    )
+
+
+def _get_numpy_dtype(dtype) -> np.dtype:
+    """The numpy dtype of a (nullable) pandas dtype"""
+    return getattr(dtype, "numpy_dtype", dtype)
+
+
+def _ranges(counts: np.ndarray) -> np.ndarray:
+    """Concatenation of 0, ..., count - 1 for all given counts"""
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(offsets.size) - offsets
@@ -35,26 +35,28 @@ class LogicalProjectPlugin(BaseRelPlugin):
         column_names = []
         new_columns = {}
         new_mappings = {}
-        for expr, key in named_projects:
-            key = str(key)
-            column_names.append(key)
+        # Identical (sub-)expressions in multiple columns are only computed once
+        with RexConverter.memoize(context):
+            for expr, key in named_projects:
+                key = str(key)
+                column_names.append(key)
 
-            # shortcut: if we have a column already, there is no need to re-assign it again
-            # this is only the case if the expr is a RexInputRef
-            if isinstance(expr, org.apache.calcite.rex.RexInputRef):
-                index = expr.getIndex()
-                backend_column_name = cc.get_backend_by_frontend_index(index)
-                logger.debug(
-                    f"Not re-adding the same column {key} (but just referencing it)"
-                )
-                new_mappings[key] = backend_column_name
-            else:
-                random_name = new_temporary_column(df)
-                new_columns[random_name] = RexConverter.convert(
-                    expr, dc, context=context
-                )
-                logger.debug(f"Adding a new column {key} out of {expr}")
-                new_mappings[key] = random_name
+                # shortcut: if we have a column already, there is no need to re-assign it again
+                # this is only the case if the expr is a RexInputRef
+                if isinstance(expr, org.apache.calcite.rex.RexInputRef):
+                    index = expr.getIndex()
+                    backend_column_name = cc.get_backend_by_frontend_index(index)
+                    logger.debug(
+                        f"Not re-adding the same column {key} (but just referencing it)"
+                    )
+                    new_mappings[key] = backend_column_name
+                else:
+                    random_name = new_temporary_column(df)
+                    new_columns[random_name] = RexConverter.convert(
+                        expr, dc, context=context
+                    )
+                    logger.debug(f"Adding a new column {key} out of {expr}")
+                    new_mappings[key] = random_name
 
         # Actually add the new columns
         if new_columns:
@@ -67,7 +69,8 @@ class LogicalProjectPlugin(BaseRelPlugin):
         # Make sure the order is correct
         cc = cc.limit_to(column_names)
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
-        dc = DataContainer(df, cc)
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
+        # The backend columns (and therefore the partitioning) are unchanged
+        dc = DataContainer(df, cc, partitioning=dc.partitioning)
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
         return dc
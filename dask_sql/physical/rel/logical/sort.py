@@ -3,7 +3,7 @@ from typing import List
 import dask
 import dask.dataframe as dd
 
-from dask_sql.datacontainer import DataContainer
+from dask_sql.datacontainer import DataContainer, Partitioning
 from dask_sql.java import org
 from dask_sql.physical.rel.base import BaseRelPlugin
 from dask_sql.physical.rex import RexConverter
@@ -27,6 +27,7 @@ class LogicalSortPlugin(BaseRelPlugin):
         (dc,) = self.assert_inputs(rel, 1, context)
         df = dc.df
         cc = dc.column_container
+        partitioning = dc.partitioning
 
         sort_collation = rel.getCollation().getFieldCollations()
         sort_columns = [
@@ -41,7 +42,14 @@ class LogicalSortPlugin(BaseRelPlugin):
             sort_null_first = [x.nullDirection == FIRST for x in sort_collation]
 
             df = df.persist()
-            df = apply_sort(df, sort_columns, sort_ascending, sort_null_first)
+            df, divisions = apply_sort(
+                df, sort_columns, sort_ascending, sort_null_first
+            )
+            partitioning = (
+                Partitioning(sort_columns[0], divisions)
+                if divisions is not None
+                else None
+            )
 
         offset = rel.offset
         if offset:
@@ -57,9 +65,9 @@ class LogicalSortPlugin(BaseRelPlugin):
         if offset is not None or end is not None:
             df = self._apply_offset(df, offset, end)
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
         # No column type has changed, so no need to cast again
-        return DataContainer(df, cc)
+        return DataContainer(df, cc, partitioning=partitioning)
 
     def _apply_offset(self, df: dd.DataFrame, offset: int, end: int) -> dd.DataFrame:
         """
@@ -1,7 +1,13 @@
+import logging
 from typing import Dict
 
+import dask.dataframe as dd
+
 from dask_sql.datacontainer import DataContainer
 from dask_sql.physical.rel.base import BaseRelPlugin
+from dask_sql.physical.rel.pushdown import to_parquet_filters
+
+logger = logging.getLogger(__name__)
 
 
 class LogicalTableScanPlugin(BaseRelPlugin):
@@ -14,6 +20,12 @@ class LogicalTableScanPlugin(BaseRelPlugin):
     We need to get the dask dataframe from the registered
     tables and return the requested columns from it.
     Calcite will always refer to columns via index.
+
+    If the table can be read in again from its source (e.g. parquet files),
+    only the columns used in the query are read in.
+    Simple conditions of a filter on top of the table scan
+    are additionally used to skip files and row groups
+    (based on the parquet statistics).
     """
 
     class_name = "org.apache.calcite.rel.logical.LogicalTableScan"
@@ -36,15 +48,49 @@ class LogicalTableScanPlugin(BaseRelPlugin):
         table_name = table_name.lower()
 
         dc = context.schema[schema_name].tables[table_name]
-        df = dc.df
         cc = dc.column_container
 
+        if dc.source is not None:
+            df = self._read_from_source(rel, dc, context)
+        else:
+            df = dc.df
+        # Only the registered data (and not a newly read subset) is partitioned
+        partitioning = dc.partitioning if df is dc._df else None
+
         # Make sure we only return the requested columns
         row_type = table.getRowType()
         field_specifications = [str(f) for f in row_type.getFieldNames()]
         cc = cc.limit_to(field_specifications)
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
-        dc = DataContainer(df, cc)
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
+        dc = DataContainer(df, cc, partitioning=partitioning)
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
         return dc
+
+    @staticmethod
+    def _read_from_source(
+        rel: "org.apache.calcite.rel.RelNode",
+        dc: DataContainer,
+        context: "dask_sql.Context",
+    ) -> dd.DataFrame:
+        """Read the table again from its source with only the needed columns and rows"""
+        cc = dc.column_container
+        rel_id = BaseRelPlugin.get_rel_id(rel, context)
+
+        columns = None
+        required_columns = context._required_columns.get(rel_id)
+        if required_columns is not None and dc.source.supports_columns:
+            # We still need to read at least a single column
+            # to know the number of rows
+            required_columns = sorted(required_columns) or [0]
+            columns = [cc.get_backend_by_frontend_index(i) for i in required_columns]
+
+        filters = None
+        if dc.source.supports_filters and context._filters.get(rel_id):
+            filters = to_parquet_filters(context._filters[rel_id], cc, dc.meta)
+
+        if columns is None and not filters:
+            return dc.df
+
+        logger.debug(f"Reading table with columns {columns} and filters {filters}")
+        return dc.source.read(columns=columns, filters=filters or None)
@@ -25,7 +25,7 @@ class LogicalUnionPlugin(BaseRelPlugin):
         second_cc = second_dc.column_container
 
         # For concatenating, they should have exactly the same fields
-        output_field_names = [str(x) for x in rel.getRowType().getFieldNames()]
+        output_field_names = self.get_row_type(rel, context).field_names
         assert len(first_cc.columns) == len(output_field_names)
         first_cc = first_cc.rename(
             columns={
@@ -60,7 +60,7 @@ class LogicalUnionPlugin(BaseRelPlugin):
             df = df.drop_duplicates()
 
         cc = ColumnContainer(df.columns)
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
         dc = DataContainer(df, cc)
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
         return dc
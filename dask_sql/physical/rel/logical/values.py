@@ -48,13 +48,13 @@ class LogicalValuesPlugin(BaseRelPlugin):
         if rows:
             df = pd.DataFrame(rows)
         else:
-            field_names = [str(x) for x in rel.getRowType().getFieldNames()]
+            field_names = self.get_row_type(rel, context).field_names
             df = pd.DataFrame(columns=field_names)
 
         df = dd.from_pandas(df, npartitions=1)
         cc = ColumnContainer(df.columns)
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
         dc = DataContainer(df, cc)
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
         return dc
@@ -11,6 +11,7 @@ from pandas.core.window.indexers import BaseIndexer
 from dask_sql.datacontainer import ColumnContainer, DataContainer
 from dask_sql.java import org
 from dask_sql.physical.rel.base import BaseRelPlugin
+from dask_sql.physical.rel.plan import to_row_type
 from dask_sql.physical.rex.convert import RexConverter
 from dask_sql.physical.rex.core.literal import RexLiteralPlugin
 from dask_sql.physical.utils.groupby import get_groupby_with_nulls_cols
@@ -80,7 +81,7 @@ class BoundDescription(
 
 def to_bound_description(
     java_window: "org.apache.calcite.rex.RexWindowBounds.RexBoundedWindowBound",
-    constants: List[org.apache.calcite.rex.RexLiteral],
+    constants: List["org.apache.calcite.rex.RexLiteral"],
     constant_count_offset: int,
 ) -> BoundDescription:
     """Convert the java object "java_window" to a python representation,
@@ -245,7 +246,7 @@ class LogicalWindowPlugin(BaseRelPlugin):
         constant_count_offset = len(dc.column_container.columns)
 
         # Output to the right field names right away
-        field_names = rel.getRowType().getFieldNames()
+        field_names = to_row_type(self.get_row_type(rel, context)).field_names
 
         for window in rel.groups:
             dc = self._apply_window(
@@ -256,16 +257,16 @@ class LogicalWindowPlugin(BaseRelPlugin):
         df = dc.df
         cc = dc.column_container
 
-        cc = self.fix_column_to_row_type(cc, rel.getRowType())
+        cc = self.fix_column_to_row_type(cc, self.get_row_type(rel, context))
         dc = DataContainer(df, cc)
-        dc = self.fix_dtype_to_row_type(dc, rel.getRowType())
+        dc = self.fix_dtype_to_row_type(dc, self.get_row_type(rel, context))
 
         return dc
 
     def _apply_window(
         self,
-        window: org.apache.calcite.rel.core.Window.Group,
-        constants: List[org.apache.calcite.rex.RexLiteral],
+        window: "org.apache.calcite.rel.core.Window.Group",
+        constants: List["org.apache.calcite.rex.RexLiteral"],
         constant_count_offset: int,
         dc: DataContainer,
         field_names: List[str],
@@ -335,7 +336,7 @@ class LogicalWindowPlugin(BaseRelPlugin):
     def _extract_groupby(
         self,
         df: dd.DataFrame,
-        window: org.apache.calcite.rel.core.Window.Group,
+        window: "org.apache.calcite.rel.core.Window.Group",
         dc: DataContainer,
         context: "dask_sql.Context",
     ) -> Tuple[dd.DataFrame, str]:
@@ -359,7 +360,7 @@ class LogicalWindowPlugin(BaseRelPlugin):
         return df, group_columns
 
     def _extract_ordering(
-        self, window: org.apache.calcite.rel.core.Window.Group, cc: ColumnContainer
+        self, window: "org.apache.calcite.rel.core.Window.Group", cc: ColumnContainer
     ) -> Tuple[str, str, str]:
         """Prepare sorting information we can later use while applying the main function"""
         order_keys = list(window.orderKeys.getFieldCollations())
@@ -377,7 +378,7 @@ class LogicalWindowPlugin(BaseRelPlugin):
 
     def _extract_operations(
         self,
-        window: org.apache.calcite.rel.core.Window.Group,
+        window: "org.apache.calcite.rel.core.Window.Group",
         df: dd.DataFrame,
         dc: DataContainer,
         context: "dask_sql.Context",
@@ -0,0 +1,121 @@
+import json
+import logging
+from collections import namedtuple
+from typing import Dict, Union
+
+from dask.base import tokenize
+
+from dask_sql import java as java_classes
+from dask_sql.java import org
+
+logger = logging.getLogger(__name__)
+
+# Field names and (SQL) types of the output of a rel
+RowType = namedtuple("RowType", ["field_names", "field_types"])
+
+# A hint given in the SQL query, e.g. /*+ BROADCAST(t) */
+RelHint = namedtuple("RelHint", ["name", "options"])
+
+# Everything the converters need to know about a rel, which is
+# not the rel itself (e.g. its expressions):
+# the java class name, the ids of its inputs, its row type, the (one-line) string
+# representation of the rel itself, a key identifying it together with all its inputs,
+# if its own expressions are deterministic and its hints.
+RelInfo = namedtuple(
+    "RelInfo",
+    [
+        "class_name",
+        "inputs",
+        "row_type",
+        "explain",
+        "subplan_key",
+        "deterministic",
+        "hints",
+    ],
+)
+
+
+def get_plan_info(rel: "org.apache.calcite.rel.RelNode") -> Dict[int, RelInfo]:
+    """
+    Return the information of all rels in the given relational algebra
+    by their id. All of it is exported from java with a single call
+    (instead of many single calls per rel).
+    """
+    if not isinstance(rel, org.apache.calcite.rel.RelNode):
+        return {}
+
+    plan_json = str(
+        java_classes.RelationalAlgebraGenerator.getRelationalAlgebraJson(rel)
+    )
+    rel_infos = {
+        int(rel_id): rel_info for rel_id, rel_info in json.loads(plan_json).items()
+    }
+
+    # Identical sub-plans have the same key, independent of the ids of their rels.
+    # The keys of the inputs are hashed instead of nested, so every rel
+    # is only visited once (instead of once per parent).
+    subplan_keys = {}
+
+    def get_subplan_key(rel_id):
+        if rel_id not in subplan_keys:
+            rel_info = rel_infos[rel_id]
+            subplan_keys[rel_id] = tokenize(
+                rel_info["explain"],
+                [get_subplan_key(int(input_id)) for input_id in rel_info["inputs"]],
+            )
+        return subplan_keys[rel_id]
+
+    return {
+        rel_id: RelInfo(
+            class_name=rel_info["class"],
+            inputs=[int(input_id) for input_id in rel_info["inputs"]],
+            row_type=RowType(rel_info["fieldNames"], rel_info["fieldTypes"]),
+            explain=rel_info["explain"],
+            subplan_key=get_subplan_key(rel_id),
+            deterministic=rel_info["deterministic"],
+            hints=[
+                RelHint(hint["name"].upper(), [str(o) for o in hint["options"]])
+                for hint in rel_info["hints"]
+            ],
+        )
+        for rel_id, rel_info in rel_infos.items()
+    }
+
+
+def get_plan_rels(
+    rel: "org.apache.calcite.rel.RelNode", plan_info: Dict[int, RelInfo]
+) -> Dict[int, "org.apache.calcite.rel.RelNode"]:
+    """
+    Return all rels of the given relational algebra by their id,
+    with the root first. Java exports them in the same order
+    as the plan info, so their ids do not need to be asked for one by one.
+    """
+    if not plan_info:
+        return {}
+
+    rels = java_classes.RelationalAlgebraGenerator.getRelationalAlgebraNodes(rel)
+    return dict(zip(plan_info, rels))
+
+
+def is_deterministic(rel_id: int, plan_info: Dict[int, RelInfo]) -> bool:
+    """Check if the rel with the given id and all its inputs are deterministic"""
+    rel_info = plan_info[rel_id]
+    return rel_info.deterministic and all(
+        is_deterministic(input_id, plan_info) for input_id in rel_info.inputs
+    )
+
+
+def to_row_type(
+    row_type: Union[RowType, "org.apache.calcite.rel.type.RelDataType"]
+) -> RowType:
+    """Turn a java row type into its python counterpart (if needed)"""
+    if isinstance(row_type, RowType):
+        return row_type
+
+    field_names = []
+    field_types = []
+    for field in row_type.getFieldList():
+        field_names.append(str(field.getName()))
+        field_types.append(str(field.getType()))
+
+    return RowType(field_names, field_types)
@@ -0,0 +1,278 @@
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from dask_sql.datacontainer import ColumnContainer
+from dask_sql.java import get_java_class, org
+from dask_sql.mappings import sql_to_python_value
+from dask_sql.physical.rex.core.literal import SargPythonImplementation
+
+logger = logging.getLogger(__name__)
+
+RequiredColumns = Union[Set[int], None]
+Filter = Tuple[int, str, Any]
+
+_COMPARISON_OPERATORS = {
+    "EQUALS": "==",
+    "NOT_EQUALS": "!=",
+    "LESS_THAN": "<",
+    "LESS_THAN_OR_EQUAL": "<=",
+    "GREATER_THAN": ">",
+    "GREATER_THAN_OR_EQUAL": ">=",
+}
+# Needed if the literal is on the left side of the comparison
+_FLIPPED_OPERATORS = {
+    "==": "==",
+    "!=": "!=",
+    "<": ">",
+    "<=": ">=",
+    ">": "<",
+    ">=": "<=",
+}
+
+
+def get_required_columns(
+    rel: "org.apache.calcite.rel.RelNode",
+) -> Dict[int, RequiredColumns]:
+    """
+    Find out which columns of the scanned tables are really used
+    in the given relational algebra.
+    Returns a dictionary from the id of every table scan
+    to the set of needed column indices - or None, if all columns
+    are needed.
+
+    Only projections and aggregations reduce the set of needed columns,
+    as they are the only steps which just access the columns they
+    reference. Filters keep all columns of their input (and therefore
+    pass on the requirements of the following step).
+    Every other step (e.g. joins) is assumed to need all of its input columns.
+    """
+    required_columns = {}
+
+    if isinstance(rel, org.apache.calcite.rel.RelNode):
+        _collect_required_columns(rel, None, required_columns)
+
+    return required_columns
+
+
+def _collect_required_columns(
+    rel: "org.apache.calcite.rel.RelNode",
+    columns: RequiredColumns,
+    required_columns: Dict[int, RequiredColumns],
+):
+    """Recursively pass the needed columns of the given rel down to its inputs"""
+    class_name = get_java_class(rel)
+
+    if class_name == "org.apache.calcite.rel.logical.LogicalTableScan":
+        rel_id = int(rel.getId())
+        if rel_id in required_columns:
+            # The same scan is used in multiple places
+            previous_columns = required_columns[rel_id]
+            if previous_columns is None or columns is None:
+                columns = None
+            else:
+                columns = previous_columns | columns
+
+        required_columns[rel_id] = columns
+        return
+
+    if class_name == "org.apache.calcite.rel.logical.LogicalProject":
+        input_columns = _to_set(
+            org.apache.calcite.plan.RelOptUtil.InputFinder.bits(rel.getProjects(), None)
+        )
+    elif class_name == "org.apache.calcite.rel.logical.LogicalAggregate":
+        input_columns = _to_set(rel.getGroupSet())
+        for agg_call in rel.getAggCallList():
+            input_columns |= _to_set(agg_call.getArgList())
+            if agg_call.filterArg >= 0:
+                input_columns.add(int(agg_call.filterArg))
+    elif class_name == "org.apache.calcite.rel.logical.LogicalFilter":
+        if columns is None:
+            input_columns = None
+        else:
+            input_columns = columns | _to_set(
+                org.apache.calcite.plan.RelOptUtil.InputFinder.bits(rel.getCondition())
+            )
+    else:
+        input_columns = None
+
+    for input_rel in rel.getInputs():
+        _collect_required_columns(input_rel, input_columns, required_columns)
+
+
+def _to_set(indices: Iterable) -> Set[int]:
+    return {int(index) for index in indices}
+
+
+def get_filters(rel: "org.apache.calcite.rel.RelNode",) -> Dict[int, Set[Filter]]:
+    """
+    Find the conditions, which every row of the scanned tables
+    needs to fulfill in the given relational algebra.
+    Returns a dictionary from the id of every table scan
+    to a set of (column index, operator, value) tuples
+    (which are all combined with AND).
+
+    Only the simple parts (comparisons with a literal, IN and ranges)
+    of a filter directly on top of the table scan are used.
+    The filter itself is still applied afterwards, so it does not matter
+    if not all of its conditions can be extracted.
+    """
+    filters = {}
+
+    if isinstance(rel, org.apache.calcite.rel.RelNode):
+        _collect_filters(rel, set(), filters)
+
+    return filters
+
+
+def to_parquet_filters(
+    filters: Set[Filter], cc: ColumnContainer, meta: pd.DataFrame
+) -> List[Tuple[str, str, Any]]:
+    """
+    Turn the filters returned by :func:`get_filters` into the format
+    understood by ``read_parquet``.
+    Filters with values, which can not be compared with the
+    data type of the column, are skipped.
+    """
+    parquet_filters = []
+    for index, operator, value in sorted(filters, key=str):
+        column = cc.get_backend_by_frontend_index(index)
+        dtype = meta[column].dtype
+
+        if operator == "in":
+            values = [_to_column_value(v, dtype) for v in value]
+            if any(v is None for v in values):
+                continue
+            value = values
+        else:
+            value = _to_column_value(value, dtype)
+            if value is None:
+                continue
+
+        parquet_filters.append((column, operator, value))
+
+    return parquet_filters
+
+
+def _collect_filters(
+    rel: "org.apache.calcite.rel.RelNode",
+    parent_filters: Set[Filter],
+    filters: Dict[int, Set[Filter]],
+):
+    """Recursively collect the filters directly on top of a table scan"""
+    class_name = get_java_class(rel)
+
+    if class_name == "org.apache.calcite.rel.logical.LogicalTableScan":
+        rel_id = int(rel.getId())
+        if rel_id in filters:
+            # The same scan is used in multiple places,
+            # only the common conditions are valid for all of them
+            parent_filters = filters[rel_id] & parent_filters
+
+        filters[rel_id] = parent_filters
+        return
+
+    input_filters = set()
+    if class_name == "org.apache.calcite.rel.logical.LogicalFilter":
+        for conjunction in org.apache.calcite.plan.RelOptUtil.conjunctions(
+            rel.getCondition()
+        ):
+            try:
+                input_filters.update(_to_filters(conjunction))
+            except Exception as e:  # pragma: no cover
+                # The filter is applied anyways, so this is not a problem
+                logger.debug(f"Can not use {conjunction} for filtering: {e}")
+
+    for input_rel in rel.getInputs():
+        _collect_filters(input_rel, input_filters, filters)
+
+
+def _to_filters(rex: "org.apache.calcite.rex.RexNode") -> List[Filter]:
+    """Turn a single condition into filters - if possible"""
+    if not isinstance(rex, org.apache.calcite.rex.RexCall):
+        return []
+
+    kind = str(rex.getKind())
+    operands = list(rex.getOperands())
+    if len(operands) != 2:
+        return []
+
+    left, right = operands
+    if kind in _COMPARISON_OPERATORS:
+        operator = _COMPARISON_OPERATORS[kind]
+        if isinstance(left, org.apache.calcite.rex.RexLiteral):
+            left, right = right, left
+            operator = _FLIPPED_OPERATORS[operator]
+    elif kind == "SEARCH":
+        operator = None
+    else:
+        return []
+
+    if not isinstance(left, org.apache.calcite.rex.RexInputRef) or not isinstance(
+        right, org.apache.calcite.rex.RexLiteral
+    ):
+        return []
+
+    if right.isNull():
+        return []
+
+    index = int(left.getIndex())
+    literal_type = str(right.getType())
+    literal_value = right.getValue()
+
+    if operator is not None:
+        return [(index, operator, sql_to_python_value(literal_type, literal_value))]
+
+    # NULL values would also fulfill the condition,
+    # which can not be expressed as filter
+    if str(literal_value.nullAs) == "TRUE":
+        return []
+
+    ranges = SargPythonImplementation(literal_value, literal_type).ranges
+    if literal_value.isPoints():
+        return [(index, "in", tuple(r.lower_endpoint for r in ranges))]
+
+    if len(ranges) != 1:
+        return []
+
+    (sarg_range,) = ranges
+    range_filters = []
+    if sarg_range.lower_endpoint is not None:
+        operator = ">" if sarg_range.lower_open else ">="
+        range_filters.append((index, operator, sarg_range.lower_endpoint))
+    if sarg_range.upper_endpoint is not None:
+        operator = "<" if sarg_range.upper_open else "<="
+        range_filters.append((index, operator, sarg_range.upper_endpoint))
+
+    return range_filters
+
+
+def _to_column_value(value: Any, dtype: np.dtype) -> Any:
+    """
+    Make the value comparable to the (parquet statistics of the) column
+    or return None if this is not possible.
+    """
+    if pd.api.types.is_bool_dtype(dtype):
+        return value if isinstance(value, (bool, np.bool_)) else None
+
+    if pd.api.types.is_numeric_dtype(dtype):
+        is_number = isinstance(value, (int, float, np.number))
+        return value if is_number and not isinstance(value, bool) else None
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        if not isinstance(value, datetime):
+            return None
+
+        # Our literals are always in UTC
+        value = pd.Timestamp(value)
+        if getattr(dtype, "tz", None) is None:
+            value = value.tz_convert(None)
+        return value
+
+    if pd.api.types.is_string_dtype(dtype):
+        return value if isinstance(value, str) else None
+
+    return None
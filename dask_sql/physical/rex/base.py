@@ -20,7 +20,7 @@ class BaseRexPlugin:
 
     def convert(
         self,
-        rex: org.apache.calcite.rex.RexNode,
+        rex: "org.apache.calcite.rex.RexNode",
         dc: DataContainer,
         context: "dask_sql.Context",
     ) -> Union[dd.Series, Any]:
@@ -0,0 +1,87 @@
+import logging
+import operator
+from functools import reduce
+from typing import Any, Dict, Hashable, List
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from dask.base import tokenize
+from dask.core import get
+from dask.highlevelgraph import HighLevelGraph
+from dask.optimization import cull
+
+from dask_sql.datacontainer import ColumnContainer, DataContainer
+from dask_sql.physical.rex.convert import RexConverter
+
+logger = logging.getLogger(__name__)
+
+
+class PartitionFilter:
+    """
+    A filter condition compiled into a function of a single pandas partition,
+    which returns only the rows of the partition fulfilling the condition.
+
+    The RexNodes are converted (with the usual plugins) on a placeholder
+    dataframe with a single partition. The resulting graph only consists
+    of pandas operations on this partition, so - unlike the RexNodes -
+    it can be pickled, shipped to the workers and evaluated there
+    on any partition with the same columns.
+    """
+
+    def __init__(self, graph: Dict, input_key: Hashable, output: Any, token: str):
+        self.graph = graph
+        self.input_key = input_key
+        # Either the key of the (boolean) result in the graph or a scalar
+        self.output = output
+        self.token = token
+
+    def __dask_tokenize__(self):
+        return self.token
+
+    def __call__(self, partition: pd.DataFrame) -> pd.DataFrame:
+        if self.graph is None:
+            if not self.output:
+                return partition.iloc[:0]
+            return partition
+
+        graph = dict(self.graph)
+        graph[self.input_key] = partition
+        condition = get(graph, self.output)
+
+        if np.isscalar(condition):
+            return partition if condition else partition.iloc[:0]
+
+        # In SQL, a NULL in a boolean is False on filtering
+        return partition[condition.fillna(False).astype(bool)]
+
+
+def compile_filter(
+    filter_condition: List["org.apache.calcite.rex.RexNode"],
+    cc: ColumnContainer,
+    meta: pd.DataFrame,
+    context: "dask_sql.Context",
+) -> PartitionFilter:
+    """
+    Compile the and-chained filter condition into a :class:`PartitionFilter`
+    for partitions looking like meta (with the columns given in cc).
+    """
+    token = tokenize(meta, [str(rex) for rex in filter_condition])
+    name = "filter-input-" + token
+    input_key = (name, 0)
+    graph = HighLevelGraph.from_collections(name, {input_key: meta}, dependencies=[])
+    df = dd.DataFrame(graph, name, meta.iloc[:0], divisions=[None, None])
+    dc = DataContainer(df, cc)
+
+    condition = reduce(
+        operator.and_,
+        [RexConverter.convert(rex, dc, context=context) for rex in filter_condition],
+    )
+
+    if not isinstance(condition, (dd.Series, dd.DataFrame)):
+        logger.debug(f"Filter condition {condition} does not depend on the data")
+        return PartitionFilter(None, None, condition, token)
+
+    output_key = (condition._name, 0)
+    graph, _ = cull(dict(condition.__dask_graph__()), [output_key])
+    return PartitionFilter(graph, input_key, output_key, token)
@@ -1,10 +1,13 @@
 import logging
+import time
+from contextlib import contextmanager
 from typing import Any, Union
 
 import dask.dataframe as dd
 
+from dask_sql import hooks
 from dask_sql.datacontainer import DataContainer
-from dask_sql.java import get_java_class
+from dask_sql.java import get_java_class, org
 from dask_sql.physical.rex.base import BaseRexPlugin
 from dask_sql.utils import LoggableDataFrame, Pluggable
 
@@ -46,19 +49,93 @@ class RexConverter(Pluggable):
         using the stored plugins and the dictionary of
         registered dask tables.
         """
+        if not hooks.registered_hooks:
+            return cls._convert(rex, dc, context)
+
+        start = time.perf_counter()
+        df = cls._convert(rex, dc, context)
+        duration = time.perf_counter() - start
+
+        plugin_name = cls._get_plugin_instance(rex).__class__.__name__
+        hooks.call_hooks("rex", plugin_name, str(rex), duration, df)
+
+        return df
+
+    @classmethod
+    def _convert(
+        cls,
+        rex: "org.apache.calcite.rex.RexNode",
+        dc: DataContainer,
+        context: "dask_sql.Context",
+    ) -> Union[dd.DataFrame, Any]:
+        cache_key = cls._get_cache_key(rex, dc, context)
+        if cache_key is not None and cache_key in context._rex_cache:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Re-using already converted REX {rex}")
+            return context._rex_cache[cache_key]
+
+        plugin_instance = cls._get_plugin_instance(rex)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Processing REX {rex} using {plugin_instance.__class__.__name__}..."
+            )
+
+        df = plugin_instance.convert(rex, dc, context=context)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Processed REX {rex} into {LoggableDataFrame(df)}")
+
+        if cache_key is not None:
+            context._rex_cache[cache_key] = df
+
+        return df
+
+    @classmethod
+    def _get_plugin_instance(
+        cls, rex: "org.apache.calcite.rex.RexNode"
+    ) -> BaseRexPlugin:
+        """Return the plugin converting the given rex"""
         class_name = get_java_class(rex)
 
         try:
-            plugin_instance = cls.get_plugin(class_name)
+            return cls.get_plugin(class_name)
         except KeyError:  # pragma: no cover
             raise NotImplementedError(
                 f"No conversion for class {class_name} available (yet)."
             )
 
-        logger.debug(
-            f"Processing REX {rex} using {plugin_instance.__class__.__name__}..."
-        )
+    @classmethod
+    @contextmanager
+    def memoize(cls, context: "dask_sql.Context"):
+        """
+        Within this context, identical (deterministic) expressions
+        on the same data container are only converted once
+        and the result is re-used.
+        """
+        previous_cache = context._rex_cache
+        context._rex_cache = {}
+        try:
+            yield
+        finally:
+            context._rex_cache = previous_cache
+
+    @staticmethod
+    def _get_cache_key(
+        rex: "org.apache.calcite.rex.RexNode",
+        dc: DataContainer,
+        context: "dask_sql.Context",
+    ):
+        """Return the key to cache the conversion of the rex - or None if not possible"""
+        if context is None or context._rex_cache is None:
+            return None
+
+        # Literals and column references are cheap anyways
+        if not isinstance(rex, org.apache.calcite.rex.RexCall):
+            return None
 
-        df = plugin_instance.convert(rex, dc, context=context)
-        logger.debug(f"Processed REX {rex} into {LoggableDataFrame(df)}")
-        return df
+        if not org.apache.calcite.rex.RexUtil.isDeterministic(rex):
+            return None
+
+        # The digest of the rex (its string representation) is unique
+        # for an expression, but it refers to the columns by index only
+        return id(dc), str(rex), str(rex.getType())
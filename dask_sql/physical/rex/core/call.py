@@ -784,9 +784,10 @@ class RexCallPlugin(BaseRexPlugin):
             except KeyError:  # pragma: no cover
                 raise NotImplementedError(f"{operator_name} not (yet) implemented")
 
-        logger.debug(
-            f"Executing {operator_name} on {[str(LoggableDataFrame(df)) for df in operands]}"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Executing {operator_name} on {[str(LoggableDataFrame(df)) for df in operands]}"
+            )
 
         kwargs = {}
 
@@ -20,7 +20,7 @@ class SargPythonImplementation:
     class Range:
         """Helper class to represent one of the ranges in a Sarg object"""
 
-        def __init__(self, range: com.google.common.collect.Range, literal_type: str):
+        def __init__(self, range: "com.google.common.collect.Range", literal_type: str):
             self.lower_endpoint = None
             self.lower_open = True
             if range.hasLowerBound():
@@ -61,7 +61,7 @@ class SargPythonImplementation:
         def __repr__(self) -> str:
             return f"Range {self.lower_endpoint} - {self.upper_endpoint}"
 
-    def __init__(self, java_sarg: org.apache.calcite.util.Sarg, literal_type: str):
+    def __init__(self, java_sarg: "org.apache.calcite.util.Sarg", literal_type: str):
         self.ranges = [
             SargPythonImplementation.Range(r, literal_type)
             for r in java_sarg.rangeSet.asRanges()
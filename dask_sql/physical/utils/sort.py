@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple, Union
 
 import dask.dataframe as dd
 import pandas as pd
@@ -11,7 +11,12 @@ def apply_sort(
     sort_columns: List[str],
     sort_ascending: List[bool],
     sort_null_first: List[bool],
-) -> dd.DataFrame:
+) -> Tuple[dd.DataFrame, Union[Tuple, None]]:
+    """
+    Sort the dataframe by the given columns and return it
+    together with its divisions by the first column - if the rows are
+    range-partitioned by it (otherwise None).
+    """
     # Split the first column. We need to handle this one with set_index
     first_sort_column = sort_columns[0]
     first_sort_ascending = sort_ascending[0]
@@ -20,7 +25,7 @@ def apply_sort(
     # Only sort by first column first
     # As sorting is rather expensive, we bether persist here
     df = df.persist()
-    df = _sort_first_column(
+    df, divisions = _sort_first_column(
         df, first_sort_column, first_sort_ascending, first_null_first
     )
 
@@ -35,7 +40,7 @@ def apply_sort(
             sort_null_first=sort_null_first,
         )
 
-    return df.persist()
+    return df.persist(), divisions
 
 
 def sort_partition_func(
@@ -78,14 +83,17 @@ def _sort_first_column(df, first_sort_column, first_sort_ascending, first_null_f
     is_na = col.isna().persist()
     if is_na.any().compute():
         df_is_na = df[is_na].reset_index(drop=True).repartition(1)
+        divisions = None
         df_not_is_na = (
             df[~is_na].set_index(first_sort_column, drop=False).reset_index(drop=True)
         )
     else:
         df_is_na = None
-        df_not_is_na = df.set_index(first_sort_column, drop=False).reset_index(
-            drop=True
-        )
+        df_not_is_na = df.set_index(first_sort_column, drop=False)
+        # Only without NULLs and in ascending order, the partitions
+        # of the result are the ones of set_index
+        divisions = df_not_is_na.divisions if first_sort_ascending else None
+        df_not_is_na = df_not_is_na.reset_index(drop=True)
     if not first_sort_ascending:
         # As set_index().reset_index() always sorts ascending, we need to reverse
         # the order inside all partitions and the order of the partitions itself
@@ -103,4 +111,4 @@ def _sort_first_column(df, first_sort_column, first_sort_ascending, first_null_f
     else:
         df = df_not_is_na
 
-    return df
+    return df, divisions
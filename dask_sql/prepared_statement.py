@@ -0,0 +1,126 @@
+import logging
+from typing import Any, List, Union
+
+import dask.dataframe as dd
+import pandas as pd
+
+from dask_sql import java as java_classes
+from dask_sql.java import get_java_class, java
+from dask_sql.mappings import python_to_sql_value
+
+logger = logging.getLogger(__name__)
+
+
+class PreparedStatement:
+    """
+    A SQL query, which is parsed, validated and optimized only once
+    and can then be executed many times with different parameter values.
+    The query can contain positional (``?``) or named (``:name``) parameters
+    in all places where a literal value is allowed.
+
+    Do not create instances of this class directly,
+    but use :func:`dask_sql.Context.prepare` instead.
+    """
+
+    def __init__(
+        self, context: "dask_sql.Context", sql: str, parameter_names: List[str]
+    ):
+        self.context = context
+        self.sql = sql
+        self.parameter_names = parameter_names
+
+        self._cache_key = None
+        self._rel = None
+        self._select_names = None
+        self._prepare()
+
+    @property
+    def is_named(self) -> bool:
+        """Whether the parameters are named (or positional)"""
+        return any(name is not None for name in self.parameter_names)
+
+    def execute(
+        self, *args: Any, return_futures: bool = True, **kwargs: Any
+    ) -> Union[dd.DataFrame, pd.DataFrame]:
+        """
+        Execute the prepared query with the given parameter values.
+        Positional parameters are given as positional arguments,
+        named parameters as keyword arguments.
+
+        Example:
+            .. code-block:: python
+
+                statement = c.prepare("SELECT * FROM df WHERE a = ?")
+                result = statement.execute(1)
+
+                statement = c.prepare("SELECT * FROM df WHERE a = :value")
+                result = statement.execute(value=1)
+
+        Args:
+            *args: The values of the positional parameters (in order)
+            return_futures (:obj:`bool`): Return the unexecuted dask dataframe or the data itself.
+                Defaults to returning the dask dataframe.
+            **kwargs: The values of the named parameters
+
+        Returns:
+            :obj:`dask.dataframe.DataFrame`: the created data frame of this query.
+        """
+        # The tables or functions might have changed in the meantime
+        if self.context._get_plan_cache_key(self.sql) != self._cache_key:
+            logger.debug("Schema has changed since preparation, preparing again")
+            self._prepare()
+
+        parameter_values = self._get_parameter_values(args, kwargs)
+
+        rel = self._rel
+        if parameter_values:
+            java_parameter_values = java.util.ArrayList()
+            for value in parameter_values:
+                java_parameter_values.add(python_to_sql_value(value))
+
+            rel = java_classes.RelationalAlgebraGenerator.bindParameters(
+                rel, java_parameter_values
+            )
+
+        return self.context._compute_table_from_rel(
+            rel, self._select_names, return_futures=return_futures
+        )
+
+    def _prepare(self):
+        """Create the optimized relational algebra (or re-use it from the plan cache)"""
+        self._cache_key = self.context._get_plan_cache_key(self.sql)
+        self._rel, self._select_names, _ = self.context._get_ral(self.sql)
+
+        if self.parameter_names and get_java_class(self._rel).startswith(
+            "com.dask.sql.parser."
+        ):
+            raise NotImplementedError("Parameters are only supported in queries")
+
+    def _get_parameter_values(self, args, kwargs) -> List[Any]:
+        """Bring the given parameter values into the order of the parameters in the query"""
+        if not self.is_named:
+            if kwargs:
+                raise ValueError(
+                    "The query only has positional parameters, use positional arguments"
+                )
+            if len(args) != len(self.parameter_names):
+                raise ValueError(
+                    f"The query needs {len(self.parameter_names)} parameters, got {len(args)}"
+                )
+
+            return list(args)
+
+        if args:
+            raise ValueError(
+                "The query only has named parameters, use keyword arguments"
+            )
+
+        missing_names = set(self.parameter_names) - set(kwargs)
+        if missing_names:
+            raise ValueError(f"Missing values for parameters {sorted(missing_names)}")
+
+        unknown_names = set(kwargs) - set(self.parameter_names)
+        if unknown_names:
+            raise ValueError(f"Unknown parameters {sorted(unknown_names)}")
+
+        return [kwargs[name] for name in self.parameter_names]
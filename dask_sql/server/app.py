@@ -1,20 +1,63 @@
 import asyncio
 import logging
+import re
+import time
 from argparse import ArgumentParser
+from datetime import date
+from urllib.parse import quote_plus, unquote_plus
 from uuid import uuid4
 
 import dask.distributed
+import pandas as pd
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
 from nest_asyncio import apply
 from uvicorn import Config, Server
 
+from dask_sql.cache import LRUCache
 from dask_sql.context import Context
+from dask_sql.server.metrics import RunningQuery, ServerMetrics
 from dask_sql.server.responses import DataResults, ErrorResults, QueryResults
+from dask_sql.utils import split_sql_list
 
 app = FastAPI()
 logger = logging.getLogger(__name__)
 
+PREPARE_REGEX = re.compile(
+    r"^PREPARE\s+(?P<name>\w+)\s+FROM\s+(?P<sql>.*)$", re.IGNORECASE | re.DOTALL
+)
+EXECUTE_REGEX = re.compile(
+    r"^EXECUTE\s+(?P<name>\w+)(?:\s+USING\s+(?P<parameters>.*))?$",
+    re.IGNORECASE | re.DOTALL,
+)
+DEALLOCATE_REGEX = re.compile(r"^DEALLOCATE\s+PREPARE\s+(?P<name>\w+)$", re.IGNORECASE)
+
+# Literals in the USING clause of an EXECUTE statement, which are understood
+# without asking calcite: numbers, strings and typed strings, such as DATE '2021-01-01'
+NUMBER_LITERAL_REGEX = re.compile(
+    r"^[+-]?(\d+\.?\d*|\.\d+)(e[+-]?\d+)?$", re.IGNORECASE
+)
+STRING_LITERAL_REGEX = re.compile(
+    r"^(?P<type>[a-z]+(\s+[a-z]+)*)?\s*'(?P<value>([^']|'')*)'$",
+    re.IGNORECASE | re.DOTALL,
+)
+STRING_LITERAL_TYPES = {
+    "VARCHAR": str,
+    "CHAR": str,
+    "BIGINT": int,
+    "INTEGER": int,
+    "INT": int,
+    "SMALLINT": int,
+    "TINYINT": int,
+    "DOUBLE": float,
+    "REAL": float,
+    "FLOAT": float,
+    "DECIMAL": float,
+    "DATE": date.fromisoformat,
+    "TIMESTAMP": lambda value: pd.Timestamp(value).to_pydatetime(),
+}
+
 
 @app.get("/v1/empty")
 async def empty(request: Request):
@@ -37,6 +80,8 @@ async def cancel(uuid: str, request: Request):
         raise HTTPException(status_code=404, detail="uuid not found")
     future.cancel()
     del request.app.future_list[uuid]
+    request.app.running_queries.pop(uuid, None)
+    request.app.metrics.record_query("cancelled")
 
     return {"status": "ok"}
 
@@ -52,35 +97,104 @@ async def status(uuid: str, request: Request):
     except KeyError:
         raise HTTPException(status_code=404, detail="uuid not found")
 
+    running_query = request.app.running_queries[uuid]
+
     if future.done():
         logger.debug(f"{uuid} is already finished, returning data")
-        df = future.result()
-
         del request.app.future_list[uuid]
+        del request.app.running_queries[uuid]
 
-        return DataResults(df, request=request)
+        try:
+            df = future.result()
+        except Exception as e:
+            request.app.metrics.record_query("error")
+            return ErrorResults(e, request=request)
+
+        request.app.metrics.record_result(df, running_query.execution_time)
+        stats = running_query.get_statement_stats(df)
+        return DataResults(df, request=request, stats=stats)
 
     logger.debug(f"{uuid} is not already finished")
 
     status_url = str(request.url)
-    return QueryResults(request=request, next_url=status_url)
+    stats = running_query.get_statement_stats()
+    return QueryResults(request=request, next_url=status_url, stats=stats)
+
+
+@app.get("/v1/metrics")
+async def metrics(request: Request):
+    """
+    Return the metrics of the server (query counts, latencies,
+    running queries, cache hits and returned data)
+    in the prometheus text format.
+    """
+    return PlainTextResponse(
+        request.app.metrics.to_prometheus(request.app),
+        media_type="text/plain; version=0.0.4",
+    )
 
 
 @app.post("/v1/statement")
-async def query(request: Request):
+async def query(request: Request, response: Response):
     """
     Main endpoint returning query results
     in the presto on wire format.
     """
+    start_time = time.perf_counter()
     try:
         sql = (await request.body()).decode().strip()
-        df = request.app.c.sql(sql)
+
+        # Failing queries are planned (at least partially) as well
+        try:
+            prepare_match = PREPARE_REGEX.match(sql)
+            execute_match = EXECUTE_REGEX.match(sql)
+            deallocate_match = DEALLOCATE_REGEX.match(sql)
+
+            if prepare_match:
+                name = prepare_match.group("name")
+                prepared_sql = prepare_match.group("sql").strip()
+                _get_prepared_statement(request.app, prepared_sql)
+
+                # Presto clients keep track of the prepared statements
+                # and send them with every request
+                response.headers[
+                    "X-Presto-Added-Prepare"
+                ] = f"{name}={quote_plus(prepared_sql)}"
+                request.app.metrics.record_query("success")
+                return DataResults(None, request)
+            elif deallocate_match:
+                name = deallocate_match.group("name")
+                response.headers["X-Presto-Deallocated-Prepare"] = name
+                request.app.metrics.record_query("success")
+                return DataResults(None, request)
+            elif execute_match:
+                name = execute_match.group("name")
+                prepared_statements = _get_prepared_statement_headers(request)
+                try:
+                    prepared_sql = prepared_statements[name]
+                except KeyError:
+                    raise RuntimeError(f"Prepared statement {name} is not known")
+
+                parameters = _get_parameter_values(
+                    request.app, execute_match.group("parameters") or ""
+                )
+                statement = _get_prepared_statement(request.app, prepared_sql)
+                df = statement.execute(*parameters)
+            else:
+                df = request.app.c.sql(sql)
+        finally:
+            request.app.metrics.planning_seconds.observe(
+                time.perf_counter() - start_time
+            )
 
         if df is None:
+            request.app.metrics.record_query("success")
             return DataResults(df, request)
 
         uuid = str(uuid4())
-        request.app.future_list[uuid] = request.app.client.compute(df)
+        running_query = RunningQuery(request.app.client, df, start_time)
+        request.app.future_list[uuid] = running_query.future
+        request.app.running_queries[uuid] = running_query
         logger.debug(f"Registering {sql} with uuid {uuid}.")
 
         status_url = str(
@@ -89,8 +203,14 @@ async def query(request: Request):
         cancel_url = str(
             request.url.replace(path=request.app.url_path_for("cancel", uuid=uuid))
         )
-        return QueryResults(request=request, next_url=status_url, cancel_url=cancel_url)
+        return QueryResults(
+            request=request,
+            next_url=status_url,
+            cancel_url=cancel_url,
+            stats=running_query.get_statement_stats(),
+        )
     except Exception as e:
+        request.app.metrics.record_query("error")
         return ErrorResults(e, request=request)
 
 
@@ -111,13 +231,16 @@ def run_server(
     SQL queries (as string in the body) with the output as a JSON
     (in the format described in the documentation above).
     Every SQL expression that ``dask-sql`` understands can be used here.
+    Metrics of the server (in the prometheus format) are available
+    on `/v1/metrics`.
 
     See :ref:`server` for more information.
 
     Note:
         The presto protocol also includes some statistics on the query
         in the response.
-        These statistics are currently only filled with placeholder variables.
+        Only the state, the elapsed and wall time, the number of nodes,
+        the processed rows and bytes and the number of splits (partitions) are filled.
 
     Args:
         context (:obj:`dask_sql.Context`): If set, use this context instead of an empty one.
@@ -259,11 +382,102 @@ def main():  # pragma: no cover
     )
 
 
+def _get_prepared_statement_headers(request: Request):
+    """
+    Return all prepared statements (name -> SQL) the client has sent.
+    The header has the format name1=urlencoded_sql1,name2=urlencoded_sql2
+    """
+    prepared_statements = {}
+
+    header = request.headers.get("X-Presto-Prepared-Statement", "")
+    for item in header.split(","):
+        if not item.strip():
+            continue
+        name, prepared_sql = item.split("=", 1)
+        prepared_statements[name.strip()] = unquote_plus(prepared_sql.strip())
+
+    return prepared_statements
+
+
+def _get_prepared_statement(app: FastAPI, prepared_sql: str):
+    """
+    Return the prepared statement for the given SQL.
+    Clients only send the SQL of the prepared statements,
+    so the prepared statements are cached by their SQL.
+    """
+    statement = app.prepared_statements.get(prepared_sql)
+    if statement is None:
+        statement = app.c.prepare(prepared_sql)
+        app.prepared_statements.put(prepared_sql, statement)
+
+    return statement
+
+
+def _get_parameter_values(app: FastAPI, parameters_sql: str):
+    """
+    Turn the parameters in the USING clause of an EXECUTE statement
+    into python values. Literals are parsed directly, only other
+    (constant) SQL expressions are evaluated - without storing
+    the one-off queries in the plan or result cache.
+    """
+    parameters = split_sql_list(parameters_sql)
+    values = [_parse_literal(parameter) for parameter in parameters]
+
+    expressions = {
+        i: parameter
+        for i, (parameter, value) in enumerate(zip(parameters, values))
+        if value is NotImplemented
+    }
+    if expressions:
+        select_list = ", ".join(
+            f"{expression} AS parameter_{i}" for i, expression in expressions.items()
+        )
+        rel, select_names, _ = app.c._create_ral(f"SELECT {select_list}")
+        df = app.c._compute_table_from_rel(rel, select_names, return_futures=False)
+        for i, value in zip(expressions, df.iloc[0]):
+            values[i] = None if pd.isna(value) else value
+
+    return values
+
+
+def _parse_literal(literal: str):
+    """
+    Return the python value of a SQL literal
+    or NotImplemented, if it is not a (known) literal.
+    """
+    upper_literal = literal.upper()
+    if upper_literal == "NULL":
+        return None
+    if upper_literal in ("TRUE", "FALSE"):
+        return upper_literal == "TRUE"
+
+    if NUMBER_LITERAL_REGEX.match(literal):
+        try:
+            return int(literal)
+        except ValueError:
+            return float(literal)
+
+    match = STRING_LITERAL_REGEX.match(literal)
+    if match:
+        value = match.group("value").replace("''", "'")
+        literal_type = (match.group("type") or "VARCHAR").upper()
+        if literal_type in STRING_LITERAL_TYPES:
+            try:
+                return STRING_LITERAL_TYPES[literal_type](value)
+            except ValueError:
+                pass
+
+    return NotImplemented
+
+
 def _init_app(
     app: FastAPI, context: Context = None, client: dask.distributed.Client = None,
 ):
     app.c = context or Context()
     app.future_list = {}
+    app.running_queries = {}
+    app.prepared_statements = LRUCache()
+    app.metrics = ServerMetrics()
 
     try:
         client = client or dask.distributed.Client.current()
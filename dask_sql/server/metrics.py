@@ -0,0 +1,205 @@
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+import dask.dataframe as dd
+import dask.distributed
+import pandas as pd
+from dask.distributed import futures_of
+
+from dask_sql.server.responses import StatementStats
+
+# Upper bounds (in seconds) of the buckets of the latency histograms
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+
+class Histogram:
+    """
+    Distribution of observed values, which is exported
+    with cumulative buckets (as prometheus expects it).
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.bucket_counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """Add a single value to the distribution"""
+        for i, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.bucket_counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def to_prometheus(self, name: str, description: str) -> List[str]:
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+        for upper_bound, count in zip(self.buckets, self.bucket_counts):
+            lines.append(f'{name}_bucket{{le="{upper_bound}"}} {count}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum {self.sum}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class RunningQuery:
+    """
+    Bookkeeping of a query, which is currently computed on the cluster.
+    The result is persisted first, so that the progress
+    can be followed by the futures of its partitions ("splits").
+    They are released as soon as the result is ready.
+    """
+
+    def __init__(
+        self, client: dask.distributed.Client, df: dd.DataFrame, start_time: float
+    ):
+        # Time before the query was parsed and planned
+        self.start_time = start_time
+        self.submit_time = time.perf_counter()
+        self.finish_time = None
+
+        persisted_df = client.persist(df)
+        self.splits = futures_of(persisted_df)
+        self.total_splits = len(self.splits)
+        self.future = client.compute(persisted_df)
+        self.future.add_done_callback(self._mark_finished)
+
+        self.nodes = len(client.scheduler_info().get("workers", {}))
+
+    def _mark_finished(self, future):
+        self.finish_time = time.perf_counter()
+        # Release the partitions, so that the cluster
+        # does not hold them in addition to the (concatenated) result
+        self.splits = []
+
+    @property
+    def execution_time(self) -> float:
+        """Seconds from the submission until the result was ready (or until now)"""
+        return (self.finish_time or time.perf_counter()) - self.submit_time
+
+    def get_statement_stats(self, result: pd.DataFrame = None) -> StatementStats:
+        """Fill the presto statistics with the current state of the futures"""
+        stats = StatementStats()
+        stats.scheduled = True
+        stats.nodes = self.nodes
+
+        splits = self.splits
+        if splits:
+            completed_splits = sum(split.done() for split in splits)
+        else:
+            completed_splits = self.total_splits
+        stats.totalSplits = self.total_splits
+        stats.completedSplits = completed_splits
+        stats.runningSplits = self.total_splits - completed_splits
+
+        stats.elapsedTimeMillis = int(1000 * (time.perf_counter() - self.start_time))
+        stats.wallTimeMillis = int(1000 * self.execution_time)
+
+        if result is None:
+            stats.state = "RUNNING"
+        else:
+            stats.state = "FINISHED"
+            stats.processedRows = len(result)
+            stats.processedBytes = _get_nbytes(result)
+
+        return stats
+
+
+class ServerMetrics:
+    """
+    Counters and latency distributions of all queries answered by the server,
+    which are exported in the prometheus text format on /v1/metrics.
+    """
+
+    def __init__(self):
+        self.queries = defaultdict(int)
+        self.planning_seconds = Histogram()
+        self.execution_seconds = Histogram()
+        self.returned_rows = 0
+        self.returned_bytes = 0
+
+    def record_query(self, outcome: str):
+        """Count a query with the given outcome (success, error or cancelled)"""
+        self.queries[outcome] += 1
+
+    def record_result(self, result: pd.DataFrame, execution_time: float):
+        """Count a successful query and the size of its result"""
+        self.record_query("success")
+        self.execution_seconds.observe(execution_time)
+        self.returned_rows += len(result)
+        self.returned_bytes += _get_nbytes(result)
+
+    def to_prometheus(self, app: "fastapi.FastAPI") -> str:
+        """Return all metrics (including the ones of the app) as text"""
+        lines = []
+
+        lines += _metric(
+            "dask_sql_queries_total",
+            "counter",
+            "Number of answered queries by their outcome",
+            {f'outcome="{outcome}"': count for outcome, count in self.queries.items()},
+        )
+        lines += self.planning_seconds.to_prometheus(
+            "dask_sql_query_planning_seconds",
+            "Time spent in parsing, optimizing and converting the queries (also failing ones)",
+        )
+        lines += self.execution_seconds.to_prometheus(
+            "dask_sql_query_execution_seconds",
+            "Time from the submission of the queries until their results were ready",
+        )
+        lines += _metric(
+            "dask_sql_running_queries",
+            "gauge",
+            "Number of queries currently computed on the cluster",
+            {"": len(app.future_list)},
+        )
+        lines += _metric(
+            "dask_sql_returned_rows_total",
+            "counter",
+            "Number of rows returned to the clients",
+            {"": self.returned_rows},
+        )
+        lines += _metric(
+            "dask_sql_returned_bytes_total",
+            "counter",
+            "Memory size of the results returned to the clients",
+            {"": self.returned_bytes},
+        )
+
+        caches = {
+            "plan": app.c.plan_cache.info(),
+            "result": app.c.result_cache.info(),
+            "prepared_statement": app.prepared_statements.info(),
+        }
+        lines += _metric(
+            "dask_sql_cache_hits_total",
+            "counter",
+            "Number of cache hits",
+            {f'cache="{name}"': info.hits for name, info in caches.items()},
+        )
+        lines += _metric(
+            "dask_sql_cache_misses_total",
+            "counter",
+            "Number of cache misses",
+            {f'cache="{name}"': info.misses for name, info in caches.items()},
+        )
+
+        return "\n".join(lines) + "\n"
+
+
+def _metric(
+    name: str, metric_type: str, description: str, values: Dict[str, float]
+) -> List[str]:
+    """Format a metric with one value per label set in the prometheus text format"""
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {metric_type}"]
+    for labels, value in values.items():
+        if labels:
+            lines.append(f"{name}{{{labels}}} {value}")
+        else:
+            lines.append(f"{name} {value}")
+    return lines
+
+
+def _get_nbytes(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(deep=True, index=True).sum())
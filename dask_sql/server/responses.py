@@ -49,7 +49,13 @@ class StatementStats:
 
 
 class QueryResults:
-    def __init__(self, request: Request, next_url: str = None, cancel_url: str = None):
+    def __init__(
+        self,
+        request: Request,
+        next_url: str = None,
+        cancel_url: str = None,
+        stats: StatementStats = None,
+    ):
         empty_url = str(request.url.replace(path=request.app.url_path_for("empty")))
 
         self.id = str(uuid.uuid4())
@@ -58,7 +64,7 @@ class QueryResults:
             self.nextUri = next_url
         if cancel_url:
             self.partialCancelUri = cancel_url
-        self.stats = StatementStats()
+        self.stats = stats or StatementStats()
         self.warnings = []
 
 
@@ -106,8 +112,10 @@ class DataResults(QueryResults):
     def convert_row(row):
         return [DataResults.convert_cell(cell) for cell in row]
 
-    def __init__(self, df: dd.DataFrame, request: Request):
-        super().__init__(request)
+    def __init__(
+        self, df: dd.DataFrame, request: Request, stats: StatementStats = None
+    ):
+        super().__init__(request, stats=stats)
 
         if df is None:
             return
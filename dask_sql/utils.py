@@ -4,6 +4,7 @@ import re
 import sys
 from collections import defaultdict
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, Dict, List, Tuple
 from unittest.mock import patch
@@ -13,6 +14,7 @@ import cloudpickle
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
+from dask.base import tokenize
 
 from dask_sql.datacontainer import DataContainer
 from dask_sql.java import com, java, org
@@ -245,10 +247,134 @@ def import_class(name: str) -> type:
     return getattr(module, class_name)
 
 
+_PARAMETER_NAME_REGEX = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _end_of_quoted_part(sql: str, start: int) -> int:
+    """
+    If a string literal, a quoted identifier or a comment starts
+    at the given position in the SQL string, return the position after its end.
+    Otherwise, return the start position.
+    """
+    char = sql[start]
+    if char in ("'", '"', "`"):
+        end = sql.find(char, start + 1)
+        return len(sql) if end == -1 else end + 1
+    if sql.startswith("--", start):
+        end = sql.find("\n", start)
+        return len(sql) if end == -1 else end
+    if sql.startswith("/*", start):
+        end = sql.find("*/", start + 2)
+        return len(sql) if end == -1 else end + 2
+
+    return start
+
+
+def split_named_parameters(sql: str) -> Tuple[str, List[str]]:
+    """
+    Replace all named parameters (e.g. ``:name``) in the SQL string
+    by positional parameters (``?``), which calcite understands.
+    Return the new SQL string and the names of all parameters
+    in the order of their occurrence (``None`` for positional parameters).
+    Literals, quoted identifiers and comments are left untouched.
+    """
+    parts = []
+    parameter_names = []
+
+    position = 0
+    while position < len(sql):
+        end = _end_of_quoted_part(sql, position)
+        if end != position:
+            parts.append(sql[position:end])
+            position = end
+            continue
+
+        char = sql[position]
+        if sql.startswith("::", position):
+            parts.append("::")
+            position += 2
+            continue
+        elif char == "?":
+            parameter_names.append(None)
+        elif char == ":":
+            match = _PARAMETER_NAME_REGEX.match(sql, position + 1)
+            if match:
+                parameter_names.append(match.group())
+                parts.append("?")
+                position = match.end()
+                continue
+
+        parts.append(char)
+        position += 1
+
+    return "".join(parts), parameter_names
+
+
+def split_sql_list(sql: str) -> List[str]:
+    """
+    Split a comma separated list of SQL expressions,
+    ignoring commas in parentheses, literals, quoted identifiers and comments.
+    """
+    items = []
+    depth = 0
+    item_start = 0
+
+    position = 0
+    while position < len(sql):
+        end = _end_of_quoted_part(sql, position)
+        if end != position:
+            position = end
+            continue
+
+        char = sql[position]
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            items.append(sql[item_start:position].strip())
+            item_start = position + 1
+
+        position += 1
+
+    last_item = sql[item_start:].strip()
+    if last_item or items:
+        items.append(last_item)
+
+    return items
+
+
+# Number of temporary columns already handed out for every dataframe (by its name)
+# within the current deterministic_temporary_columns context - or None outside of it
+_temporary_column_counts = ContextVar("temporary_column_counts", default=None)
+
+
+@contextmanager
+def deterministic_temporary_columns():
+    """
+    Within this context, the names of new temporary columns only depend
+    on the dataframe they are created for and on how many temporary columns
+    were already created for this dataframe.
+    Converting the same query twice therefore creates the same dask graph
+    (with the same keys), so that already computed results can be re-used.
+    """
+    token = _temporary_column_counts.set(defaultdict(int))
+    try:
+        yield
+    finally:
+        _temporary_column_counts.reset(token)
+
+
 def new_temporary_column(df: dd.DataFrame) -> str:
     """Return a new column name which is currently not in use"""
+    counts = _temporary_column_counts.get()
+
     while True:
-        col_name = str(uuid4())
+        if counts is None:
+            col_name = str(uuid4())
+        else:
+            col_name = f"tmp_{tokenize(df._name, counts[df._name])}"
+            counts[df._name] += 1
 
         if col_name not in df.columns:
             return col_name
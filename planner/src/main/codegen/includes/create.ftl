@@ -67,6 +67,50 @@ SqlCreate SqlCreateView(final Span s, boolean replace) :
     }
 }
 
+/*
+ * Production for
+ *   CREATE MATERIALIZED VIEW name AS and
+ *   CREATE MATERIALIZED VIEW name WITH (key = value) AS
+ */
+SqlCreate SqlCreateMaterializedView(final Span s, boolean replace) :
+{
+    final SqlIdentifier tableName;
+    SqlKwargs kwargs = null;
+    final SqlNode select;
+    final boolean ifNotExists;
+}
+{
+    <MATERIALIZED> <VIEW>
+    ifNotExists = IfNotExists()
+    tableName = CompoundTableIdentifier()
+    (
+        <WITH>
+        kwargs = ParenthesizedKeyValueExpressions()
+    )?
+    <AS>
+    select = OptionallyParenthesizedQuery()
+    {
+        return new SqlCreateMaterializedView(s.end(this), replace, ifNotExists, tableName, kwargs, select);
+    }
+}
+
+/*
+ * Production for
+ *   REFRESH MATERIALIZED VIEW name
+ */
+SqlNode SqlRefreshMaterializedView() :
+{
+    final Span s;
+    final SqlIdentifier tableName;
+}
+{
+    <REFRESH> { s = span(); } <MATERIALIZED> <VIEW>
+    tableName = CompoundTableIdentifier()
+    {
+        return new SqlRefreshMaterializedView(s.end(this), tableName);
+    }
+}
+
 /*
  * Production for
  *   DROP TABLE table and
@@ -123,3 +123,17 @@ SqlNode SqlUseSchema() :
         return new SqlUseSchema(s.end(this),schemaName);
     }
 }
+
+// EXPLAIN ANALYZE <query>
+SqlNode SqlExplainAnalyze() :
+{
+   final Span s;
+   final SqlNode query;
+}
+{
+    <EXPLAIN> { s = span(); } <ANALYZE>
+    query = OptionallyParenthesizedQuery()
+    {
+        return new SqlExplainAnalyze(s.end(this), query);
+    }
+}
@@ -0,0 +1,91 @@
+package com.dask.sql.application;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import org.apache.calcite.plan.RelOptRule;
+import org.apache.calcite.plan.RelOptRuleCall;
+import org.apache.calcite.rel.core.JoinRelType;
+import org.apache.calcite.rel.core.RelFactories;
+import org.apache.calcite.rel.logical.LogicalFilter;
+import org.apache.calcite.rel.logical.LogicalJoin;
+import org.apache.calcite.rel.type.RelDataTypeField;
+import org.apache.calcite.rex.RexBuilder;
+import org.apache.calcite.rex.RexCall;
+import org.apache.calcite.rex.RexInputRef;
+import org.apache.calcite.rex.RexNode;
+import org.apache.calcite.sql.SqlKind;
+import org.apache.calcite.tools.RelBuilder;
+
+/**
+ * Turn a left join, which only keeps the rows without a match, into an anti
+ * join.
+ *
+ * Calcite decorrelates NOT EXISTS (and NOT IN on non-nullable columns) into
+ * a left join with the distinct keys of the subquery, followed by a filter
+ * "IS NULL" on a column of the subquery, which can not be NULL itself (so
+ * it is only NULL for rows without a match). As only the columns of the left
+ * side are used afterwards, an anti join gives the same result - without
+ * computing the joined rows at all:
+ *
+ * Filter(IS NULL($i)) - Join(LEFT, left, right)
+ *
+ * becomes
+ *
+ * Project(left columns, NULL, ..., NULL) - Join(ANTI, left, right)
+ */
+public class DaskAntiJoinRule extends RelOptRule {
+	public static final DaskAntiJoinRule INSTANCE = new DaskAntiJoinRule();
+
+	private DaskAntiJoinRule() {
+		super(operand(LogicalFilter.class, operand(LogicalJoin.class, any())), RelFactories.LOGICAL_BUILDER,
+				"DaskAntiJoinRule");
+	}
+
+	@Override
+	public void onMatch(final RelOptRuleCall call) {
+		final LogicalFilter filter = call.rel(0);
+		final LogicalJoin join = call.rel(1);
+		if (join.getJoinType() != JoinRelType.LEFT) {
+			return;
+		}
+
+		final RexNode condition = filter.getCondition();
+		if (!condition.isA(SqlKind.IS_NULL)) {
+			return;
+		}
+		final RexNode operand = ((RexCall) condition).getOperands().get(0);
+		if (!(operand instanceof RexInputRef)) {
+			return;
+		}
+
+		// The filtered column needs to be a column of the right side,
+		// which can only be NULL if there is no match
+		final int leftFieldCount = join.getLeft().getRowType().getFieldCount();
+		final int index = ((RexInputRef) operand).getIndex();
+		if (index < leftFieldCount) {
+			return;
+		}
+		final RelDataTypeField field = join.getRight().getRowType().getFieldList().get(index - leftFieldCount);
+		if (field.getType().isNullable()) {
+			return;
+		}
+
+		final RelBuilder relBuilder = call.builder();
+		relBuilder.push(join.getLeft()).push(join.getRight()).antiJoin(join.getCondition());
+
+		// Keep the row type of the filter: all columns of the right side are NULL
+		final RexBuilder rexBuilder = join.getCluster().getRexBuilder();
+		final List<RexNode> projects = new ArrayList<>();
+		for (final RelDataTypeField joinField : join.getRowType().getFieldList()) {
+			if (joinField.getIndex() < leftFieldCount) {
+				projects.add(relBuilder.field(joinField.getIndex()));
+			} else {
+				projects.add(rexBuilder.makeNullLiteral(joinField.getType()));
+			}
+		}
+		relBuilder.project(projects, join.getRowType().getFieldNames(), true);
+
+		call.transformTo(relBuilder.build());
+	}
+}
@@ -0,0 +1,58 @@
+package com.dask.sql.application;
+
+import com.dask.sql.schema.DaskTable;
+
+import org.apache.calcite.rel.core.TableScan;
+import org.apache.calcite.rel.metadata.BuiltInMetadata;
+import org.apache.calcite.rel.metadata.MetadataDef;
+import org.apache.calcite.rel.metadata.MetadataHandler;
+import org.apache.calcite.rel.metadata.ReflectiveRelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMdUtil;
+import org.apache.calcite.rel.metadata.RelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataQuery;
+import org.apache.calcite.rex.RexNode;
+import org.apache.calcite.util.BuiltInMethod;
+import org.apache.calcite.util.ImmutableBitSet;
+
+/**
+ * Distinct counts of table columns, as stored in the statistics of the
+ * DaskTable. If nothing is known about the column, null (= unknown) is
+ * returned, just as calcite would do.
+ */
+public class DaskRelMdDistinctRowCount implements MetadataHandler<BuiltInMetadata.DistinctRowCount> {
+	public static final RelMetadataProvider SOURCE = ReflectiveRelMetadataProvider
+			.reflectiveSource(BuiltInMethod.DISTINCT_ROW_COUNT.method, new DaskRelMdDistinctRowCount());
+
+	@Override
+	public MetadataDef<BuiltInMetadata.DistinctRowCount> getDef() {
+		return BuiltInMetadata.DistinctRowCount.DEF;
+	}
+
+	public Double getDistinctRowCount(final TableScan rel, final RelMetadataQuery mq, final ImmutableBitSet groupKey,
+			final RexNode predicate) {
+		if (groupKey.isEmpty()) {
+			return 1.0;
+		}
+
+		final DaskTable table = rel.getTable().unwrap(DaskTable.class);
+		if (table == null || groupKey.cardinality() != 1) {
+			return null;
+		}
+
+		final Double distinctCount = table.getDistinctCount(groupKey.nth(0));
+		if (distinctCount == null) {
+			return null;
+		}
+
+		if (predicate == null || predicate.isAlwaysTrue()) {
+			return distinctCount;
+		}
+
+		// Less rows might also mean less distinct values
+		final Double rowCount = mq.getRowCount(rel);
+		if (rowCount == null) {
+			return distinctCount;
+		}
+		return RelMdUtil.numDistinctVals(distinctCount, rowCount * RelMdUtil.guessSelectivity(predicate));
+	}
+}
@@ -0,0 +1,67 @@
+package com.dask.sql.application;
+
+import org.apache.calcite.plan.RelOptCost;
+import org.apache.calcite.plan.RelOptCostFactory;
+import org.apache.calcite.rel.RelNode;
+import org.apache.calcite.rel.core.Join;
+import org.apache.calcite.rel.metadata.BuiltInMetadata;
+import org.apache.calcite.rel.metadata.MetadataDef;
+import org.apache.calcite.rel.metadata.MetadataHandler;
+import org.apache.calcite.rel.metadata.ReflectiveRelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataQuery;
+import org.apache.calcite.util.BuiltInMethod;
+
+/**
+ * A cost model, which reflects how dask executes the relational algebra.
+ *
+ * The cost of a node is measured in bytes: every node "costs" the (estimated)
+ * size of its output. As dask needs to shuffle both inputs of a join over the
+ * network, which is by far the most expensive operation, a join additionally
+ * costs the size of both inputs. Join orders which shuffle small intermediate
+ * results are therefore preferred.
+ */
+public class DaskRelMdNonCumulativeCost implements MetadataHandler<BuiltInMetadata.NonCumulativeCost> {
+	public static final RelMetadataProvider SOURCE = ReflectiveRelMetadataProvider
+			.reflectiveSource(BuiltInMethod.NON_CUMULATIVE_COST.method, new DaskRelMdNonCumulativeCost());
+
+	/// Fallback for the size of a single column, if nothing else is known
+	private static final double DEFAULT_COLUMN_SIZE = 8.0;
+
+	@Override
+	public MetadataDef<BuiltInMetadata.NonCumulativeCost> getDef() {
+		return BuiltInMetadata.NonCumulativeCost.DEF;
+	}
+
+	public RelOptCost getNonCumulativeCost(final Join rel, final RelMetadataQuery mq) {
+		final double shuffledBytes = getBytes(rel.getLeft(), mq) + getBytes(rel.getRight(), mq);
+		final double outputBytes = getBytes(rel, mq);
+		return makeCost(rel, mq, shuffledBytes + outputBytes, shuffledBytes);
+	}
+
+	public RelOptCost getNonCumulativeCost(final RelNode rel, final RelMetadataQuery mq) {
+		return makeCost(rel, mq, getBytes(rel, mq), 0.0);
+	}
+
+	private static RelOptCost makeCost(final RelNode rel, final RelMetadataQuery mq, final double bytes,
+			final double io) {
+		final RelOptCostFactory costFactory = rel.getCluster().getPlanner().getCostFactory();
+		final Double rowCount = mq.getRowCount(rel);
+		final double cpu = rowCount == null ? 0.0 : rowCount;
+		return costFactory.makeCost(bytes, cpu, io);
+	}
+
+	/// Estimated size of the output of the node in bytes
+	private static double getBytes(final RelNode rel, final RelMetadataQuery mq) {
+		final Double rowCount = mq.getRowCount(rel);
+		if (rowCount == null) {
+			return 0.0;
+		}
+
+		Double rowSize = mq.getAverageRowSize(rel);
+		if (rowSize == null) {
+			rowSize = DEFAULT_COLUMN_SIZE * rel.getRowType().getFieldCount();
+		}
+		return rowCount * rowSize;
+	}
+}
@@ -0,0 +1,57 @@
+package com.dask.sql.application;
+
+import org.apache.calcite.rel.core.Join;
+import org.apache.calcite.rel.core.JoinInfo;
+import org.apache.calcite.rel.core.JoinRelType;
+import org.apache.calcite.rel.metadata.BuiltInMetadata;
+import org.apache.calcite.rel.metadata.MetadataDef;
+import org.apache.calcite.rel.metadata.MetadataHandler;
+import org.apache.calcite.rel.metadata.ReflectiveRelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMdUtil;
+import org.apache.calcite.rel.metadata.RelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataQuery;
+import org.apache.calcite.util.BuiltInMethod;
+import org.apache.calcite.util.ImmutableBitSet;
+
+/**
+ * Row count estimation of joins using the distinct counts of the join keys.
+ *
+ * Calcite estimates the size of an equi-join by a fixed selectivity of the
+ * condition. If the number of distinct values of the join keys is known (e.g.
+ * from the table statistics), we use the textbook estimation instead:
+ * |L join R| = |L| * |R| / max(distinct(L.key), distinct(R.key)).
+ */
+public class DaskRelMdRowCount implements MetadataHandler<BuiltInMetadata.RowCount> {
+	public static final RelMetadataProvider SOURCE = ReflectiveRelMetadataProvider
+			.reflectiveSource(BuiltInMethod.ROW_COUNT.method, new DaskRelMdRowCount());
+
+	@Override
+	public MetadataDef<BuiltInMetadata.RowCount> getDef() {
+		return BuiltInMetadata.RowCount.DEF;
+	}
+
+	public Double getRowCount(final Join rel, final RelMetadataQuery mq) {
+		final JoinInfo joinInfo = rel.analyzeCondition();
+		if (rel.getJoinType() != JoinRelType.INNER || joinInfo.leftKeys.isEmpty()) {
+			return RelMdUtil.getJoinRowCount(mq, rel, rel.getCondition());
+		}
+
+		final Double leftRowCount = mq.getRowCount(rel.getLeft());
+		final Double rightRowCount = mq.getRowCount(rel.getRight());
+		final Double leftDistinctCount = mq.getDistinctRowCount(rel.getLeft(), ImmutableBitSet.of(joinInfo.leftKeys),
+				null);
+		final Double rightDistinctCount = mq.getDistinctRowCount(rel.getRight(),
+				ImmutableBitSet.of(joinInfo.rightKeys), null);
+
+		if (leftRowCount == null || rightRowCount == null || leftDistinctCount == null
+				|| rightDistinctCount == null) {
+			return RelMdUtil.getJoinRowCount(mq, rel, rel.getCondition());
+		}
+
+		double rowCount = leftRowCount * rightRowCount / Math.max(1.0, Math.max(leftDistinctCount, rightDistinctCount));
+		if (!joinInfo.isEqui()) {
+			rowCount *= RelMdUtil.guessSelectivity(joinInfo.getRemaining(rel.getCluster().getRexBuilder()));
+		}
+		return rowCount;
+	}
+}
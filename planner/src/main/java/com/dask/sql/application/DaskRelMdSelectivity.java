@@ -0,0 +1,67 @@
+package com.dask.sql.application;
+
+import com.dask.sql.schema.DaskTable;
+
+import org.apache.calcite.plan.RelOptUtil;
+import org.apache.calcite.rel.core.TableScan;
+import org.apache.calcite.rel.metadata.BuiltInMetadata;
+import org.apache.calcite.rel.metadata.MetadataDef;
+import org.apache.calcite.rel.metadata.MetadataHandler;
+import org.apache.calcite.rel.metadata.ReflectiveRelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMdUtil;
+import org.apache.calcite.rel.metadata.RelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataQuery;
+import org.apache.calcite.rex.RexCall;
+import org.apache.calcite.rex.RexInputRef;
+import org.apache.calcite.rex.RexNode;
+import org.apache.calcite.sql.SqlKind;
+import org.apache.calcite.util.BuiltInMethod;
+
+/**
+ * Selectivity of predicates on table columns, using the null fractions stored
+ * in the statistics of the DaskTable for IS NULL and IS NOT NULL. All other
+ * predicates (and columns without statistics) are guessed, just as calcite
+ * would do.
+ */
+public class DaskRelMdSelectivity implements MetadataHandler<BuiltInMetadata.Selectivity> {
+	public static final RelMetadataProvider SOURCE = ReflectiveRelMetadataProvider
+			.reflectiveSource(BuiltInMethod.SELECTIVITY.method, new DaskRelMdSelectivity());
+
+	@Override
+	public MetadataDef<BuiltInMetadata.Selectivity> getDef() {
+		return BuiltInMetadata.Selectivity.DEF;
+	}
+
+	public Double getSelectivity(final TableScan rel, final RelMetadataQuery mq, final RexNode predicate) {
+		final DaskTable table = rel.getTable().unwrap(DaskTable.class);
+		if (table == null || predicate == null) {
+			return RelMdUtil.guessSelectivity(predicate);
+		}
+
+		double selectivity = 1.0;
+		for (final RexNode conjunction : RelOptUtil.conjunctions(predicate)) {
+			final Double nullFraction = getNullFraction(table, conjunction);
+			if (nullFraction == null) {
+				selectivity *= RelMdUtil.guessSelectivity(conjunction);
+			} else if (conjunction.isA(SqlKind.IS_NULL)) {
+				selectivity *= nullFraction;
+			} else {
+				selectivity *= 1.0 - nullFraction;
+			}
+		}
+		return selectivity;
+	}
+
+	/// Return the null fraction of the column checked by IS [NOT] NULL (or null if not known)
+	static private Double getNullFraction(final DaskTable table, final RexNode predicate) {
+		if (!predicate.isA(SqlKind.IS_NULL) && !predicate.isA(SqlKind.IS_NOT_NULL)) {
+			return null;
+		}
+
+		final RexNode operand = ((RexCall) predicate).getOperands().get(0);
+		if (!(operand instanceof RexInputRef)) {
+			return null;
+		}
+		return table.getNullFraction(((RexInputRef) operand).getIndex());
+	}
+}
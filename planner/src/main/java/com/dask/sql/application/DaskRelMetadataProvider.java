@@ -0,0 +1,17 @@
+package com.dask.sql.application;
+
+import com.google.common.collect.ImmutableList;
+
+import org.apache.calcite.rel.metadata.ChainedRelMetadataProvider;
+import org.apache.calcite.rel.metadata.DefaultRelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataProvider;
+
+/**
+ * The metadata (statistics and costs) calcite uses during the optimization:
+ * the dask-specific handlers first, calcite's defaults for everything else.
+ */
+public class DaskRelMetadataProvider {
+	public static final RelMetadataProvider INSTANCE = ChainedRelMetadataProvider.of(ImmutableList.of(
+			DaskRelMdRowCount.SOURCE, DaskRelMdDistinctRowCount.SOURCE, DaskRelMdSelectivity.SOURCE,
+			DaskRelMdNonCumulativeCost.SOURCE, DefaultRelMetadataProvider.INSTANCE));
+}
@@ -4,8 +4,12 @@ import java.sql.Connection;
 import java.sql.DriverManager;
 import java.sql.SQLException;
 import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Map;
 import java.util.Properties;
+import java.util.Set;
 
 import com.dask.sql.schema.DaskSchema;
 import org.apache.calcite.sql.SqlDialect;
@@ -18,11 +22,23 @@ import org.apache.calcite.jdbc.JavaTypeFactoryImpl;
 import org.apache.calcite.plan.Context;
 import org.apache.calcite.plan.Contexts;
 import org.apache.calcite.plan.RelOptUtil;
+import org.apache.calcite.plan.hep.HepMatchOrder;
 import org.apache.calcite.plan.hep.HepPlanner;
 import org.apache.calcite.plan.hep.HepProgram;
 import org.apache.calcite.plan.hep.HepProgramBuilder;
 import org.apache.calcite.prepare.CalciteCatalogReader;
+import org.apache.calcite.rel.RelHomogeneousShuttle;
 import org.apache.calcite.rel.RelNode;
+import org.apache.calcite.rel.RelVisitor;
+import org.apache.calcite.rel.RelWriter;
+import org.apache.calcite.rel.hint.HintPredicates;
+import org.apache.calcite.rel.hint.HintStrategyTable;
+import org.apache.calcite.rel.hint.Hintable;
+import org.apache.calcite.rel.hint.RelHint;
+import org.apache.calcite.rel.metadata.ChainedRelMetadataProvider;
+import org.apache.calcite.rel.metadata.JaninoRelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataProvider;
+import org.apache.calcite.rel.metadata.RelMetadataQuery;
 import org.apache.calcite.rel.rules.AggregateExpandDistinctAggregatesRule;
 import org.apache.calcite.rel.rules.AggregateReduceFunctionsRule;
 import org.apache.calcite.rel.rules.CoreRules;
@@ -30,12 +46,22 @@ import org.apache.calcite.rel.rules.FilterAggregateTransposeRule;
 import org.apache.calcite.rel.rules.FilterJoinRule;
 import org.apache.calcite.rel.rules.FilterMergeRule;
 import org.apache.calcite.rel.rules.FilterRemoveIsNotDistinctFromRule;
+import org.apache.calcite.rel.rules.MultiJoin;
 import org.apache.calcite.rel.rules.ProjectJoinTransposeRule;
 import org.apache.calcite.rel.rules.ProjectMergeRule;
 import org.apache.calcite.rel.rules.ReduceExpressionsRule;
+import org.apache.calcite.rel.type.RelDataType;
+import org.apache.calcite.rel.type.RelDataTypeField;
+import org.apache.calcite.rex.RexBuilder;
+import org.apache.calcite.rex.RexCall;
+import org.apache.calcite.rex.RexDynamicParam;
 import org.apache.calcite.rex.RexExecutorImpl;
+import org.apache.calcite.rex.RexNode;
+import org.apache.calcite.rex.RexShuttle;
 import org.apache.calcite.schema.SchemaPlus;
+import org.apache.calcite.sql.SqlExplainLevel;
 import org.apache.calcite.sql.SqlNode;
+import org.apache.calcite.sql.SqlOperator;
 import org.apache.calcite.sql.SqlOperatorTable;
 import org.apache.calcite.sql.fun.SqlLibrary;
 import org.apache.calcite.sql.fun.SqlLibraryOperatorTableFactory;
@@ -43,39 +69,79 @@ import org.apache.calcite.sql.fun.SqlStdOperatorTable;
 import org.apache.calcite.sql.parser.SqlParseException;
 import org.apache.calcite.sql.parser.SqlParser;
 import org.apache.calcite.sql.parser.SqlParser.Config;
+import org.apache.calcite.sql.type.SqlTypeName;
+import org.apache.calcite.sql.type.SqlTypeUtil;
 import org.apache.calcite.sql.util.SqlOperatorTables;
 import org.apache.calcite.sql.validate.SqlConformanceEnum;
+import org.apache.calcite.sql2rel.SqlToRelConverter;
 import org.apache.calcite.tools.FrameworkConfig;
 import org.apache.calcite.tools.Frameworks;
 import org.apache.calcite.tools.Planner;
 import org.apache.calcite.tools.RelConversionException;
 import org.apache.calcite.tools.ValidationException;
+import org.apache.calcite.util.JsonBuilder;
+import org.apache.calcite.util.Pair;
 
 /**
  * The core of the calcite program: the generator for the relational algebra.
  * Using a passed schema, it generates (optimized) relational algebra out of SQL
  * query strings or throws an exception.
  *
+ * The generator is meant to be long-lived: schemas can be added after creation
+ * and the tables and functions of the added schemas can be changed at any time,
+ * without the need to create a new generator (and calcite connection).
+ *
  * This class is taken (in parts) from the blazingSQL project.
  */
 public class RelationalAlgebraGenerator {
-	final Planner planner;
-	final HepPlanner hepPlanner;
+	/// The calcite root schema, which holds all dask schemas
+	final SchemaPlus rootSchema;
+	/// The name of the schema used for not fully qualified identifiers
+	String defaultSchemaName;
+	Planner planner;
+	HepPlanner hepPlanner;
+	HepPlanner joinReorderPlanner;
 
 	/// Create a new relational algebra generator from a schema
 	public RelationalAlgebraGenerator(final String rootSchemaName, final List<DaskSchema> schemas) throws ClassNotFoundException, SQLException {
 		// Taken from https://calcite.apache.org/docs/ and blazingSQL
-		final SchemaPlus rootSchema = createRootSchema(rootSchemaName, schemas);
+		this.rootSchema = createRootSchema(rootSchemaName);
+		for (final DaskSchema schema : schemas) {
+			this.addSchema(schema);
+		}
+
+		this.setDefaultSchema(rootSchemaName);
+	}
+
+	/// Add a new schema (or replace an already present schema with the same name)
+	public void addSchema(final DaskSchema schema) {
+		final SchemaPlus schemaPlus = this.rootSchema.add(schema.getName(), schema);
+		// Tables and functions of the schema can change between queries,
+		// so calcite is not allowed to cache their names
+		schemaPlus.setCacheEnabled(false);
+	}
+
+	/// Use the schema with the given name for not fully qualified identifiers
+	public void setDefaultSchema(final String schemaName) {
+		if (schemaName.equals(this.defaultSchemaName) && this.planner != null) {
+			return;
+		}
 
 		final JavaTypeFactoryImpl typeFactory = createTypeFactory();
-		final CalciteCatalogReader calciteCatalogReader = createCatalogReader(rootSchemaName, rootSchema, typeFactory);
+		final CalciteCatalogReader calciteCatalogReader = createCatalogReader(schemaName, this.rootSchema, typeFactory);
 		final SqlOperatorTable operatorTable = createOperatorTable(calciteCatalogReader);
 		final SqlParser.Config parserConfig = createParserConfig();
-		final SchemaPlus schemaPlus = rootSchema.getSubSchema(rootSchemaName);
+		final SchemaPlus schemaPlus = this.rootSchema.getSubSchema(schemaName);
 		final FrameworkConfig frameworkConfig = createFrameworkConfig(schemaPlus, operatorTable, parserConfig);
 
+		if (this.planner != null) {
+			this.planner.close();
+		}
+
+		this.defaultSchemaName = schemaName;
 		this.planner = createPlanner(frameworkConfig);
 		this.hepPlanner = createHepPlanner(frameworkConfig);
+		this.joinReorderPlanner = createJoinReorderPlanner(frameworkConfig);
 	}
 
 	/// Return the default dialect used
@@ -85,6 +151,10 @@ public class RelationalAlgebraGenerator {
 
 	/// Parse a sql string into a sql tree
 	public SqlNode getSqlNode(final String sql) throws SqlParseException {
+		// The planner is re-used for every query,
+		// so make sure to reset any state from the last one
+		this.planner.close();
+
 		try {
 			return this.planner.parse(sql);
 		} catch (final SqlParseException e) {
@@ -121,11 +191,202 @@ public class RelationalAlgebraGenerator {
 		return this.hepPlanner.findBestExp();
 	}
 
+	/// Turn a non-optimized algebra into an optimized one, optionally reordering the joins
+	public RelNode getOptimizedRelationalAlgebra(final RelNode nonOptimizedPlan, final boolean reorderJoins) {
+		final RelNode optimizedPlan = getOptimizedRelationalAlgebra(nonOptimizedPlan);
+		if (!reorderJoins) {
+			return optimizedPlan;
+		}
+
+		// The join order is chosen based on the table statistics
+		// and the dask-specific cost model
+		final List<RelMetadataProvider> metadataProviders = new ArrayList<>();
+		metadataProviders.add(DaskRelMetadataProvider.INSTANCE);
+		this.joinReorderPlanner.registerMetadataProviders(metadataProviders);
+		final RelMetadataProvider metadataProvider = ChainedRelMetadataProvider.of(metadataProviders);
+
+		optimizedPlan.getCluster().setMetadataProvider(metadataProvider);
+		RelMetadataQuery.THREAD_PROVIDERS.set(JaninoRelMetadataProvider.of(metadataProvider));
+		optimizedPlan.getCluster().invalidateMetadataQuery();
+
+		try {
+			this.joinReorderPlanner.setRoot(optimizedPlan);
+			final RelNode reorderedPlan = this.joinReorderPlanner.findBestExp();
+
+			// Should not happen, but we can not execute multi joins
+			if (containsMultiJoin(reorderedPlan)) {
+				return optimizedPlan;
+			}
+			return reorderedPlan;
+		} finally {
+			RelMetadataQuery.THREAD_PROVIDERS.remove();
+		}
+	}
+
+	/// Replace all dynamic parameters (?) of an (optimized) rel node by literals with the given values
+	static public RelNode bindParameters(final RelNode relNode, final List<Object> parameters) {
+		final RexBuilder rexBuilder = relNode.getCluster().getRexBuilder();
+
+		final RexShuttle parameterReplacer = new RexShuttle() {
+			@Override
+			public RexNode visitDynamicParam(final RexDynamicParam dynamicParam) {
+				final Object value = parameters.get(dynamicParam.getIndex());
+				return createParameterLiteral(rexBuilder, value, dynamicParam.getType());
+			}
+		};
+
+		return relNode.accept(new RelHomogeneousShuttle() {
+			@Override
+			public RelNode visit(final RelNode other) {
+				return super.visit(other).accept(parameterReplacer);
+			}
+		});
+	}
+
 	/// Return the string representation of a rel node
 	public String getRelationalAlgebraString(final RelNode relNode) {
 		return RelOptUtil.toString(relNode);
 	}
 
+	/// Export everything python needs to know about the rel nodes of a plan
+	/// (class, inputs, row type, ...) with a single call as JSON,
+	/// instead of many small calls from python into java.
+	/// The rel nodes are ordered as in getRelationalAlgebraNodes.
+	static public String getRelationalAlgebraJson(final RelNode relNode) {
+		final JsonBuilder jsonBuilder = new JsonBuilder();
+		final Map<String, Object> rels = jsonBuilder.map();
+
+		for (final RelNode node : getRelationalAlgebraNodes(relNode)) {
+			final List<Object> inputs = jsonBuilder.list();
+			for (final RelNode input : node.getInputs()) {
+				inputs.add(input.getId());
+			}
+
+			final List<Object> fieldNames = jsonBuilder.list();
+			final List<Object> fieldTypes = jsonBuilder.list();
+			for (final RelDataTypeField field : node.getRowType().getFieldList()) {
+				fieldNames.add(field.getName());
+				fieldTypes.add(field.getType().toString());
+			}
+
+			final Map<String, Object> rel = jsonBuilder.map();
+			rel.put("class", node.getClass().getName());
+			rel.put("inputs", inputs);
+			rel.put("fieldNames", fieldNames);
+			rel.put("fieldTypes", fieldTypes);
+			rel.put("explain", explainNode(node));
+			rel.put("deterministic", hasDeterministicExpressions(node));
+			rel.put("hints", getHints(node, jsonBuilder));
+			rels.put(String.valueOf(node.getId()), rel);
+		}
+
+		return jsonBuilder.toJsonString(rels);
+	}
+
+	/// Return all (distinct) rel nodes of a plan, starting with the root
+	static public List<RelNode> getRelationalAlgebraNodes(final RelNode relNode) {
+		final Set<Integer> visitedIds = new HashSet<>();
+		final List<RelNode> nodes = new ArrayList<>();
+
+		new RelVisitor() {
+			@Override
+			public void visit(final RelNode node, final int ordinal, final RelNode parent) {
+				if (!visitedIds.add(node.getId())) {
+					return;
+				}
+				nodes.add(node);
+				super.visit(node, ordinal, parent);
+			}
+		}.go(relNode);
+
+		return nodes;
+	}
+
+	/// Return the hints (e.g. /*+ BROADCAST(t) */) attached to the rel node as list of name and options
+	static private List<Object> getHints(final RelNode relNode, final JsonBuilder jsonBuilder) {
+		final List<Object> hints = jsonBuilder.list();
+		if (!(relNode instanceof Hintable)) {
+			return hints;
+		}
+
+		for (final RelHint relHint : ((Hintable) relNode).getHints()) {
+			final Map<String, Object> hint = jsonBuilder.map();
+			hint.put("name", relHint.hintName);
+			hint.put("options", new ArrayList<Object>(relHint.listOptions));
+			hints.add(hint);
+		}
+		return hints;
+	}
+
+	/// Return the one-line explanation of the rel node itself (without its inputs),
+	/// e.g. LogicalFilter(condition=[>($0, 1)])
+	static private String explainNode(final RelNode relNode) {
+		final List<String> terms = new ArrayList<>();
+		relNode.explainTerms(new RelWriter() {
+			@Override
+			public void explain(final RelNode rel, final List<Pair<String, Object>> valueList) {
+			}
+
+			@Override
+			public SqlExplainLevel getDetailLevel() {
+				return SqlExplainLevel.EXPPLAN_ATTRIBUTES;
+			}
+
+			@Override
+			public RelWriter item(final String term, final Object value) {
+				// The inputs are exported by their id
+				if (!(value instanceof RelNode)) {
+					terms.add(term + "=[" + value + "]");
+				}
+				return this;
+			}
+
+			@Override
+			public RelWriter done(final RelNode node) {
+				return this;
+			}
+		});
+		return relNode.getRelTypeName() + "(" + String.join(", ", terms) + ")";
+	}
+
+	/// Check if all expressions of the rel node (not its inputs) are deterministic
+	static private boolean hasDeterministicExpressions(final RelNode relNode) {
+		final boolean[] deterministic = { true };
+		relNode.accept(new RexShuttle() {
+			@Override
+			public RexNode visitCall(final RexCall call) {
+				final SqlOperator operator = call.getOperator();
+				if (!operator.isDeterministic() || operator.isDynamicFunction()) {
+					deterministic[0] = false;
+				}
+				return super.visitCall(call);
+			}
+		});
+		return deterministic[0];
+	}
+
+	static private RexNode createParameterLiteral(final RexBuilder rexBuilder, final Object value,
+			final RelDataType type) {
+		if (value == null) {
+			return rexBuilder.makeNullLiteral(type);
+		}
+		if (value instanceof String) {
+			// The character set of the parameter type is not always known,
+			// so strings are used as they are for character parameters
+			final RexNode literal = rexBuilder.makeLiteral((String) value);
+			if (SqlTypeUtil.inCharFamily(type) || type.getSqlTypeName() == SqlTypeName.ANY) {
+				return literal;
+			}
+			// All other strings (e.g. '2021-01-01' for a date) are converted
+			// into a literal of the parameter type, as the plan is already typed
+			final List<RexNode> reducedLiterals = new ArrayList<>();
+			new RexExecutorImpl(null).reduce(rexBuilder, Collections.singletonList(rexBuilder.makeCast(type, literal)),
+					reducedLiterals);
+			return reducedLiterals.get(0);
+		}
+		return rexBuilder.makeLiteral(value, type, true);
+	}
+
 	private Planner createPlanner(final FrameworkConfig config) {
 		return Frameworks.getPlanner(config);
 	}
@@ -134,13 +395,9 @@ public class RelationalAlgebraGenerator {
 		return new JavaTypeFactoryImpl(DaskSqlDialect.DASKSQL_TYPE_SYSTEM);
 	}
 
-	private SchemaPlus createRootSchema(final String rootSchemaName, final List<DaskSchema> schemas) throws SQLException {
+	private SchemaPlus createRootSchema(final String rootSchemaName) throws SQLException {
 		final CalciteConnection calciteConnection = createConnection(rootSchemaName);
-		final SchemaPlus rootSchema = calciteConnection.getRootSchema();
-		for(DaskSchema schema : schemas) {
-			rootSchema.add(schema.getName(), schema);
-		}
-		return rootSchema;
+		return calciteConnection.getRootSchema();
 	}
 
 	private CalciteConnection createConnection(final String schemaName) throws SQLException {
@@ -191,8 +448,49 @@ public class RelationalAlgebraGenerator {
 		final Context defaultContext = Contexts.of(CalciteConnectionConfig.DEFAULT.set(
 				CalciteConnectionProperty.TYPE_SYSTEM, "com.dask.sql.application.DaskSqlDialect#DASKSQL_TYPE_SYSTEM"));
 
+		// Hints are only kept on the rel nodes, if they are known
+		final SqlToRelConverter.Config sqlToRelConverterConfig = SqlToRelConverter.config()
+				.withHintStrategyTable(createHintStrategyTable());
+
 		return Frameworks.newConfigBuilder().context(defaultContext).defaultSchema(schemaPlus)
-				.parserConfig(parserConfig).executor(new RexExecutorImpl(null)).operatorTable(operatorTable).build();
+				.parserConfig(parserConfig).sqlToRelConverterConfig(sqlToRelConverterConfig)
+				.executor(new RexExecutorImpl(null)).operatorTable(operatorTable).build();
+	}
+
+	/// The hints understood by dask-sql and the rel nodes they apply to
+	static private HintStrategyTable createHintStrategyTable() {
+		return HintStrategyTable.builder()
+				// Broadcast the given table (or the smaller side) of a join to every partition of the other side
+				.hintStrategy("BROADCAST", HintPredicates.JOIN).build();
+	}
+
+	private HepPlanner createJoinReorderPlanner(final FrameworkConfig config) {
+		final HepProgram program = new HepProgramBuilder()
+				// First collect all (directly) connected joins into a single multi join...
+				.addMatchOrder(HepMatchOrder.BOTTOM_UP)
+				.addRuleInstance(CoreRules.JOIN_TO_MULTI_JOIN)
+				// ...then find the cheapest order of joining its inputs...
+				.addRuleInstance(CoreRules.MULTI_JOIN_OPTIMIZE)
+				// ...and clean up the projections, which were added to keep the column order
+				.addRuleInstance(CoreRules.PROJECT_MERGE)
+				.build();
+
+		return new HepPlanner(program, config.getContext());
+	}
+
+	static private boolean containsMultiJoin(final RelNode relNode) {
+		final boolean[] found = { false };
+		new RelVisitor() {
+			@Override
+			public void visit(final RelNode node, final int ordinal, final RelNode parent) {
+				if (node instanceof MultiJoin) {
+					found[0] = true;
+					return;
+				}
+				super.visit(node, ordinal, parent);
+			}
+		}.go(relNode);
+		return found[0];
 	}
 
 	private HepPlanner createHepPlanner(final FrameworkConfig config) {
@@ -209,6 +507,11 @@ public class RelationalAlgebraGenerator {
 				.addRuleInstance(CoreRules.FILTER_INTO_JOIN)
 				.addRuleInstance(CoreRules.PROJECT_MERGE)
 				.addRuleInstance(CoreRules.FILTER_MERGE)
+				// IN and EXISTS subqueries are decorrelated into joins with the distinct
+				// keys of the subquery - turn them into semi joins (and NOT EXISTS into anti joins)
+				// before the projections are pushed into the join
+				.addRuleInstance(CoreRules.PROJECT_TO_SEMI_JOIN)
+				.addRuleInstance(DaskAntiJoinRule.INSTANCE)
 				.addRuleInstance(CoreRules.PROJECT_JOIN_TRANSPOSE)
 				// In principle, not a bad idea. But we need to keep the most
 				// outer project - because otherwise the column name information is lost
@@ -0,0 +1,74 @@
+package com.dask.sql.parser;
+
+import java.util.HashMap;
+import java.util.List;
+
+import org.apache.calcite.sql.SqlCreate;
+import org.apache.calcite.sql.SqlIdentifier;
+import org.apache.calcite.sql.SqlKind;
+import org.apache.calcite.sql.SqlNode;
+import org.apache.calcite.sql.SqlOperator;
+import org.apache.calcite.sql.SqlSpecialOperator;
+import org.apache.calcite.sql.SqlWriter;
+import org.apache.calcite.sql.parser.SqlParserPos;
+
+public class SqlCreateMaterializedView extends SqlCreate {
+    private static final SqlOperator OPERATOR = new SqlSpecialOperator("CREATE MATERIALIZED VIEW",
+            SqlKind.CREATE_MATERIALIZED_VIEW);
+
+    final SqlIdentifier tableName;
+    final SqlKwargs kwargs;
+    final SqlNode select;
+
+    public SqlCreateMaterializedView(final SqlParserPos pos, final boolean replace, final boolean ifNotExists,
+            final SqlIdentifier tableName, final SqlKwargs kwargs, final SqlNode select) {
+        super(OPERATOR, pos, replace, ifNotExists);
+        this.tableName = tableName;
+        this.kwargs = kwargs;
+        this.select = select;
+    }
+
+    @Override
+    public void unparse(SqlWriter writer, int leftPrec, int rightPrec) {
+        if (this.getReplace()) {
+            writer.keyword("CREATE OR REPLACE MATERIALIZED VIEW");
+        } else {
+            writer.keyword("CREATE MATERIALIZED VIEW");
+        }
+        if (this.getIfNotExists()) {
+            writer.keyword("IF NOT EXISTS");
+        }
+        this.tableName.unparse(writer, leftPrec, rightPrec);
+        if (this.kwargs != null) {
+            writer.keyword("WITH (");
+            this.kwargs.unparse(writer, leftPrec, rightPrec);
+            writer.keyword(")");
+        }
+        writer.keyword("AS");
+        this.select.unparse(writer, leftPrec, rightPrec);
+    }
+
+    @Override
+    public List<SqlNode> getOperandList() {
+        throw new UnsupportedOperationException();
+    }
+
+    public SqlIdentifier getTableName() {
+        return this.tableName;
+    }
+
+    public HashMap<SqlNode, SqlNode> getKwargs() {
+        if (this.kwargs == null) {
+            return new HashMap<SqlNode, SqlNode>();
+        }
+        return this.kwargs.getMap();
+    }
+
+    public SqlNode getSelect() {
+        return this.select;
+    }
+
+    public boolean getIfNotExists() {
+        return this.ifNotExists;
+    }
+}
@@ -0,0 +1,38 @@
+package com.dask.sql.parser;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import org.apache.calcite.sql.SqlCall;
+import org.apache.calcite.sql.SqlNode;
+import org.apache.calcite.sql.SqlOperator;
+import org.apache.calcite.sql.SqlWriter;
+import org.apache.calcite.sql.parser.SqlParserPos;
+
+public class SqlExplainAnalyze extends SqlCall {
+    final SqlNode query;
+
+    public SqlExplainAnalyze(final SqlParserPos pos, final SqlNode query) {
+        super(pos);
+        this.query = query;
+    }
+
+    public SqlOperator getOperator() {
+        throw new UnsupportedOperationException();
+    }
+
+    public List<SqlNode> getOperandList() {
+        ArrayList<SqlNode> operandList = new ArrayList<SqlNode>();
+        return operandList;
+    }
+
+    public SqlNode getQuery() {
+        return this.query;
+    }
+
+    @Override
+    public void unparse(SqlWriter writer, int leftPrec, int rightPrec) {
+        writer.keyword("EXPLAIN ANALYZE");
+        this.query.unparse(writer, leftPrec, rightPrec);
+    }
+}
@@ -0,0 +1,39 @@
+package com.dask.sql.parser;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import org.apache.calcite.sql.SqlCall;
+import org.apache.calcite.sql.SqlIdentifier;
+import org.apache.calcite.sql.SqlNode;
+import org.apache.calcite.sql.SqlOperator;
+import org.apache.calcite.sql.SqlWriter;
+import org.apache.calcite.sql.parser.SqlParserPos;
+
+public class SqlRefreshMaterializedView extends SqlCall {
+    final SqlIdentifier tableName;
+
+    public SqlRefreshMaterializedView(final SqlParserPos pos, final SqlIdentifier tableName) {
+        super(pos);
+        this.tableName = tableName;
+    }
+
+    public SqlOperator getOperator() {
+        throw new UnsupportedOperationException();
+    }
+
+    public List<SqlNode> getOperandList() {
+        ArrayList<SqlNode> operandList = new ArrayList<SqlNode>();
+        return operandList;
+    }
+
+    public SqlIdentifier getTableName() {
+        return this.tableName;
+    }
+
+    @Override
+    public void unparse(SqlWriter writer, int leftPrec, int rightPrec) {
+        writer.keyword("REFRESH MATERIALIZED VIEW");
+        this.tableName.unparse(writer, leftPrec, rightPrec);
+    }
+}
@@ -48,6 +48,11 @@ public class DaskSchema implements Schema {
 		this.databaseTables.put(table.getTableName(), table);
 	}
 
+	/// Remove the table with the given name (if present)
+	public void removeTable(final String name) {
+		this.databaseTables.remove(name);
+	}
+
 	/// Add an already created scalar function to the list
 	public void addFunction(final DaskScalarFunction function) {
 		this.functions.add(function);
@@ -58,6 +63,11 @@ public class DaskSchema implements Schema {
 		this.functions.add(function);
 	}
 
+	/// Remove all functions (scalar or aggregation) with the given name
+	public void removeFunction(final String name) {
+		this.functions.removeIf(function -> function.getFunctionName().equals(name));
+	}
+
 	/// Get the name of this schema
 	public String getName() {
 		return this.name;
@@ -1,7 +1,11 @@
 package com.dask.sql.schema;
 
 import java.util.ArrayList;
+import java.util.HashMap;
 import java.util.List;
+import java.util.Map;
+
+import com.google.common.collect.ImmutableList;
 
 import org.apache.calcite.DataContext;
 import org.apache.calcite.config.CalciteConnectionConfig;
@@ -22,17 +26,28 @@ import org.apache.calcite.util.Pair;
  * A table in the form, that calcite understands.
  *
  * Basically just a list of columns, each column being a column name and a type.
+ * Optionally, the table also stores statistics (row count, distinct counts and
+ * null fractions of the columns), which are used during the optimization.
  */
 public class DaskTable implements ProjectableFilterableTable {
 	// List of columns (name, column type)
 	private final ArrayList<Pair<String, SqlTypeName>> tableColumns;
 	// Name of this table
 	private final String name;
+	// Estimated number of rows (or null if unknown)
+	private Double rowCount;
+	// Estimated number of distinct values per column name (if known)
+	private final Map<String, Double> distinctCounts;
+	// Estimated fraction of null values per column name (if known)
+	private final Map<String, Double> nullFractions;
 
 	/// Construct a new table with the given name
 	public DaskTable(final String name) {
 		this.name = name;
 		this.tableColumns = new ArrayList<Pair<String, SqlTypeName>>();
+		this.rowCount = null;
+		this.distinctCounts = new HashMap<String, Double>();
+		this.nullFractions = new HashMap<String, Double>();
 	}
 
 	/// Add a column with the given type
@@ -40,6 +55,36 @@ public class DaskTable implements ProjectableFilterableTable {
 		this.tableColumns.add(new Pair<>(columnName, columnType));
 	}
 
+	/// Set the (estimated) number of rows
+	public void setRowCount(final double rowCount) {
+		this.rowCount = rowCount;
+	}
+
+	/// Set the (estimated) statistics of a column. Unknown values can be null.
+	public void setColumnStatistics(final String columnName, final Double distinctCount, final Double nullFraction) {
+		if (distinctCount != null) {
+			this.distinctCounts.put(columnName, distinctCount);
+		}
+		if (nullFraction != null) {
+			this.nullFractions.put(columnName, nullFraction);
+		}
+	}
+
+	/// Return the (estimated) number of rows or null if unknown
+	public Double getRowCount() {
+		return this.rowCount;
+	}
+
+	/// Return the (estimated) number of distinct values of the column with the given index or null if unknown
+	public Double getDistinctCount(final int columnIndex) {
+		return this.distinctCounts.get(this.tableColumns.get(columnIndex).getKey());
+	}
+
+	/// Return the (estimated) fraction of null values of the column with the given index or null if unknown
+	public Double getNullFraction(final int columnIndex) {
+		return this.nullFractions.get(this.tableColumns.get(columnIndex).getKey());
+	}
+
 	/// return the table name
 	public String getTableName() {
 		return this.name;
@@ -58,10 +103,15 @@ public class DaskTable implements ProjectableFilterableTable {
 		return builder.build();
 	}
 
-	/// calcite method: statistics of this table (not implemented)
+	/// calcite method: statistics of this table
 	@Override
 	public Statistic getStatistic() {
-		return Statistics.UNKNOWN;
+		if (this.rowCount == null) {
+			return Statistics.UNKNOWN;
+		}
+		// The distinct counts are only estimates, so we can not deduce
+		// any unique keys from them (which calcite would use to e.g. remove aggregations)
+		return Statistics.of(this.rowCount, ImmutableList.of());
 	}
 
 	/// calcite method: the type -> it is a table
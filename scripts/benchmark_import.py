@@ -0,0 +1,62 @@
+"""
+Measure how long it takes to import dask_sql
+(without starting the java virtual machine)
+and how long the first query needs additionally
+(including the start of the JVM).
+
+Every measurement runs in a fresh python process, call it with
+
+    python scripts/benchmark_import.py [--repeat N]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+IMPORT_CODE = """
+import time
+start = time.perf_counter()
+import dask_sql
+import jpype
+assert not jpype.isJVMStarted(), "Importing dask_sql started the JVM"
+print(time.perf_counter() - start)
+"""
+
+FIRST_QUERY_CODE = """
+import time
+import dask_sql
+start = time.perf_counter()
+dask_sql.Context().sql("SELECT 1")
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, repeat: int):
+    """Run the code in new processes and return the printed durations"""
+    durations = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        durations.append(float(output.strip().splitlines()[-1]))
+
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Number of measurements for each step"
+    )
+    args = parser.parse_args()
+
+    for name, code in [("import", IMPORT_CODE), ("first query", FIRST_QUERY_CODE)]:
+        durations = measure(code, args.repeat)
+        print(
+            f"{name}: median {statistics.median(durations):.3f}s, "
+            f"min {min(durations):.3f}s, max {max(durations):.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
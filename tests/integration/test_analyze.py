@@ -1,5 +1,7 @@
+import dask.dataframe as dd
 import numpy as np
 import pandas as pd
+import pytest
 from pandas.testing import assert_frame_equal
 
 
@@ -59,3 +61,70 @@ def test_analyze(c, df):
     result_df = result_df.compute()
 
     assert_frame_equal(result_df, expected_df[["a"]])
+
+
+def test_analyze_statistics(c, df):
+    c.sql("ANALYZE TABLE df COMPUTE STATISTICS FOR COLUMNS a")
+
+    statistics = c.schema[c.schema_name].tables["df"].statistics
+    assert statistics.row_count == 700
+    assert statistics.distinct_counts["a"] == pytest.approx(3, rel=0.1)
+    assert statistics.null_fractions["a"] == 0.0
+    assert "b" not in statistics.distinct_counts
+
+    # The statistics are only used for planning, the results stay the same
+    result_df = c.sql("SELECT a, b FROM df").compute()
+    assert_frame_equal(result_df.reset_index(drop=True), df)
+
+
+def test_analyze_lazy_table(c, tmpdir, monkeypatch):
+    df = pd.DataFrame({"a": [1, None, 3, 4], "b": [4.0, 5.0, 6.0, 7.0]})
+    df.to_parquet(str(tmpdir.join("data.parquet")), index=False)
+
+    read_columns = []
+    read_parquet = dd.read_parquet
+
+    def recording_read_parquet(*args, columns=None, **kwargs):
+        read_columns.append(columns)
+        return read_parquet(*args, columns=columns, **kwargs)
+
+    monkeypatch.setattr(dd, "read_parquet", recording_read_parquet)
+
+    c.create_table("lazy_df", str(tmpdir.join("data.parquet")), lazy=True)
+    c.sql("ANALYZE TABLE lazy_df COMPUTE STATISTICS FOR COLUMNS a")
+
+    # Only the analyzed column is read and the table stays lazy
+    assert read_columns[-1] == ["a"]
+    assert c.schema["root"].tables["lazy_df"]._df is None
+
+    statistics = c.schema["root"].tables["lazy_df"].statistics
+    assert statistics.row_count == 4
+    assert statistics.null_fractions["a"] == 0.25
+
+
+def test_explain_analyze(c, df):
+    result_df = c.sql("EXPLAIN ANALYZE SELECT a FROM df WHERE a > 1")
+    result_df = result_df.compute()
+
+    assert list(result_df.columns) == [
+        "Operator",
+        "Rows",
+        "Partitions",
+        "Bytes",
+        "Wall Time",
+        "CPU Time",
+        "Conversion Time",
+    ]
+
+    root = result_df.iloc[0]
+    assert not root["Operator"].startswith(" ")
+    assert root["Rows"] == (df.a > 1).sum()
+    assert root["Partitions"] == 3
+    assert root["Bytes"] > 0
+
+    table_scan = result_df.iloc[-1]
+    assert table_scan["Operator"].lstrip().startswith("LogicalTableScan")
+    assert table_scan["Operator"].startswith("  ")
+    assert table_scan["Rows"] == 700
+
+    assert (result_df[["Wall Time", "CPU Time", "Conversion Time"]] >= 0).all().all()
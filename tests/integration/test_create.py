@@ -79,6 +79,115 @@ def test_create_from_csv_persist(c, df, temporary_data_file):
     assert_frame_equal(df, return_df)
 
 
+@skip_if_external_scheduler
+def test_create_from_parquet_reads_needed_columns(c, temporary_data_file, monkeypatch):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]})
+    df.to_parquet(temporary_data_file, index=False)
+
+    read_columns = []
+    read_parquet = dd.read_parquet
+
+    def recording_read_parquet(*args, columns=None, **kwargs):
+        read_columns.append(columns)
+        return read_parquet(*args, columns=columns, **kwargs)
+
+    monkeypatch.setattr(dd, "read_parquet", recording_read_parquet)
+
+    c.create_table("new_table", temporary_data_file, format="parquet", persist=False)
+    assert read_columns == [None]
+
+    return_df = c.sql("SELECT b FROM new_table WHERE a > 1").compute()
+
+    assert read_columns == [None, ["a", "b"]]
+    assert_frame_equal(
+        return_df.reset_index(drop=True), pd.DataFrame({"b": [5.0, 6.0]})
+    )
+
+    return_df = c.sql("SELECT COUNT(*) AS c FROM new_table").compute()
+
+    assert read_columns[-1] == ["a"]
+    assert_frame_equal(return_df, pd.DataFrame({"c": [len(df)]}))
+
+
+@skip_if_external_scheduler
+def test_create_from_parquet_uses_filters(c, tmpdir, monkeypatch):
+    df = pd.DataFrame({"a": range(10), "b": list("abcdefghij")})
+    dd.from_pandas(df, npartitions=5).to_parquet(str(tmpdir), write_index=False)
+
+    read_filters = []
+    read_parquet = dd.read_parquet
+
+    def recording_read_parquet(*args, filters=None, **kwargs):
+        read_filters.append(filters)
+        return read_parquet(*args, filters=filters, **kwargs)
+
+    monkeypatch.setattr(dd, "read_parquet", recording_read_parquet)
+
+    c.create_table("new_table", str(tmpdir), format="parquet", persist=False)
+
+    return_df = c.sql(
+        "SELECT a, b FROM new_table WHERE a >= 4 AND 7 > a AND b <> 'f'"
+    ).compute()
+
+    assert read_filters[-1] == [("a", "<", 7), ("a", ">=", 4), ("b", "!=", "f")]
+    assert_frame_equal(
+        return_df.reset_index(drop=True), pd.DataFrame({"a": [4, 6], "b": ["e", "g"]}),
+    )
+
+    return_df = c.sql("SELECT a FROM new_table WHERE a IN (1, 8)").compute()
+
+    assert read_filters[-1] == [("a", "in", [1, 8])]
+    assert_frame_equal(return_df.reset_index(drop=True), pd.DataFrame({"a": [1, 8]}))
+
+
+@skip_if_external_scheduler
+def test_create_lazy(c, tmpdir, monkeypatch):
+    df = pd.DataFrame({"a": [1, 2, 3], "b": [4.0, 5.0, 6.0], "c": ["x", "y", "z"]})
+    df.to_parquet(str(tmpdir.join("data.parquet")), index=False)
+    df.to_csv(str(tmpdir.join("data.csv")), index=False)
+
+    read_columns = []
+    read_parquet = dd.read_parquet
+
+    def recording_read_parquet(*args, columns=None, **kwargs):
+        read_columns.append(columns)
+        return read_parquet(*args, columns=columns, **kwargs)
+
+    monkeypatch.setattr(dd, "read_parquet", recording_read_parquet)
+
+    c.sql(
+        f"""
+        CREATE TABLE
+            lazy_parquet
+        WITH (
+            location = '{tmpdir.join("data.parquet")}',
+            lazy = True
+        )
+    """
+    )
+    c.create_table("lazy_csv", str(tmpdir.join("data.csv")), lazy=True)
+
+    # Only the types are known, no dataframe is created yet
+    assert c.schema["root"].tables["lazy_parquet"]._df is None
+    assert c.schema["root"].tables["lazy_csv"]._df is None
+    assert read_columns == [None]
+
+    return_df = c.sql(
+        """
+        SELECT p.c, l.b
+        FROM lazy_parquet AS p
+        JOIN lazy_csv AS l ON p.a = l.a
+        WHERE p.a > 1
+        """
+    ).compute()
+
+    assert read_columns[-1] == ["a", "c"]
+    assert_frame_equal(
+        return_df.sort_values("c").reset_index(drop=True),
+        pd.DataFrame({"c": ["y", "z"], "b": [5.0, 6.0]}),
+    )
+
+
 def test_wrong_create(c):
     with pytest.raises(AttributeError):
         c.sql(
@@ -345,3 +454,98 @@ def test_drop(c):
 
     with pytest.raises(dask_sql.utils.ParsingException):
         c.sql("SELECT a FROM new_table")
+
+
+def test_create_materialized_view(c):
+    df = pd.DataFrame({"a": [1, 1, 2], "b": [1.0, 2.0, 3.0]})
+    c.create_table("source_table", df)
+
+    c.sql(
+        """
+        CREATE MATERIALIZED VIEW
+            new_view
+        AS (
+            SELECT a, SUM(b) AS s FROM source_table GROUP BY a
+        )
+    """
+    )
+
+    expected_df = pd.DataFrame({"a": [1, 2], "s": [3.0, 3.0]})
+    return_df = c.sql("SELECT * FROM new_view").compute()
+    assert_frame_equal(return_df.sort_values("a").reset_index(drop=True), expected_df)
+
+    # The stored result does not change until the view is refreshed
+    c.create_table("source_table", df.assign(b=df.b * 2))
+    return_df = c.sql("SELECT * FROM new_view").compute()
+    assert_frame_equal(return_df.sort_values("a").reset_index(drop=True), expected_df)
+
+    c.sql("REFRESH MATERIALIZED VIEW new_view")
+    return_df = c.sql("SELECT * FROM new_view").compute()
+    assert_frame_equal(
+        return_df.sort_values("a").reset_index(drop=True),
+        expected_df.assign(s=expected_df.s * 2),
+    )
+
+    with pytest.raises(RuntimeError):
+        c.sql("REFRESH MATERIALIZED VIEW source_table")
+
+
+def test_refresh_materialized_view_incrementally(c):
+    df = pd.DataFrame({"a": [1, 1, 2, 2], "b": [1, 2, 3, 4]})
+    ddf = dd.from_pandas(df, npartitions=2)
+    c.create_table("source_table", ddf)
+
+    c.sql(
+        """
+        CREATE MATERIALIZED VIEW
+            new_view
+        WITH (
+            incremental = True
+        )
+        AS (
+            SELECT a, COUNT(*) AS c, SUM(b) AS s, MAX(b) AS m
+            FROM source_table
+            WHERE b > 1
+            GROUP BY a
+        )
+    """
+    )
+
+    new_df = pd.DataFrame({"a": [2, 3], "b": [5, 6]})
+    # The already processed partitions are changed as well,
+    # which is only noticed by a complete refresh
+    changed_ddf = dd.from_pandas(df.assign(b=df.b * 10), npartitions=2)
+    c.create_table(
+        "source_table", dd.concat([changed_ddf, dd.from_pandas(new_df, npartitions=1)])
+    )
+    source_dc = c.schema["root"].tables["source_table"]
+    source_version = c.schema["root"].table_versions["source_table"]
+    c.sql("REFRESH MATERIALIZED VIEW new_view")
+
+    # The source table is only replaced during the refresh
+    assert c.schema["root"].tables["source_table"] is source_dc
+    assert c.schema["root"].table_versions["source_table"] == source_version
+
+    return_df = c.sql("SELECT * FROM new_view").compute()
+    expected_df = pd.DataFrame(
+        {"a": [1, 2, 3], "c": [1, 3, 1], "s": [2, 12, 6], "m": [2, 5, 6]}
+    )
+    assert_frame_equal(
+        return_df.sort_values("a").reset_index(drop=True),
+        expected_df,
+        check_dtype=False,
+    )
+
+    with pytest.raises(NotImplementedError):
+        c.sql(
+            """
+            CREATE MATERIALIZED VIEW
+                other_view
+            WITH (
+                incremental = True
+            )
+            AS (
+                SELECT a, COUNT(DISTINCT b) AS c FROM source_table GROUP BY a
+            )
+        """
+        )
@@ -1,3 +1,6 @@
+import re
+
+import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 import pytest
@@ -122,6 +125,123 @@ def test_join_complex(c):
     assert_frame_equal(df.sort_values(["a", "b0"]).reset_index(drop=True), df_expected)
 
 
+def test_join_complex_partitions(c):
+    lhs_df = pd.DataFrame({"x": [1.0, 2.0, np.NaN, 4.0, 5.0, 6.0]})
+    rhs_df = pd.DataFrame({"lower": [0, 3, 5, 7], "upper": [2, 4, 6, 8]})
+
+    c.create_table("lhs", dd.from_pandas(lhs_df, npartitions=3))
+    c.create_table("rhs", dd.from_pandas(rhs_df, npartitions=2))
+
+    # The filter is applied on every pair of partitions
+    df = c.sql(
+        """
+        SELECT lhs.x, rhs.lower
+        FROM lhs
+        JOIN rhs ON lhs.x - rhs.lower BETWEEN 0 AND rhs.upper - rhs.lower
+        """
+    )
+    assert df.npartitions == 6
+
+    df_expected = pd.DataFrame(
+        {"x": [1.0, 2.0, 4.0, 5.0, 6.0], "lower": [0, 0, 3, 5, 5]}
+    )
+    assert_frame_equal(
+        df.compute().sort_values("x").reset_index(drop=True),
+        df_expected,
+        check_dtype=False,
+    )
+
+    # Rows without any match are still kept in outer joins
+    df = c.sql(
+        "SELECT lhs.x, rhs.lower FROM lhs LEFT JOIN rhs ON lhs.x > rhs.upper + 3"
+    ).compute()
+
+    df_expected = pd.DataFrame(
+        {
+            "x": [1.0, 2.0, 4.0, 5.0, 6.0, np.NaN],
+            "lower": [np.NaN, np.NaN, np.NaN, np.NaN, 0, np.NaN],
+        }
+    )
+    assert_frame_equal(
+        df.sort_values(["x", "lower"]).reset_index(drop=True),
+        df_expected.sort_values(["x", "lower"]).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_join_band(c):
+    events_df = pd.DataFrame(
+        {
+            "ts": pd.to_datetime(
+                [
+                    "2021-01-01 10:00",
+                    "2021-01-01 10:30",
+                    "2021-01-01 11:00",
+                    "2021-01-01 12:15",
+                    None,
+                    "2021-01-02 09:00",
+                ]
+            ),
+            "event": range(6),
+        }
+    )
+    sessions_df = pd.DataFrame(
+        {
+            "session": [1, 2, 3],
+            "start_ts": pd.to_datetime(
+                ["2021-01-01 09:45", "2021-01-01 11:00", "2021-01-01 12:00"]
+            ),
+            "end_ts": pd.to_datetime(
+                ["2021-01-01 11:00", "2021-01-01 11:30", "2021-01-01 13:00"]
+            ),
+        }
+    )
+
+    c.create_table("events", dd.from_pandas(events_df, npartitions=3))
+    c.create_table("sessions", dd.from_pandas(sessions_df, npartitions=2))
+
+    # Both sides are partitioned by ranges of ts, so there is no cross join
+    # of all partitions
+    df = c.sql(
+        """
+        SELECT events.event, sessions.session
+        FROM events
+        JOIN sessions ON events.ts BETWEEN sessions.start_ts AND sessions.end_ts
+        """
+    )
+    assert df.npartitions <= 3
+
+    df_expected = pd.DataFrame({"event": [0, 1, 2, 2, 3], "session": [1, 1, 1, 2, 3]})
+    assert_frame_equal(
+        df.compute().sort_values(["event", "session"]).reset_index(drop=True),
+        df_expected,
+        check_dtype=False,
+    )
+
+    # Strict bounds, additional conditions and unmatched rows
+    df = c.sql(
+        """
+        SELECT events.event, sessions.session
+        FROM events
+        LEFT JOIN sessions
+        ON events.ts > sessions.start_ts AND events.ts < sessions.end_ts
+            AND events.event <> sessions.session
+        """
+    ).compute()
+
+    df_expected = pd.DataFrame(
+        {
+            "event": [0, 1, 2, 3, 4, 5],
+            "session": [1, np.NaN, np.NaN, np.NaN, np.NaN, np.NaN],
+        }
+    )
+    assert_frame_equal(
+        df.sort_values(["event", "session"]).reset_index(drop=True),
+        df_expected,
+        check_dtype=False,
+    )
+
+
 def test_join_complex_2(c):
     df = c.sql(
         """
@@ -142,6 +262,57 @@ def test_join_complex_2(c):
     assert_frame_equal(df.sort_values("b").reset_index(drop=True), df_expected)
 
 
+def test_join_outer_filter(c):
+    # Duplicated rows need to stay duplicated
+    orders_df = pd.DataFrame(
+        {"customer_id": [1, 1, 2, 3, None], "amount": [10, 10, 20, 30, 40]}
+    )
+    customers_df = pd.DataFrame(
+        {"id": [1.0, 2.0, 4.0], "status": ["active", "x", "active"]}
+    )
+
+    c.create_table("orders", dd.from_pandas(orders_df, npartitions=2))
+    c.create_table("customers", dd.from_pandas(customers_df, npartitions=2))
+
+    df = c.sql(
+        """
+        SELECT orders.amount, customers.id
+        FROM orders
+        LEFT JOIN customers ON orders.customer_id = customers.id AND customers.status <> 'x'
+        """
+    ).compute()
+
+    df_expected = pd.DataFrame(
+        {"amount": [10, 10, 20, 30, 40], "id": [1, 1, np.NaN, np.NaN, np.NaN]}
+    )
+    assert_frame_equal(
+        df.sort_values(["amount", "id"]).reset_index(drop=True),
+        df_expected,
+        check_dtype=False,
+    )
+
+    # Unmatched rows of both sides are kept in a full join
+    df = c.sql(
+        """
+        SELECT orders.amount, customers.id
+        FROM orders
+        FULL JOIN customers ON orders.customer_id = customers.id AND customers.status <> 'x'
+        """
+    ).compute()
+
+    df_expected = pd.DataFrame(
+        {
+            "amount": [10, 10, 20, 30, 40, np.NaN, np.NaN],
+            "id": [1, 1, np.NaN, np.NaN, np.NaN, 2, 4],
+        }
+    )
+    assert_frame_equal(
+        df.sort_values(["amount", "id"]).reset_index(drop=True),
+        df_expected,
+        check_dtype=False,
+    )
+
+
 def test_join_literal(c):
     df = c.sql(
         """
@@ -330,3 +501,192 @@ def test_join_lricomplex(c):
         .reset_index(drop=True),
         check_dtype=False,
     )
+
+
+def test_join_reorder(c):
+    fact_df = pd.DataFrame(
+        {
+            "a_id": np.arange(1000) % 10,
+            "b_id": np.arange(1000) % 5,
+            "x": np.arange(1000),
+        }
+    )
+    a_df = pd.DataFrame({"a_id": range(10), "a": range(10)})
+    b_df = pd.DataFrame({"b_id": range(5), "b": range(5)})
+
+    c.create_table("fact", fact_df)
+    c.create_table("dim_a", a_df)
+    c.create_table("dim_b", b_df)
+    c.sql("ANALYZE TABLE fact COMPUTE STATISTICS FOR ALL COLUMNS")
+
+    query = """
+        SELECT fact.x, dim_a.a, dim_b.b
+        FROM fact
+        JOIN dim_a ON fact.a_id = dim_a.a_id
+        JOIN dim_b ON fact.b_id = dim_b.b_id
+        WHERE dim_b.b > 2
+    """
+
+    result_df = c.sql(query).compute()
+    reordered_df = c.sql(
+        query, config_options={"sql.optimizer.reorder_joins": True}
+    ).compute()
+
+    assert list(reordered_df.columns) == ["x", "a", "b"]
+    assert_frame_equal(
+        reordered_df.sort_values("x").reset_index(drop=True),
+        result_df.sort_values("x").reset_index(drop=True),
+    )
+
+    plan = c.explain(query)
+    assert _get_first_joined_tables(plan) == {"fact", "dim_a"}
+
+    # The filtered and smallest dimension table is joined first
+    reordered_plan = c.explain(
+        query, config_options={"sql.optimizer.reorder_joins": True}
+    )
+    assert reordered_plan.count("LogicalJoin") == 2
+    assert "MultiJoin" not in reordered_plan
+    assert _get_first_joined_tables(reordered_plan) == {"fact", "dim_b"}
+
+
+def _get_first_joined_tables(plan):
+    """Return the names of the tables read by the innermost join of the plan"""
+    lines = plan.splitlines()
+    join_line = max(i for i, line in enumerate(lines) if "LogicalJoin" in line)
+    join_indentation = len(lines[join_line]) - len(lines[join_line].lstrip())
+
+    tables = set()
+    for line in lines[join_line + 1 :]:
+        if len(line) - len(line.lstrip()) <= join_indentation:
+            break
+        match = re.search(r"LogicalTableScan\(table=\[\[\w+, (\w+)\]\]", line)
+        if match:
+            tables.add(match.group(1))
+    return tables
+
+
+def test_join_broadcast(c):
+    fact_df = pd.DataFrame({"dim_id": np.arange(100) % 7, "x": np.arange(100)})
+    dim_df = pd.DataFrame({"id": range(5), "name": list("abcde")})
+
+    c.create_table("fact", dd.from_pandas(fact_df, npartitions=4))
+    c.create_table("dim", dim_df)
+
+    expected_df = fact_df.merge(dim_df, left_on="dim_id", right_on="id")[["x", "name"]]
+
+    queries = [
+        "SELECT fact.x, dim.name FROM fact JOIN dim ON fact.dim_id = dim.id",
+        "SELECT /*+ BROADCAST(dim) */ fact.x, dim.name FROM fact JOIN dim ON fact.dim_id = dim.id",
+        "SELECT /*+ BROADCAST(fact) */ fact.x, dim.name FROM fact JOIN dim ON fact.dim_id = dim.id",
+    ]
+    for query in queries:
+        for broadcast in [None, True, False]:
+            df = c.sql(query, config_options={"sql.join.broadcast": broadcast})
+            assert list(df.columns) == ["x", "name"]
+
+            assert_frame_equal(
+                df.compute().sort_values("x").reset_index(drop=True),
+                expected_df.sort_values("x").reset_index(drop=True),
+                check_dtype=False,
+            )
+
+    # The broadcasted side is not shuffled: the result keeps the partitions of fact
+    df = c.sql(queries[1])
+    assert df.npartitions == 4
+
+    # Unmatched rows of a left join are kept
+    df = c.sql(
+        "SELECT /*+ BROADCAST(dim) */ fact.x, dim.name FROM fact LEFT JOIN dim ON fact.dim_id = dim.id"
+    ).compute()
+    assert len(df) == 100
+    assert df["name"].isna().sum() == (fact_df["dim_id"] >= 5).sum()
+
+
+def test_join_co_partitioned(c):
+    lhs_df = pd.DataFrame({"id": range(20), "x": range(20)})
+    rhs_df = pd.DataFrame({"id": np.arange(30) % 25, "y": range(30)})
+
+    divisions = [0, 7, 14, 24]
+    c.create_table(
+        "lhs",
+        dd.from_pandas(lhs_df, npartitions=2).set_index(
+            "id", drop=False, divisions=divisions
+        ),
+    )
+    c.create_table(
+        "rhs",
+        dd.from_pandas(rhs_df, npartitions=2).set_index(
+            "id", drop=False, divisions=divisions
+        ),
+    )
+
+    for join_type, how in [("JOIN", "inner"), ("LEFT JOIN", "left")]:
+        df = c.sql(
+            f"SELECT lhs.x, rhs.y FROM lhs {join_type} rhs ON lhs.id = rhs.id WHERE lhs.x > 2"
+        )
+
+        # Merged partition by partition, without a shuffle
+        assert df.npartitions == 3
+        assert not any("shuffle" in name for name in df.dask.layers)
+
+        expected_df = lhs_df[lhs_df["x"] > 2].merge(rhs_df, on="id", how=how)
+        assert_frame_equal(
+            df.compute().sort_values(["x", "y"]).reset_index(drop=True),
+            expected_df[["x", "y"]].sort_values(["x", "y"]).reset_index(drop=True),
+            check_dtype=False,
+        )
+
+    # Collecting statistics keeps the partitioning of the tables
+    c.sql("ANALYZE TABLE lhs COMPUTE STATISTICS FOR ALL COLUMNS")
+    c.sql("ANALYZE TABLE rhs COMPUTE STATISTICS FOR ALL COLUMNS")
+
+    df = c.sql("SELECT lhs.x, rhs.y FROM lhs JOIN rhs ON lhs.id = rhs.id")
+    assert df.npartitions == 3
+    assert not any("shuffle" in name for name in df.dask.layers)
+    assert len(df.compute()) == len(lhs_df.merge(rhs_df, on="id"))
+
+
+def test_join_semi_anti(c):
+    lhs_df = pd.DataFrame({"id": [1, 2, 3, 4, None], "x": [1, 2, 3, 4, 5]})
+    # Duplicated keys on the rhs must not duplicate rows of the lhs
+    rhs_df = pd.DataFrame({"id": [2, 2, 3, 3, 6], "y": [1, 2, 3, 10, 4]})
+    rhs_null_df = pd.DataFrame({"id": [2, None]})
+
+    c.create_table("lhs", dd.from_pandas(lhs_df, npartitions=2))
+    c.create_table("rhs", dd.from_pandas(rhs_df, npartitions=2))
+    c.create_table("rhs_null", dd.from_pandas(rhs_null_df, npartitions=1))
+
+    # query: (expected join type in the plan, expected result)
+    queries = {
+        "SELECT x FROM lhs WHERE id IN (SELECT id FROM rhs)": ("semi", [2, 3]),
+        "SELECT x FROM lhs WHERE EXISTS (SELECT * FROM rhs WHERE rhs.id = lhs.id)": (
+            "semi",
+            [2, 3],
+        ),
+        "SELECT x FROM lhs WHERE NOT EXISTS (SELECT * FROM rhs WHERE rhs.id = lhs.id)": (
+            "anti",
+            [1, 4, 5],
+        ),
+        "SELECT x FROM lhs WHERE EXISTS (SELECT * FROM rhs WHERE rhs.id = lhs.id AND rhs.y > lhs.x)": (
+            None,
+            [3],
+        ),
+        "SELECT x FROM lhs WHERE NOT EXISTS (SELECT * FROM rhs WHERE rhs.id = lhs.id AND rhs.y > lhs.x)": (
+            None,
+            [1, 2, 4, 5],
+        ),
+        # NOT IN is never true, if the subquery contains a NULL,
+        # so it can not be executed as anti join
+        "SELECT x FROM lhs WHERE id NOT IN (SELECT id FROM rhs_null)": (None, []),
+    }
+    for query, (join_type, expected) in queries.items():
+        plan = c.explain(query)
+        if join_type is not None:
+            assert f"joinType=[{join_type}]" in plan
+        if "NOT IN" in query:
+            assert "joinType=[anti]" not in plan
+
+        for broadcast in [True, False]:
+            df = c.sql(query, config_options={"sql.join.broadcast": broadcast})
+            assert sorted(df.compute()["x"].tolist()) == expected
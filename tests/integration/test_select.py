@@ -63,6 +63,75 @@ def test_select_expr(c, df):
     assert_frame_equal(result_df, expected_df)
 
 
+def test_select_common_expressions(c, df, monkeypatch):
+    from dask_sql.physical.rex.core import RexCallPlugin
+
+    converted_expressions = []
+    convert = RexCallPlugin.convert
+
+    def recording_convert(self, rex, dc, context):
+        converted_expressions.append(str(rex))
+        return convert(self, rex, dc, context)
+
+    monkeypatch.setattr(RexCallPlugin, "convert", recording_convert)
+
+    result_df = c.sql(
+        "SELECT a + 1 AS x, (a + 1) * 2 AS y, (a + 1) * 2 + b AS z FROM df"
+    )
+    result_df = result_df.compute()
+
+    # Every distinct expression is only converted once
+    assert len(converted_expressions) == 3
+    assert len(set(converted_expressions)) == 3
+
+    expected_df = pd.DataFrame(
+        {"x": df["a"] + 1, "y": (df["a"] + 1) * 2, "z": (df["a"] + 1) * 2 + df["b"],}
+    )
+    assert_frame_equal(result_df, expected_df)
+
+
+def test_select_common_subplans(c, df, monkeypatch):
+    from dask_sql.physical.rel.logical import LogicalFilterPlugin
+
+    converted_filters = []
+    convert = LogicalFilterPlugin.convert
+
+    def recording_convert(self, rel, context):
+        converted_filters.append(str(rel))
+        return convert(self, rel, context)
+
+    monkeypatch.setattr(LogicalFilterPlugin, "convert", recording_convert)
+
+    result_df = c.sql(
+        """
+        SELECT lhs.a AS a, rhs.b AS b
+        FROM (SELECT a, b FROM df WHERE a > 1) AS lhs
+        JOIN (SELECT a, b FROM df WHERE a > 1) AS rhs
+        ON lhs.a = rhs.a AND lhs.b = rhs.b
+        """
+    )
+    result_df = result_df.compute()
+
+    # The identical sub-queries are only converted once
+    assert len(converted_filters) == 1
+
+    expected_df = df[df["a"] > 1][["a", "b"]]
+    assert_frame_equal(
+        result_df.sort_values(["a", "b"]).reset_index(drop=True),
+        expected_df.sort_values(["a", "b"]).reset_index(drop=True),
+    )
+
+
+def test_select_same_graph(c):
+    sql = "SELECT a + 1 AS x, SUM(b) AS s FROM df WHERE b > 0.5 GROUP BY a + 1"
+
+    first_df = c.sql(sql)
+    second_df = c.sql(sql)
+
+    # The same query leads to the same dask keys
+    assert first_df._name == second_df._name
+
+
 def test_select_of_select(c, df):
     result_df = c.sql(
         """
@@ -1,9 +1,14 @@
+import time
+from datetime import date, datetime
 from time import sleep
 
+import dask.dataframe as dd
+import pandas as pd
 import pytest
 from fastapi.testclient import TestClient
 
-from dask_sql.server.app import _init_app, app
+from dask_sql.server.app import _init_app, _parse_literal, app
+from dask_sql.server.metrics import RunningQuery
 
 
 @pytest.fixture(scope="module")
@@ -168,6 +173,113 @@ def test_inf_table(app_client, user_table_inf):
     assert "error" not in result
 
 
+def test_prepared_statement(app_client, df):
+    app_client.app.c.create_table("prepared_table", df)
+
+    response = app_client.post(
+        "/v1/statement",
+        data="PREPARE my_query FROM SELECT b FROM prepared_table WHERE a = ?",
+    )
+    assert response.status_code == 200
+    assert "error" not in response.json()
+
+    added_prepare = response.headers["X-Presto-Added-Prepare"]
+    assert added_prepare.startswith("my_query=")
+
+    response = app_client.post(
+        "/v1/statement",
+        data="EXECUTE my_query USING 2",
+        headers={"X-Presto-Prepared-Statement": added_prepare},
+    )
+    assert response.status_code == 200
+
+    result = get_result_or_error(app_client, response)
+
+    expected = df[df["a"] == 2]["b"].tolist()
+    assert result["data"] == [[value] for value in expected]
+
+    # The parameters are not planned as queries on their own
+    plan_cache_size = len(app_client.app.c.plan_cache)
+    for parameter in ["3", "1 + 1"]:
+        response = app_client.post(
+            "/v1/statement",
+            data=f"EXECUTE my_query USING {parameter}",
+            headers={"X-Presto-Prepared-Statement": added_prepare},
+        )
+        result = get_result_or_error(app_client, response)
+        assert "error" not in result
+    assert len(app_client.app.c.plan_cache) == plan_cache_size
+
+    response = app_client.post("/v1/statement", data="EXECUTE my_query USING 2")
+    assert "error" in response.json()
+
+    response = app_client.post("/v1/statement", data="DEALLOCATE PREPARE my_query")
+    assert response.status_code == 200
+    assert response.headers["X-Presto-Deallocated-Prepare"] == "my_query"
+
+
+def test_statement_stats(app_client):
+    response = app_client.post("/v1/statement", data="SELECT 1 + 1")
+    assert response.status_code == 200
+    assert response.json()["stats"]["totalSplits"] == 1
+
+    result = get_result_or_error(app_client, response)
+
+    stats = result["stats"]
+    assert stats["state"] == "FINISHED"
+    assert stats["processedRows"] == 1
+    assert stats["completedSplits"] == stats["totalSplits"] == 1
+    assert stats["elapsedTimeMillis"] >= stats["wallTimeMillis"] >= 0
+
+
+def test_running_query_releases_splits(client):
+    df = dd.from_pandas(pd.DataFrame({"a": range(10)}), npartitions=2)
+
+    running_query = RunningQuery(client, df, time.perf_counter())
+    result = running_query.future.result()
+    assert len(result) == 10
+
+    # The partitions are not kept in addition to the result
+    while running_query.finish_time is None:
+        sleep(0.01)
+    assert running_query.splits == []
+
+    stats = running_query.get_statement_stats(result)
+    assert stats.completedSplits == stats.totalSplits == 2
+    assert stats.runningSplits == 0
+
+
+def test_metrics(app_client):
+    response = app_client.post("/v1/statement", data="SELECT 1 + 1")
+    get_result_or_error(app_client, response)
+    planning_count = get_metrics(app_client)["dask_sql_query_planning_seconds_count"]
+
+    # Failing queries count towards the planning time as well
+    app_client.post("/v1/statement", data="SELECT 1 + ")
+    metrics = get_metrics(app_client)
+
+    assert metrics['dask_sql_queries_total{outcome="success"}'] >= 1
+    assert metrics['dask_sql_queries_total{outcome="error"}'] >= 1
+    assert metrics["dask_sql_query_planning_seconds_count"] == planning_count + 1
+    assert metrics["dask_sql_query_execution_seconds_count"] >= 1
+    assert metrics["dask_sql_returned_rows_total"] >= 1
+    assert 'dask_sql_cache_hits_total{cache="plan"}' in metrics
+    assert "dask_sql_running_queries" in metrics
+
+
+def get_metrics(app_client):
+    response = app_client.get("/v1/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    metrics = {}
+    for line in response.text.splitlines():
+        if not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            metrics[name] = float(value)
+    return metrics
+
+
 def get_result_or_error(app_client, response):
     result = response.json()
 
@@ -195,3 +307,20 @@ def get_result_or_error(app_client, response):
         sleep(0.1)
 
     return result
+
+
+def test_parse_literal():
+    assert _parse_literal("NULL") is None
+    assert _parse_literal("true") is True
+    assert _parse_literal("-2") == -2
+    assert _parse_literal("1.5e2") == 150.0
+    assert _parse_literal("'it''s'") == "it's"
+    assert _parse_literal("DATE '2021-01-02'") == date(2021, 1, 2)
+    assert _parse_literal("TIMESTAMP '2021-01-02 03:04:05'") == datetime(
+        2021, 1, 2, 3, 4, 5
+    )
+    assert _parse_literal("DECIMAL '1.25'") == 1.25
+
+    # Everything else is evaluated by calcite
+    assert _parse_literal("1 + 1") is NotImplemented
+    assert _parse_literal("DATE 'not a date'") is NotImplemented
@@ -0,0 +1,59 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from dask_sql.cache import LRUCache, ResultCache
+
+
+def test_lru_cache():
+    cache = LRUCache(maxsize=2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.info() == (1, 1, 2, 2)
+
+
+def test_lru_cache_threads():
+    cache = LRUCache(maxsize=10)
+
+    def use_cache(i):
+        for key in range(100):
+            cache.put((i + key) % 20, key)
+            cache.get(key % 20)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(use_cache, range(8)))
+
+    info = cache.info()
+    assert info.hits + info.misses == 8 * 100
+    assert info.currsize == len(cache) == 10
+
+
+def test_result_cache():
+    cache = ResultCache(maxsize=100)
+
+    cache.put("a", 1, 60, ["t"])
+    cache.put("b", 2, 30, ["u"])
+    assert cache.get("a") == 1
+
+    # Evicts the least recently used entries until there is enough space
+    cache.put("c", 3, 30, ["t", "u"])
+    assert "a" in cache
+    assert "b" not in cache
+    assert cache.info().currsize == 90
+
+    # Too large for the cache
+    cache.put("d", 4, 101, [])
+    assert "d" not in cache
+
+    cache.invalidate("u")
+    assert "c" not in cache
+    assert len(cache) == 1
+
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.info().currsize == 0
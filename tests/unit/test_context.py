@@ -1,12 +1,17 @@
 import os
+import time
 import warnings
 
+import dask
 import dask.dataframe as dd
 import pandas as pd
 import pytest
 from pandas.testing import assert_frame_equal
 
 from dask_sql import Context
+from dask_sql.datacontainer import Statistics
+from dask_sql.physical.rel.plan import get_plan_info, get_plan_rels, is_deterministic
+from dask_sql.utils import ParsingException
 
 
 def test_add_remove_tables():
@@ -72,6 +77,31 @@ def test_explain():
     )
 
 
+def test_explain_analyze():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    sql_string = c.explain("SELECT * FROM df", analyze=True)
+    lines = sql_string.splitlines()
+
+    assert lines[0].split() == [
+        "Operator",
+        "Rows",
+        "Partitions",
+        "Bytes",
+        "Wall",
+        "Time",
+        "CPU",
+        "Time",
+        "Conversion",
+        "Time",
+    ]
+    assert "LogicalProject(a=[$0])" in lines[1]
+    assert "LogicalTableScan(table=[[root, df]])" in lines[2]
+
+
 def test_sql():
     c = Context()
 
@@ -255,3 +285,263 @@ def test_aggregation_adding():
     assert c.schema[c.schema_name].function_lists[1].parameters == [("x", str)]
     assert c.schema[c.schema_name].function_lists[1].return_type == str
     assert c.schema[c.schema_name].function_lists[1].aggregation
+
+
+def test_plan_cache():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    c.sql("SELECT a FROM df")
+    assert c.plan_cache.info().misses == 1
+    assert c.plan_cache.info().hits == 0
+
+    result = c.sql("  SELECT a FROM df ")
+    assert c.plan_cache.info().hits == 1
+    assert_frame_equal(result.compute(), data_frame.compute())
+
+    # Changing the schema invalidates the cached plans
+    c.create_table(
+        "df", dd.from_pandas(pd.DataFrame({"a": [4.0]}), npartitions=1),
+    )
+    result = c.sql("SELECT a FROM df")
+    assert c.plan_cache.info().misses == 2
+    assert_frame_equal(result.compute(), pd.DataFrame({"a": [4.0]}))
+
+    c.register_function(lambda x: x, "f", [("x", int)], int)
+    c.sql("SELECT a FROM df")
+    assert c.plan_cache.info().misses == 3
+
+
+def test_result_cache():
+    c = Context(result_cache_size=10 ** 6)
+
+    c.create_table("df", pd.DataFrame({"a": [1, 2, 3]}))
+    c.create_table("other", pd.DataFrame({"b": [1]}))
+
+    # Without a cluster, lazy results are not computed and therefore not cached
+    result = c.sql("SELECT a FROM df")
+    assert c.result_cache.info().misses == 1
+    assert len(c.result_cache) == 0
+
+    result = c.sql("SELECT a FROM df", return_futures=False)
+    assert c.result_cache.info().misses == 2
+    assert len(c.result_cache) == 1
+    assert_frame_equal(result, pd.DataFrame({"a": [1, 2, 3]}))
+
+    result = c.sql("SELECT a FROM df")
+    assert c.result_cache.info().hits == 1
+    assert_frame_equal(result.compute(), pd.DataFrame({"a": [1, 2, 3]}))
+
+    # Only results depending on the changed table are invalidated
+    c.sql("SELECT b FROM other", return_futures=False)
+    c.create_table("df", pd.DataFrame({"a": [4]}))
+    assert len(c.result_cache) == 1
+
+    result = c.sql("SELECT a FROM df", return_futures=False)
+    assert c.result_cache.info().misses == 4
+    assert_frame_equal(result, pd.DataFrame({"a": [4]}))
+
+    c.drop_table("other")
+    assert len(c.result_cache) == 1
+
+    # Non-deterministic queries are never cached
+    c.sql("SELECT RAND() AS r FROM df", return_futures=False)
+    assert len(c.result_cache) == 1
+
+
+def test_result_cache_with_client(client):
+    c = Context(result_cache_size=10 ** 6)
+    c.create_table("df", pd.DataFrame({"a": [1, 2, 3]}))
+
+    # The result stays lazy and is only cached, once it was persisted on the cluster
+    result = c.sql("SELECT a FROM df")
+    assert_frame_equal(result.compute(), pd.DataFrame({"a": [1, 2, 3]}))
+
+    start = time.time()
+    while not len(c.result_cache):
+        assert time.time() - start < 10
+        time.sleep(0.05)
+
+    c.sql("SELECT a FROM df")
+    assert c.result_cache.info().hits == 1
+
+
+def test_plan_cache_size():
+    c = Context(plan_cache_size=1)
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    c.sql("SELECT a FROM df")
+    c.sql("SELECT a + 1 FROM df")
+    c.sql("SELECT a FROM df")
+    assert c.plan_cache.info().hits == 0
+    assert len(c.plan_cache) == 1
+
+    c = Context(plan_cache_size=0)
+    c.create_table("df", data_frame)
+
+    c.sql("SELECT a FROM df")
+    c.sql("SELECT a FROM df")
+    assert c.plan_cache.info().hits == 0
+    assert len(c.plan_cache) == 0
+
+
+def test_incremental_schema_updates():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+    c.sql("SELECT a FROM df")
+
+    generator = c._generator
+    assert generator is not None
+
+    c.create_table("other_df", data_frame)
+    result = c.sql("SELECT a FROM other_df")
+    assert_frame_equal(result.compute(), data_frame.compute())
+
+    c.drop_table("other_df")
+    with pytest.raises(ParsingException):
+        c.sql("SELECT a FROM other_df")
+
+    c.register_function(lambda x: x + 1, "f", [("x", int)], int)
+    result = c.sql("SELECT f(a) AS a FROM df")
+    assert_frame_equal(result.compute(), data_frame.compute() + 1)
+
+    c.create_schema("other_schema")
+    c.create_table("df", data_frame, schema_name="other_schema")
+    result = c.sql("SELECT a FROM other_schema.df")
+    assert_frame_equal(result.compute(), data_frame.compute())
+
+    # The generator is re-used for all of these changes
+    assert c._generator is generator
+
+
+def test_prepare():
+    c = Context()
+
+    data_frame = dd.from_pandas(
+        pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]}), npartitions=1
+    )
+    c.create_table("df", data_frame)
+
+    statement = c.prepare("SELECT a, b FROM df WHERE a = ?")
+    result = statement.execute(2, return_futures=False)
+    assert_frame_equal(
+        result.reset_index(drop=True), pd.DataFrame({"a": [2], "b": ["y"]})
+    )
+
+    result = statement.execute(3, return_futures=False)
+    assert_frame_equal(
+        result.reset_index(drop=True), pd.DataFrame({"a": [3], "b": ["z"]})
+    )
+
+    with pytest.raises(ValueError):
+        statement.execute()
+
+    statement = c.prepare("SELECT a FROM df WHERE b = :b OR a > :a")
+    result = statement.execute(a=2, b="x", return_futures=False)
+    assert_frame_equal(result.reset_index(drop=True), pd.DataFrame({"a": [1, 3]}))
+
+    with pytest.raises(ValueError):
+        statement.execute(b="x")
+
+    with pytest.raises(ValueError):
+        c.prepare("SELECT a FROM df WHERE b = :b OR a > ?")
+
+
+def test_prepare_string_parameters():
+    c = Context()
+
+    data_frame = dd.from_pandas(
+        pd.DataFrame(
+            {"a": [1, 2, 3], "d": pd.to_datetime(["2021-01-01", "2021-01-02", None])}
+        ),
+        npartitions=1,
+    )
+    c.create_table("df", data_frame)
+
+    # Strings are converted into the type of the parameters
+    statement = c.prepare("SELECT a FROM df WHERE a = ?")
+    result = statement.execute("2", return_futures=False)
+    assert_frame_equal(result.reset_index(drop=True), pd.DataFrame({"a": [2]}))
+
+    statement = c.prepare("SELECT a FROM df WHERE d = ?")
+    result = statement.execute("2021-01-02 00:00:00", return_futures=False)
+    assert_frame_equal(result.reset_index(drop=True), pd.DataFrame({"a": [2]}))
+
+
+def test_table_statistics():
+    c = Context()
+
+    c.create_table("df", pd.DataFrame({"a": [1, 2, 3]}))
+    assert c.schema[c.schema_name].tables["df"].statistics.row_count == 3
+
+    statistics = Statistics(row_count=100, distinct_counts={"a": 10})
+    c.create_table(
+        "other_df",
+        dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1),
+        statistics=statistics,
+    )
+    assert c.schema[c.schema_name].tables["other_df"].statistics is statistics
+
+    java_table = c._prepare_table(
+        "other_df", c.schema[c.schema_name].tables["other_df"]
+    )
+    assert java_table.getRowCount() == 100
+    assert java_table.getDistinctCount(0) == 10
+    assert java_table.getNullFraction(0) is None
+
+
+def test_config_options():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    assert dask.config.get("sql.optimizer.reorder_joins") is False
+
+    c.sql("SELECT a FROM df")
+    c.sql("SELECT a FROM df", config_options={"sql.optimizer.reorder_joins": True})
+
+    # The optimizer options are part of the plan cache key
+    assert c.plan_cache.info().misses == 2
+    assert dask.config.get("sql.optimizer.reorder_joins") is False
+
+
+def test_plan_info():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+    c.create_table("df", data_frame)
+
+    rel, _, _ = c._get_ral("SELECT a + 1 AS b FROM df WHERE a > 1")
+    plan_info = get_plan_info(rel)
+
+    root_info = plan_info[int(rel.getId())]
+    assert root_info.class_name == "org.apache.calcite.rel.logical.LogicalProject"
+    assert root_info.row_type.field_names == ["b"]
+    assert root_info.deterministic
+
+    class_names = []
+    rel_ids = [int(rel.getId())]
+    while rel_ids:
+        rel_info = plan_info[rel_ids.pop()]
+        class_names.append(rel_info.class_name)
+        rel_ids.extend(rel_info.inputs)
+
+    assert class_names == [
+        "org.apache.calcite.rel.logical.LogicalProject",
+        "org.apache.calcite.rel.logical.LogicalFilter",
+        "org.apache.calcite.rel.logical.LogicalTableScan",
+    ]
+    assert is_deterministic(int(rel.getId()), plan_info)
+
+    # The rels themselves are exported in the same order, starting with the root
+    plan_rels = get_plan_rels(rel, plan_info)
+    assert list(plan_rels) == list(plan_info)
+    assert [int(plan_rel.getId()) for plan_rel in plan_rels.values()] == list(plan_info)
+    assert list(plan_rels)[0] == int(rel.getId())
@@ -1,4 +1,9 @@
-from dask_sql.datacontainer import ColumnContainer
+import dask.dataframe as dd
+import pandas as pd
+
+from dask_sql.datacontainer import ColumnContainer, DataContainer, Partitioning
+from dask_sql.physical.rel.base import BaseRelPlugin
+from dask_sql.physical.rel.plan import RowType
 
 
 def test_cc_init():
@@ -65,3 +70,39 @@ def test_cc_add():
     assert c2.mapping() == [("a", "b"), ("b", "b"), ("c", "c")]
     assert c.columns == ["a", "b", "c"]
     assert c.mapping() == [("a", "a"), ("b", "b"), ("c", "c")]
+
+
+def test_dc_get_divisions():
+    df = dd.from_pandas(pd.DataFrame({"a": range(10), "b": range(10)}), npartitions=2)
+    cc = ColumnContainer(df.columns)
+
+    assert DataContainer(df, cc).get_divisions("a") is None
+
+    dc = DataContainer(df, cc, partitioning=Partitioning("a", (0, 5, 9)))
+    assert dc.get_divisions("a") == (0, 5, 9)
+    assert dc.get_divisions("b") is None
+
+    # The number of partitions does not fit anymore
+    dc = DataContainer(df.head(3, compute=False), cc, partitioning=dc.partitioning)
+    assert dc.get_divisions("a") is None
+
+
+def test_dc_partitioning_after_cast():
+    df = dd.from_pandas(
+        pd.DataFrame({"a": ["01", "1", "2"], "b": range(3)}), npartitions=2
+    )
+    cc = ColumnContainer(df.columns)
+    dc = DataContainer(df, cc, partitioning=Partitioning("b", (0, 2, 2)))
+
+    # Unchanged partitioning column
+    fixed_dc = BaseRelPlugin.fix_dtype_to_row_type(
+        dc, RowType(["a", "b"], ["INTEGER", "BIGINT"])
+    )
+    assert fixed_dc.get_divisions("b") == (0, 2, 2)
+
+    # Casted partitioning column
+    dc = DataContainer(df, cc, partitioning=Partitioning("a", ("01", "1", "2")))
+    fixed_dc = BaseRelPlugin.fix_dtype_to_row_type(
+        dc, RowType(["a", "b"], ["INTEGER", "BIGINT"])
+    )
+    assert fixed_dc.partitioning is None
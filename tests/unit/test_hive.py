@@ -0,0 +1,103 @@
+import os
+
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+
+from dask_sql import Context
+from dask_sql.input_utils import HiveInputPlugin, TableSource
+
+
+class LocalHiveCursor:
+    """
+    Stand-in for a hive cursor, which answers the metadata queries
+    of the hive input plugin for a partitioned parquet table
+    stored in a local folder.
+    """
+
+    def __init__(self, location):
+        self.location = location
+        self.partitions = ["j=2", "j=4"]
+        self.executed = []
+
+    def execute(self, sql):
+        self.executed.append(sql)
+        self.result = []
+
+        if sql == "SHOW PARTITIONS df_part":
+            self.result = [(partition,) for partition in self.partitions]
+        elif sql == "DESCRIBE FORMATTED df_part":
+            self.result = [
+                ("# col_name", "data_type", "comment"),
+                ("i", "int", ""),
+                ("", None, None),
+                ("# Partition Information", None, None),
+                ("# col_name", "data_type", "comment"),
+                ("j", "int", ""),
+                ("", None, None),
+                ("# Detailed Table Information", None, None),
+                ("Location:", self.location, None),
+                ("", None, None),
+                ("# Storage Information", None, None),
+                (
+                    "InputFormat:",
+                    "org.apache.hadoop.hive.ql.io.parquet.MapredParquetInputFormat",
+                    None,
+                ),
+            ]
+        elif sql.startswith("DESCRIBE FORMATTED df_part PARTITION"):
+            partition = sql.split("(")[1].rstrip(")")
+            value = partition.split("=")[1]
+            self.result = [
+                ("# col_name", "data_type", "comment"),
+                ("i", "int", ""),
+                ("", None, None),
+                ("# Detailed Partition Information", None, None),
+                ("Partition Value:", f"[{value}]", None),
+                ("Location:", os.path.join(self.location, partition), None),
+            ]
+
+        return self
+
+    def fetchall(self):
+        return self.result
+
+
+@pytest.fixture()
+def hive_cursor(tmpdir):
+    for i, j in [(1, 2), (2, 4)]:
+        os.makedirs(os.path.join(tmpdir, f"j={j}"))
+        pd.DataFrame({"i": [i]}).astype("int32").to_parquet(
+            os.path.join(tmpdir, f"j={j}", "part.0.parquet"), index=False
+        )
+
+    return LocalHiveCursor(str(tmpdir))
+
+
+def test_hive_partitions_registered_lazily(hive_cursor):
+    source = HiveInputPlugin().to_dc(hive_cursor, "df_part", format="hive")
+
+    assert isinstance(source, TableSource)
+    assert list(source.meta.columns) == ["i", "j"]
+    assert not any("PARTITION (" in sql for sql in hive_cursor.executed)
+
+
+def test_hive_partition_pruning(hive_cursor):
+    c = Context()
+    c.create_table("df_part", hive_cursor, format="hive", persist=False)
+
+    assert not any("PARTITION (" in sql for sql in hive_cursor.executed)
+
+    result_df = c.sql("SELECT i, j FROM df_part WHERE j = 4").compute()
+
+    partition_descriptions = [
+        sql for sql in hive_cursor.executed if "PARTITION (" in sql
+    ]
+    assert partition_descriptions == ["DESCRIBE FORMATTED df_part PARTITION (j=4)"]
+    assert_frame_equal(
+        result_df.reset_index(drop=True),
+        pd.DataFrame({"i": [2], "j": [4]}).astype({"i": "int32"}),
+    )
+
+    result_df = c.sql("SELECT i FROM df_part WHERE j > 10").compute()
+    assert len(result_df) == 0
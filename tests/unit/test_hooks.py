@@ -0,0 +1,38 @@
+import dask.dataframe as dd
+import pandas as pd
+
+from dask_sql import Context
+from dask_sql.hooks import registered_hooks, use_hook
+
+
+def test_hooks():
+    c = Context()
+
+    data_frame = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=2)
+    c.create_table("df", data_frame)
+
+    events = []
+    with use_hook(events.append):
+        c.sql("SELECT a + 1 AS b FROM df")
+
+    assert registered_hooks == []
+
+    kinds = [event.kind for event in events]
+    assert "rel" in kinds
+    assert "rex" in kinds
+    assert kinds[-1] == "sql"
+
+    plugin_names = {event.plugin_name for event in events}
+    assert "LogicalProjectPlugin" in plugin_names
+    assert "LogicalTableScanPlugin" in plugin_names
+    assert "RexCallPlugin" in plugin_names
+
+    query_event = events[-1]
+    assert query_event.digest == "SELECT a + 1 AS b FROM df"
+    assert query_event.npartitions == 2
+    assert query_event.graph_layers > 0
+    assert all(event.duration >= 0 for event in events)
+
+    # Nothing is recorded without hooks
+    c.sql("SELECT a FROM df")
+    assert kinds == [event.kind for event in events]
@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+
+def test_import_does_not_start_jvm():
+    code = """
+import dask_sql
+import jpype
+from dask_sql.utils import make_pickable_without_dask_sql
+
+assert not jpype.isJVMStarted()
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_jvm_started_on_first_usage():
+    code = """
+import jpype
+from dask_sql.java import org
+
+assert not jpype.isJVMStarted()
+assert org.apache.calcite.rel.RelNode is not None
+assert jpype.isJVMStarted()
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
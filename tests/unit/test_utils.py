@@ -3,7 +3,15 @@ import pytest
 from dask import dataframe as dd
 
 from dask_sql.java import _set_or_check_java_home
-from dask_sql.utils import ParsingException, Pluggable, is_frame
+from dask_sql.utils import (
+    ParsingException,
+    Pluggable,
+    deterministic_temporary_columns,
+    is_frame,
+    new_temporary_column,
+    split_named_parameters,
+    split_sql_list,
+)
 
 
 def test_is_frame_for_frame():
@@ -107,3 +115,40 @@ def test_no_warning():
         _set_or_check_java_home()
 
     assert not warn
+
+
+def test_split_named_parameters():
+    sql, names = split_named_parameters(
+        "SELECT a FROM df WHERE a = :a AND b = ':b' AND c = :c -- :d\n AND d = :a"
+    )
+    assert (
+        sql == "SELECT a FROM df WHERE a = ? AND b = ':b' AND c = ? -- :d\n AND d = ?"
+    )
+    assert names == ["a", "c", "a"]
+
+    sql, names = split_named_parameters('SELECT ?, "a:b" FROM df WHERE a = ?')
+    assert sql == 'SELECT ?, "a:b" FROM df WHERE a = ?'
+    assert names == [None, None]
+
+
+def test_split_sql_list():
+    assert split_sql_list("1, 'a,b', f(2, 3)") == ["1", "'a,b'", "f(2, 3)"]
+    assert split_sql_list("") == []
+
+
+def test_deterministic_temporary_columns():
+    df = dd.from_pandas(pd.DataFrame({"a": [1, 2, 3]}), npartitions=1)
+
+    # Random names outside of the context
+    assert new_temporary_column(df) != new_temporary_column(df)
+
+    with deterministic_temporary_columns():
+        first_names = [new_temporary_column(df) for _ in range(3)]
+        other_name = new_temporary_column(df.assign(b=1))
+
+    with deterministic_temporary_columns():
+        second_names = [new_temporary_column(df) for _ in range(3)]
+
+    assert first_names == second_names
+    assert len(set(first_names)) == 3
+    assert other_name not in first_names